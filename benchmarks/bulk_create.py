@@ -0,0 +1,75 @@
+"""
+Compare creating tasks one by one with the bulk create path.
+
+Usage::
+
+    uv run python -m benchmarks.bulk_create --count 1000
+"""
+
+import argparse
+import asyncio
+import time
+
+from src.config import TaskStatus
+from src.db.database import database
+from src.schemas.task import TaskCreateSchema
+from src.services import TaskService
+from src.utils.transaction import TransactionManager
+
+
+def build_tasks(count: int) -> list[TaskCreateSchema]:
+    return [
+        TaskCreateSchema(
+            name=f"Benchmark task {number}",
+            description="Benchmark task description",
+            status=TaskStatus.CREATED,
+        )
+        for number in range(count)
+    ]
+
+
+async def create_one_by_one(tasks: list[TaskCreateSchema]) -> list:
+    created_ids = []
+    for task in tasks:
+        async with TransactionManager(
+            session_factory=database.session_factory,
+        ) as transaction:
+            created_task = await TaskService(transaction).create(task)
+            created_ids.append(created_task.id)
+    return created_ids
+
+
+async def create_bulk(tasks: list[TaskCreateSchema]) -> list:
+    async with TransactionManager(
+        session_factory=database.session_factory,
+    ) as transaction:
+        return await TaskService(transaction).create_bulk_ids(tasks)
+
+
+async def cleanup(created_ids: list) -> None:
+    async with TransactionManager(
+        session_factory=database.session_factory,
+    ) as transaction:
+        for task_id in created_ids:
+            await transaction.task.delete_one(id=task_id)
+        await transaction.commit()
+
+
+async def main(count: int) -> None:
+    tasks = build_tasks(count)
+    for title, create in (
+        ("single inserts", create_one_by_one),
+        ("bulk insert", create_bulk),
+    ):
+        started_at = time.perf_counter()
+        created_ids = await create(tasks)
+        elapsed = time.perf_counter() - started_at
+        print(f"{title:>15}: {elapsed:.3f} s, {count / elapsed:,.0f} tasks/s")
+        await cleanup(created_ids)
+    await database.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=1000)
+    asyncio.run(main(parser.parse_args().count))
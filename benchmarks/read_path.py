@@ -0,0 +1,85 @@
+"""
+Compare the ORM read path of ``BaseRepository.get_all``
+with the Core rows path at different page sizes.
+The database must contain at least as many tasks as the largest page.
+
+Usage::
+
+    uv run python -m benchmarks.read_path --sizes 100 10000
+"""
+
+import argparse
+import asyncio
+import time
+import tracemalloc
+
+from sqlalchemy import select
+
+from src.db.database import database
+from src.repositories import TaskRepository
+from src.utils.transaction import TransactionManager
+
+
+async def get_all_orm(repository: TaskRepository, limit: int) -> list:
+    query = repository._paginate(
+        select(repository.model),
+        where_shape=(),
+        sorting=repository.default_sorting,
+        with_cursor=False,
+    )
+    result = await repository.session.execute(
+        query,
+        repository._get_page_params(limit),
+    )
+    # fmt: off
+    return [
+        repository.mapper.map_to_domain_entity(model)
+        for model in result.scalars().all()
+    ]
+    # fmt: on
+
+
+async def get_all_core(repository: TaskRepository, limit: int) -> list:
+    return await repository.get_all(limit)
+
+
+async def measure(read, limit: int, iterations: int) -> tuple[float, float]:
+    cpu_time = 0.0
+    for _ in range(iterations):
+        async with TransactionManager(
+            session_factory=database.session_factory,
+        ) as transaction:
+            started_at = time.process_time()
+            tasks = await read(transaction.task, limit)
+            cpu_time += time.process_time() - started_at
+    assert len(tasks) == limit, "Not enough tasks in the database"
+
+    async with TransactionManager(
+        session_factory=database.session_factory,
+    ) as transaction:
+        tracemalloc.start()
+        await read(transaction.task, limit)
+        _, peak_memory = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return cpu_time / iterations, peak_memory
+
+
+async def main(sizes: list[int], iterations: int) -> None:
+    print("page size | path | CPU ms/page | us/row | peak KiB")
+    for limit in sizes:
+        for title, read in (("orm", get_all_orm), ("core", get_all_core)):
+            cpu_time, peak_memory = await measure(read, limit, iterations)
+            print(
+                f"{limit:>9} | {title:>4} | {cpu_time * 1000:11.2f} | "
+                f"{cpu_time / limit * 1_000_000:6.1f} | "
+                f"{peak_memory / 1024:8.0f}"
+            )
+    await database.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 10000])
+    parser.add_argument("--iterations", type=int, default=20)
+    arguments = parser.parse_args()
+    asyncio.run(main(arguments.sizes, arguments.iterations))
@@ -0,0 +1,149 @@
+"""
+Seed the database with generated tasks through ``COPY``,
+which loads millions of rows in seconds. Rows are generated
+in batches, so memory usage does not depend on the count.
+Task names and descriptions draw from a small vocabulary,
+so full-text search has matches of different selectivity.
+
+Usage::
+
+    uv run python -m benchmarks.seed --count 1000000 --truncate
+"""
+
+import argparse
+import asyncio
+import random
+import time
+from datetime import datetime
+from datetime import timedelta
+from datetime import timezone
+from typing import Iterator
+
+from src.config import TaskStatus
+from src.db.database import database
+
+
+COLUMNS = ("name", "description", "status", "created_at", "updated_at")
+
+WORDS = (
+    "report",
+    "deploy",
+    "review",
+    "invoice",
+    "meeting",
+    "release",
+    "backup",
+    "migration",
+    "design",
+    "budget",
+    "customer",
+    "security",
+    "onboarding",
+    "roadmap",
+    "database",
+    "payment",
+)
+
+# Share of tasks in each status
+STATUS_WEIGHTS = {
+    TaskStatus.CREATED: 0.5,
+    TaskStatus.IN_PROGRESS: 0.3,
+    TaskStatus.COMPLETED: 0.2,
+}
+
+# Creation times are spread over the year before the seeding
+PERIOD = timedelta(days=365)
+
+
+def generate_rows(
+    count: int,
+    seed: int,
+) -> Iterator[tuple]:
+    rng = random.Random(seed)
+    statuses = [status.name for status in STATUS_WEIGHTS]
+    weights = list(STATUS_WEIGHTS.values())
+    started_at = datetime.now(timezone.utc) - PERIOD
+    step = PERIOD / max(count, 1)
+    for number in range(count):
+        created_at = started_at + step * number
+        updated_at = created_at + timedelta(seconds=rng.randrange(86400))
+        words = rng.sample(WORDS, 6)
+        yield (
+            f"{words[0].capitalize()} {words[1]} {number}",
+            f"Prepare the {words[2]} {words[3]} and {words[4]} {words[5]}",
+            rng.choices(statuses, weights)[0],
+            created_at,
+            updated_at,
+        )
+
+
+def batched(
+    rows: Iterator[tuple],
+    size: int,
+) -> Iterator[list[tuple]]:
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+async def seed(
+    count: int,
+    batch_size: int = 100_000,
+    truncate: bool = False,
+    seed_value: int = 0,
+) -> None:
+    """
+    Load generated tasks and refresh the planner statistics.
+
+    :param count: The number of tasks to load.
+    :param batch_size: The number of rows per ``COPY``.
+    :param truncate: If True, delete all tasks before loading.
+    :param seed_value: Seed of the generated data.
+    """
+
+    async with database.engine.connect() as connection:
+        raw_connection = await connection.get_raw_connection()
+        driver_connection = raw_connection.driver_connection
+        async with driver_connection.transaction():
+            if truncate:
+                await driver_connection.execute("TRUNCATE tasks")
+            loaded = 0
+            for batch in batched(generate_rows(count, seed_value), batch_size):
+                await driver_connection.copy_records_to_table(
+                    "tasks",
+                    records=batch,
+                    columns=COLUMNS,
+                )
+                loaded += len(batch)
+                print(f"Loaded {loaded}/{count} tasks")
+        await driver_connection.execute("ANALYZE tasks")
+
+
+async def main(count: int, batch_size: int, truncate: bool, seed_value: int):
+    started_at = time.perf_counter()
+    await seed(count, batch_size, truncate, seed_value)
+    elapsed = time.perf_counter() - started_at
+    print(f"Seeded {count} tasks in {elapsed:.1f} s")
+    await database.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=10_000)
+    parser.add_argument("--batch-size", type=int, default=100_000)
+    parser.add_argument("--truncate", action="store_true")
+    parser.add_argument("--seed", type=int, default=0)
+    arguments = parser.parse_args()
+    asyncio.run(
+        main(
+            arguments.count,
+            arguments.batch_size,
+            arguments.truncate,
+            arguments.seed,
+        )
+    )
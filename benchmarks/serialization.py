@@ -0,0 +1,84 @@
+"""
+Compare the default FastAPI response pipeline (re-validation against
+``response_model`` and generic JSON encoding) with ``SchemaJSONResponse``
+for a page of tasks. Does not need a database.
+
+Usage::
+
+    uv run python -m benchmarks.serialization --rows 100
+"""
+
+import argparse
+import asyncio
+import time
+import uuid
+from datetime import datetime
+from datetime import timezone
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+
+from src.api.responses import SchemaJSONResponse
+from src.api.responses import task_list_adapter
+from src.config import TaskStatus
+from src.schemas.task import TaskSchema
+
+
+def build_tasks(rows: int) -> list[TaskSchema]:
+    now = datetime.now(timezone.utc)
+    return [
+        TaskSchema(
+            id=uuid.uuid4(),
+            name=f"Task {number}",
+            description=f"Task {number} description",
+            status=TaskStatus.IN_PROGRESS,
+            created_at=now,
+            updated_at=now,
+        )
+        for number in range(rows)
+    ]
+
+
+async def main(rows: int, iterations: int) -> None:
+    tasks = build_tasks(rows)
+    response_field = create_model_field(
+        name="Response",
+        type_=list[TaskSchema],
+        mode="serialization",
+    )
+
+    async def default_pipeline() -> bytes:
+        content = await serialize_response(
+            field=response_field,
+            response_content=tasks,
+            is_coroutine=True,
+        )
+        return JSONResponse(content).body
+
+    async def schema_response() -> bytes:
+        return SchemaJSONResponse(tasks, adapter=task_list_adapter).body
+
+    print(f"{rows} rows, {iterations} iterations, CPU us/response")
+    results = {}
+    for title, encode in (
+        ("default", default_pipeline),
+        ("schema", schema_response),
+    ):
+        started_at = time.process_time()
+        for _ in range(iterations):
+            await encode()
+        results[title] = (
+            (time.process_time() - started_at) / iterations * 1_000_000
+        )
+        print(f"{title:>8}: {results[title]:8.1f}")
+    saved = results["default"] - results["schema"]
+    print(f"   saved: {saved:8.1f} ({saved / results['default']:.0%})")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=100)
+    parser.add_argument("--iterations", type=int, default=2000)
+    arguments = parser.parse_args()
+    asyncio.run(main(arguments.rows, arguments.iterations))
@@ -0,0 +1,146 @@
+"""
+Measure the startup of a worker: the import time of ``src.main``,
+the lifespan startup and the latency of the first requests,
+with and without the pool warm-up. Each run is a fresh interpreter,
+so nothing is cached between runs. The first requests are a single
+``GET /tasks/{id}`` and then a burst of concurrent ``GET /tasks``,
+which needs as many connections as there are requests.
+
+Usage::
+
+    uv run python -m benchmarks.startup --runs 5 --warmup-connections 5
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+
+def run_child(
+    task_id: str,
+    burst: int,
+) -> None:
+    started_at = time.perf_counter()
+    from src.main import app
+
+    import_time = time.perf_counter() - started_at
+
+    async def measure() -> dict[str, float]:
+        from httpx import ASGITransport
+        from httpx import AsyncClient
+
+        started_at = time.perf_counter()
+        async with app.router.lifespan_context(app):
+            startup_time = time.perf_counter() - started_at
+            async with AsyncClient(
+                transport=ASGITransport(app=app),
+                base_url="http://benchmark",
+            ) as client:
+
+                async def get(url: str) -> float:
+                    started_at = time.perf_counter()
+                    response = await client.get(url)
+                    response.raise_for_status()
+                    return time.perf_counter() - started_at
+
+                first_request = await get(f"/tasks/{task_id}")
+                second_request = await get(f"/tasks/{task_id}")
+                first_burst = await asyncio.gather(
+                    *(get("/tasks") for _ in range(burst))
+                )
+                second_burst = await asyncio.gather(
+                    *(get("/tasks") for _ in range(burst))
+                )
+        return {
+            "import": import_time,
+            "startup": startup_time,
+            "first_request": first_request,
+            "second_request": second_request,
+            "first_burst": max(first_burst),
+            "second_burst": max(second_burst),
+        }
+
+    print(json.dumps(asyncio.run(measure())))
+
+
+async def get_task_id() -> str:
+    from src.db.database import database
+    from src.repositories import TaskRepository
+
+    async with database.session_factory() as session:
+        tasks = await TaskRepository(session).get_all(limit=1)
+    await database.dispose()
+    return str(tasks[0].id)
+
+
+def measure_runs(
+    arguments: argparse.Namespace,
+    task_id: str,
+    warmup_connections: int,
+) -> dict[str, float]:
+    results = []
+    for _ in range(arguments.runs):
+        output = subprocess.run(
+            [
+                sys.executable,
+                "-m",
+                "benchmarks.startup",
+                "--child",
+                task_id,
+                "--burst",
+                str(arguments.burst),
+            ],
+            env=os.environ
+            | {"DB_WARMUP_CONNECTIONS": str(warmup_connections)},
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        results.append(json.loads(output.splitlines()[-1]))
+    return {
+        metric: statistics.median(result[metric] for result in results)
+        for metric in results[0]
+    }
+
+
+def main(arguments: argparse.Namespace) -> None:
+    task_id = asyncio.run(get_task_id())
+    print(
+        f"Medians of {arguments.runs} runs in ms, "
+        f"bursts of {arguments.burst} concurrent requests"
+    )
+    print(
+        "warm-up | import | startup | 1st GET | 2nd GET "
+        "| 1st burst | 2nd burst"
+    )
+    for connections in (0, arguments.warmup_connections):
+        medians = measure_runs(arguments, task_id, connections)
+        print(
+            f"{connections:7} | {medians['import'] * 1000:6.0f} "
+            f"| {medians['startup'] * 1000:7.1f} "
+            f"| {medians['first_request'] * 1000:7.1f} "
+            f"| {medians['second_request'] * 1000:7.1f} "
+            f"| {medians['first_burst'] * 1000:9.1f} "
+            f"| {medians['second_burst'] * 1000:9.1f}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--burst", type=int, default=5)
+    parser.add_argument("--warmup-connections", type=int, default=5)
+    parser.add_argument("--child", metavar="TASK_ID")
+    arguments = parser.parse_args()
+    if arguments.child is not None:
+        run_child(arguments.child, arguments.burst)
+    else:
+        main(arguments)
@@ -0,0 +1,97 @@
+"""
+Measure the Python overhead of repository queries with statements
+rebuilt on every call and with statements from the statement cache.
+Clearing the cache before each call reproduces rebuilding:
+the statement is constructed and cache-keyed by SQLAlchemy again.
+Writes are rolled back. The database must contain at least one task.
+
+Usage::
+
+    uv run python -m benchmarks.statement_cache --iterations 2000
+"""
+
+import argparse
+import asyncio
+import time
+
+from src.config import TaskStatus
+from src.db.database import database
+from src.repositories import TaskRepository
+from src.schemas.task import TaskFilterSchema
+from src.schemas.task import TaskUpdateSchema
+from src.utils.cache import statement_cache
+from src.utils.transaction import TransactionManager
+
+
+def get_operations(repository: TaskRepository, task_id) -> dict:
+    filters = TaskFilterSchema(status=[TaskStatus.CREATED])
+    data = TaskUpdateSchema(name="Benchmark")
+    return {
+        "get_one_or_none": lambda: repository.get_one_or_none(id=task_id),
+        "get_version": lambda: repository.get_version(id=task_id),
+        "get_all": lambda: repository.get_all(20),
+        "get_all filtered": lambda: repository.get_all(20, filters=filters),
+        "update_one": lambda: repository.update_one(
+            data,
+            partially=True,
+            id=task_id,
+        ),
+        "delete_one": lambda: repository.delete_one(id=task_id),
+    }
+
+
+async def measure(operation, iterations: int, cached: bool) -> float:
+    await operation()
+    cpu_time = 0.0
+    for _ in range(iterations):
+        if not cached:
+            statement_cache.clear()
+        started_at = time.process_time()
+        await operation()
+        cpu_time += time.process_time() - started_at
+    return cpu_time / iterations
+
+
+async def measure_delete(transaction, operation, cached: bool) -> float:
+    iterations = 200
+    cpu_time = 0.0
+    for _ in range(iterations):
+        if not cached:
+            statement_cache.clear()
+        savepoint = await transaction.session.begin_nested()
+        started_at = time.process_time()
+        await operation()
+        cpu_time += time.process_time() - started_at
+        await savepoint.rollback()
+    return cpu_time / iterations
+
+
+async def main(iterations: int) -> None:
+    # The transaction is never committed, so all writes are discarded.
+    print("operation        | rebuilt us | cached us | saved us")
+    async with TransactionManager(
+        session_factory=database.session_factory,
+    ) as transaction:
+        task_id = (await transaction.task.get_all(1))[0].id
+        operations = get_operations(transaction.task, task_id)
+        for title, operation in operations.items():
+            if title == "delete_one":
+                # A deleted row can be deleted again only
+                # after a rollback, so each call is measured once.
+                rebuilt = await measure_delete(transaction, operation, False)
+                cached = await measure_delete(transaction, operation, True)
+            else:
+                rebuilt = await measure(operation, iterations, cached=False)
+                cached = await measure(operation, iterations, cached=True)
+            print(
+                f"{title:<16} | {rebuilt * 1e6:10.1f} | "
+                f"{cached * 1e6:9.1f} | {(rebuilt - cached) * 1e6:8.1f}"
+            )
+    await database.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=2000)
+    arguments = parser.parse_args()
+    asyncio.run(main(arguments.iterations))
@@ -0,0 +1,368 @@
+"""
+Measure latency and throughput of the repository, service
+and HTTP layers against the configured database and compare
+the results with a stored baseline.
+
+Seed the database first, e.g. ``python -m benchmarks.seed``.
+With ``DB_BACKEND=memory`` the in-memory store is seeded with
+``--memory-count`` generated tasks instead, so the numbers show
+the overhead of the application code without database I/O.
+HTTP requests go through the in-process ASGI transport,
+so the numbers include routing, validation and serialization,
+but no network. Writes only rename tasks to their current names.
+
+Usage::
+
+    uv run python -m benchmarks.suite
+    uv run python -m benchmarks.suite --layers http --iterations 500
+    uv run python -m benchmarks.suite --save-baseline
+    DB_BACKEND=memory uv run python -m benchmarks.suite --layers http
+
+A case regresses when its p50 or p95 latency exceeds the baseline
+by more than ``--threshold``. The exit code is 1 if any case regresses.
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+import uuid
+from dataclasses import asdict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Awaitable
+from typing import Callable
+
+from httpx import ASGITransport
+from httpx import AsyncClient
+
+from benchmarks.seed import COLUMNS
+from benchmarks.seed import generate_rows
+from src.config import TaskStatus
+from src.config import settings
+from src.db.database import database
+from src.main import app
+from src.repositories.memory import memory_store
+from src.schemas.pagination import PaginationSchema
+from src.schemas.pagination import TotalMode
+from src.schemas.sorting import SortingSchema
+from src.schemas.task import TaskFilterSchema
+from src.schemas.task import TaskSchema
+from src.schemas.task import TaskUpdateSchema
+from src.services import TaskService
+from src.utils.transaction import BaseManager
+from src.utils.transaction import InMemoryTransactionManager
+from src.utils.transaction import TransactionManager
+
+
+BASELINE_PATH = Path(__file__).with_name("baseline.json")
+
+LAYERS = ("repository", "service", "http")
+
+Operation = Callable[[], Awaitable[object]]
+
+
+@dataclass
+class Case:
+    layer: str
+    name: str
+    operation: Operation
+
+
+@dataclass
+class Result:
+    layer: str
+    name: str
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    ops_per_second: float
+
+    @property
+    def key(self) -> str:
+        return f"{self.layer}:{self.name}"
+
+
+def create_transaction() -> BaseManager:
+    if settings.app.db_backend == "memory":
+        return InMemoryTransactionManager(store=memory_store)
+    return TransactionManager(session_factory=database.session_factory)
+
+
+def in_transaction(
+    run: Callable[[BaseManager], Awaitable[object]],
+) -> Operation:
+    async def operation() -> object:
+        async with create_transaction() as transaction:
+            return await run(transaction)
+
+    return operation
+
+
+def get_repository_cases(task: TaskSchema) -> list[Case]:
+    filters = TaskFilterSchema(status=[TaskStatus.COMPLETED])
+    return [
+        Case(
+            "repository",
+            "get_one_or_none",
+            in_transaction(lambda db: db.task.get_one_or_none(id=task.id)),
+        ),
+        Case(
+            "repository",
+            "get_all",
+            in_transaction(lambda db: db.task.get_all(20)),
+        ),
+        Case(
+            "repository",
+            "get_all deep offset",
+            in_transaction(lambda db: db.task.get_all(20, offset=5000)),
+        ),
+        Case(
+            "repository",
+            "get_all filtered",
+            in_transaction(lambda db: db.task.get_all(20, filters=filters)),
+        ),
+        Case(
+            "repository",
+            "estimate_count filtered",
+            in_transaction(lambda db: db.task.estimate_count(filters)),
+        ),
+        Case(
+            "repository",
+            "search",
+            in_transaction(lambda db: db.task.search("report deploy", 20)),
+        ),
+    ]
+
+
+def get_service_cases(task: TaskSchema) -> list[Case]:
+    pagination = PaginationSchema(limit=20, offset=0)
+    filters = TaskFilterSchema(status=[TaskStatus.CREATED])
+    sorting = SortingSchema(field="updated_at", descending=True)
+    data = TaskUpdateSchema(name=task.name)
+    return [
+        Case(
+            "service",
+            "get_one",
+            in_transaction(lambda db: TaskService(db).get_one(id=task.id)),
+        ),
+        Case(
+            "service",
+            "get_page",
+            in_transaction(
+                lambda db: TaskService(db).get_page(
+                    pagination,
+                    filters,
+                    sorting,
+                    TotalMode.ESTIMATED,
+                )
+            ),
+        ),
+        Case(
+            "service",
+            "get_stats",
+            in_transaction(lambda db: TaskService(db).get_stats()),
+        ),
+        Case(
+            "service",
+            "update_one",
+            in_transaction(
+                lambda db: TaskService(db).update_one(task.id, data)
+            ),
+        ),
+    ]
+
+
+def get_http_cases(client: AsyncClient, task: TaskSchema) -> list[Case]:
+    def get(url: str, **params) -> Operation:
+        async def operation() -> object:
+            response = await client.get(url, params=params)
+            response.raise_for_status()
+            return response
+
+        return operation
+
+    async def patch() -> object:
+        response = await client.patch(
+            f"/tasks/{task.id}",
+            json={"name": task.name},
+        )
+        response.raise_for_status()
+        return response
+
+    return [
+        Case("http", "GET /tasks/{id}", get(f"/tasks/{task.id}")),
+        Case("http", "GET /tasks", get("/tasks", per_page=20)),
+        Case(
+            "http",
+            "GET /tasks filtered desc",
+            get(
+                "/tasks",
+                per_page=20,
+                status=TaskStatus.IN_PROGRESS.value,
+                sort_by="updated_at",
+                order="desc",
+            ),
+        ),
+        Case(
+            "http",
+            "GET /tasks envelope",
+            get("/tasks", per_page=20, envelope=True, total="estimated"),
+        ),
+        Case("http", "GET /tasks/search", get("/tasks/search", q="review")),
+        Case("http", "GET /tasks/stats", get("/tasks/stats")),
+        Case("http", "PATCH /tasks/{id}", patch),
+    ]
+
+
+async def measure(
+    case: Case,
+    iterations: int,
+    warmup: int,
+) -> Result:
+    for _ in range(warmup):
+        await case.operation()
+    latencies = []
+    started_at = time.perf_counter()
+    for _ in range(iterations):
+        operation_started_at = time.perf_counter()
+        await case.operation()
+        latencies.append(time.perf_counter() - operation_started_at)
+    elapsed = time.perf_counter() - started_at
+    percentiles = statistics.quantiles(latencies, n=100)
+    return Result(
+        layer=case.layer,
+        name=case.name,
+        p50_ms=percentiles[49] * 1000,
+        p95_ms=percentiles[94] * 1000,
+        p99_ms=percentiles[98] * 1000,
+        ops_per_second=iterations / elapsed,
+    )
+
+
+def find_regressions(
+    result: Result,
+    baseline: dict | None,
+    threshold: float,
+) -> list[str]:
+    if baseline is None:
+        return []
+    return [
+        f"{metric} +{(getattr(result, metric) / baseline[metric] - 1):.0%}"
+        for metric in ("p50_ms", "p95_ms")
+        if getattr(result, metric) > baseline[metric] * (1 + threshold)
+    ]
+
+
+def seed_memory_store(count: int) -> None:
+    for values in generate_rows(count, seed=0):
+        row = dict(zip(COLUMNS, values))
+        row["id"] = uuid.uuid4()
+        row["status"] = TaskStatus[row["status"]]
+        # The database sets the initial version by the column default
+        row["version"] = 1
+        memory_store.put(row)
+
+
+async def get_dataset() -> tuple[TaskSchema, int]:
+    async with create_transaction() as transaction:
+        tasks = await transaction.task.get_all(1)
+        if not tasks:
+            raise SystemExit("The database is empty, run benchmarks.seed")
+        return tasks[0], await transaction.task.count()
+
+
+async def main(arguments: argparse.Namespace) -> int:
+    if settings.app.db_backend == "memory":
+        seed_memory_store(arguments.memory_count)
+    task, dataset_size = await get_dataset()
+    baseline = None
+    if not arguments.save_baseline and arguments.baseline.exists():
+        baseline = json.loads(arguments.baseline.read_text())
+        if baseline["dataset_size"] != dataset_size:
+            print(
+                f"Warning: the baseline was measured with "
+                f"{baseline['dataset_size']} tasks, "
+                f"the database has {dataset_size}"
+            )
+
+    async with AsyncClient(
+        transport=ASGITransport(app=app),
+        base_url="http://benchmark",
+    ) as client:
+        cases = {
+            "repository": get_repository_cases(task),
+            "service": get_service_cases(task),
+            "http": get_http_cases(client, task),
+        }
+        print(
+            f"{'case':<40} | {'p50 ms':>8} | {'p95 ms':>8} | "
+            f"{'p99 ms':>8} | {'ops/s':>8} | regression"
+        )
+        results = []
+        regressed = False
+        for layer in arguments.layers:
+            for case in cases[layer]:
+                result = await measure(
+                    case,
+                    arguments.iterations,
+                    arguments.warmup,
+                )
+                results.append(result)
+                regressions = find_regressions(
+                    result,
+                    (baseline or {}).get("results", {}).get(result.key),
+                    arguments.threshold,
+                )
+                regressed = regressed or bool(regressions)
+                print(
+                    f"{result.key:<40} | {result.p50_ms:8.2f} | "
+                    f"{result.p95_ms:8.2f} | {result.p99_ms:8.2f} | "
+                    f"{result.ops_per_second:8.0f} | "
+                    f"{', '.join(regressions)}"
+                )
+    await database.dispose()
+
+    if arguments.save_baseline:
+        arguments.baseline.write_text(
+            json.dumps(
+                {
+                    "dataset_size": dataset_size,
+                    "iterations": arguments.iterations,
+                    "results": {
+                        result.key: {
+                            metric: round(value, 3)
+                            if isinstance(value, float)
+                            else value
+                            for metric, value in asdict(result).items()
+                        }
+                        for result in results
+                    },
+                },
+                indent=2,
+            )
+            + "\n"
+        )
+        print(f"Saved the baseline to {arguments.baseline}")
+    return int(regressed)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument(
+        "--layers",
+        nargs="+",
+        choices=LAYERS,
+        default=list(LAYERS),
+    )
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--warmup", type=int, default=20)
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument("--threshold", type=float, default=0.2)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--memory-count", type=int, default=10_000)
+    raise SystemExit(asyncio.run(main(parser.parse_args())))
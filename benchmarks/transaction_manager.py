@@ -0,0 +1,116 @@
+"""
+Measure the per-request overhead of TransactionManager
+against the previous eager implementation, which created the session
+on enter and always called rollback() and close() on exit.
+
+Usage::
+
+    uv run python -m benchmarks.transaction_manager --requests 2000
+"""
+
+import argparse
+import asyncio
+import time
+
+from src.config import TaskStatus
+from src.db.database import database
+from src.repositories import TaskRepository
+from src.schemas.task import TaskCreateSchema
+from src.schemas.task import TaskUpdateSchema
+from src.utils.transaction import TransactionManager
+
+
+class EagerTransactionManager(TransactionManager):
+    async def __aenter__(self):
+        self._session = self.session_factory()
+        self._task = TaskRepository(self._session)
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.session.rollback()
+        await self.session.close()
+
+
+async def no_query(transaction: TransactionManager, task_id) -> None:
+    pass
+
+
+async def read(transaction: TransactionManager, task_id) -> None:
+    await transaction.task.get_one(id=task_id)
+
+
+async def write(transaction: TransactionManager, task_id) -> None:
+    await transaction.task.update_one(
+        TaskUpdateSchema(name="Benchmark task"),
+        partially=True,
+        id=task_id,
+    )
+    await transaction.commit()
+
+
+async def run(
+    manager_class: type[TransactionManager],
+    scenario,
+    task_id,
+    requests: int,
+    concurrency: int,
+) -> float:
+    async def worker(count: int) -> None:
+        for _ in range(count):
+            async with manager_class(
+                session_factory=database.session_factory,
+            ) as transaction:
+                await scenario(transaction, task_id)
+
+    started_at = time.perf_counter()
+    await asyncio.gather(
+        *(worker(requests // concurrency) for _ in range(concurrency))
+    )
+    return time.perf_counter() - started_at
+
+
+async def main(requests: int, concurrency: int) -> None:
+    async with TransactionManager(
+        session_factory=database.session_factory,
+    ) as transaction:
+        task = await transaction.task.add(
+            TaskCreateSchema(
+                name="Benchmark task",
+                description="",
+                status=TaskStatus.CREATED,
+            )
+        )
+        await transaction.commit()
+
+    print(f"{requests} requests, concurrency {concurrency}, us/request")
+    for scenario in (no_query, read, write):
+        results = []
+        for manager_class in (EagerTransactionManager, TransactionManager):
+            elapsed = await run(
+                manager_class,
+                scenario,
+                task.id,
+                requests,
+                concurrency,
+            )
+            results.append(elapsed / requests * 1_000_000)
+        eager, lazy = results
+        print(
+            f"{scenario.__name__:>8}: eager {eager:8.1f}, "
+            f"lazy {lazy:8.1f} ({(eager - lazy) / eager:+.0%})"
+        )
+
+    async with TransactionManager(
+        session_factory=database.session_factory,
+    ) as transaction:
+        await transaction.task.delete_one(id=task.id)
+        await transaction.commit()
+    await database.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=20)
+    arguments = parser.parse_args()
+    asyncio.run(main(arguments.requests, arguments.concurrency))
@@ -0,0 +1,114 @@
+"""
+Measure the throughput of ``POST /tasks`` under many concurrent
+clients with and without write batching. Requests go through
+the in-process ASGI transport and the configured connection pool.
+The created tasks are not deleted, so use a scratch database.
+
+Usage::
+
+    uv run python -m benchmarks.write_batching --clients 500 --requests 4
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from httpx import ASGITransport
+from httpx import AsyncClient
+
+from src.config import TaskStatus
+from src.config import settings
+from src.db.database import database
+from src.main import app
+from src.services import TaskService
+from src.services.task import create_tasks_batch
+from src.utils.batching import WriteBatcher
+
+
+async def run_client(
+    client: AsyncClient,
+    number: int,
+    requests: int,
+    latencies: list[float],
+) -> None:
+    for request in range(requests):
+        started_at = time.perf_counter()
+        response = await client.post(
+            "/tasks",
+            json={
+                "name": f"Client {number} task {request}",
+                "description": "",
+                "status": TaskStatus.CREATED.value,
+            },
+        )
+        latencies.append(time.perf_counter() - started_at)
+        response.raise_for_status()
+
+
+async def measure(
+    clients: int,
+    requests: int,
+) -> tuple[float, float, float]:
+    latencies: list[float] = []
+    async with AsyncClient(
+        transport=ASGITransport(app=app),
+        base_url="http://benchmark",
+    ) as client:
+        started_at = time.perf_counter()
+        await asyncio.gather(
+            *(
+                run_client(client, number, requests, latencies)
+                for number in range(clients)
+            )
+        )
+        elapsed = time.perf_counter() - started_at
+    percentiles = statistics.quantiles(latencies, n=100)
+    return len(latencies) / elapsed, percentiles[49], percentiles[98]
+
+
+async def main(arguments: argparse.Namespace) -> None:
+    batchers = {
+        "unbatched": None,
+        "batched": WriteBatcher(
+            create_tasks_batch,
+            window=arguments.window_ms / 1000,
+            max_size=arguments.max_size,
+        ),
+    }
+    print(
+        f"{arguments.clients} clients, {arguments.requests} requests each, "
+        f"pool size {settings.db.pool_size}+{settings.db.max_overflow}"
+    )
+    print("mode      | tasks/s | p50 ms | p99 ms")
+    for title, batcher in batchers.items():
+        TaskService.create_batcher = batcher
+        throughput, p50, p99 = await measure(
+            arguments.clients,
+            arguments.requests,
+        )
+        print(
+            f"{title:<9} | {throughput:7.0f} | "
+            f"{p50 * 1000:6.1f} | {p99 * 1000:6.1f}"
+        )
+    await database.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("--clients", type=int, default=500)
+    parser.add_argument("--requests", type=int, default=4)
+    parser.add_argument(
+        "--window-ms",
+        type=float,
+        default=settings.write_batch.window_ms,
+    )
+    parser.add_argument(
+        "--max-size",
+        type=int,
+        default=settings.write_batch.max_size,
+    )
+    asyncio.run(main(parser.parse_args()))
@@ -1,9 +1,17 @@
 from fastapi import APIRouter
 
+from src.api.archive import router as archive_router
+from src.api.internal import router as internal_router
+from src.api.metrics import router as metrics_router
 from src.api.task import router as task_router
 
 
-routers = (task_router,)
+routers = (
+    task_router,
+    archive_router,
+    internal_router,
+    metrics_router,
+)
 
 
 main_router = APIRouter()
@@ -0,0 +1,102 @@
+import uuid
+
+from fastapi import APIRouter
+from fastapi import Response
+from fastapi import status
+
+from src.api.dependencies import DbTransactionDep
+from src.api.dependencies.pagination import PaginationDep
+from src.api.dependencies.task import TaskFilterDep
+from src.api.dependencies.task import TaskSortingDep
+from src.api.responses import SchemaJSONResponse
+from src.api.responses import archived_task_adapter
+from src.api.responses import archived_task_list_adapter
+from src.api.task import NEXT_CURSOR_HEADER
+from src.exceptions.api.pagination import (
+    PaginationCursorSortingMismatchHTTPException,
+)
+from src.exceptions.api.task import ArchivedTaskDoesNotExistsHTTPException
+from src.exceptions.service.task import (
+    ArchivedTaskDoesNotExistsServiceException,
+)
+from src.schemas.base.schemas import BaseHTTPExceptionSchema
+from src.schemas.pagination import CursorSchema
+from src.schemas.task import ArchivedTaskSchema
+from src.services import ArchivedTaskService
+
+
+router = APIRouter(
+    prefix="/archive/tasks",
+    tags=["Archive"],
+)
+
+
+@router.get(
+    "",
+    response_model=list[ArchivedTaskSchema],
+    status_code=status.HTTP_200_OK,
+    summary="Get archived tasks",
+    description=(
+        "Get archived tasks matching the filters, sorted by `sort_by` "
+        "(ties broken by ID) with pagination. Completed tasks are "
+        "archived some time after their completion. The archive is "
+        "partitioned by the month of `updated_at`, so filtering by it "
+        "reads only the matching months. "
+        f"If the page is full, the `{NEXT_CURSOR_HEADER}` header "
+        "contains a cursor for fetching the next page "
+        "with the same sorting."
+    ),
+)
+async def get_archived_tasks(
+    transaction: DbTransactionDep,
+    pagination: PaginationDep,
+    filters: TaskFilterDep,
+    sorting: TaskSortingDep,
+) -> Response:
+    if pagination.cursor is not None and not pagination.cursor.matches(
+        sorting,
+    ):
+        raise PaginationCursorSortingMismatchHTTPException
+    tasks = await ArchivedTaskService(transaction).get_all(
+        pagination=pagination,
+        filters=filters,
+        sorting=sorting,
+    )
+    headers = {}
+    if len(tasks) == pagination.limit:
+        headers[NEXT_CURSOR_HEADER] = CursorSchema.after(
+            tasks[-1],
+            sorting,
+        ).encode()
+    return SchemaJSONResponse(
+        tasks,
+        adapter=archived_task_list_adapter,
+        headers=headers,
+    )
+
+
+@router.get(
+    "/{task_id}",
+    response_model=ArchivedTaskSchema,
+    status_code=status.HTTP_200_OK,
+    responses={
+        ArchivedTaskDoesNotExistsHTTPException.status_code: {
+            "model": BaseHTTPExceptionSchema,
+            "description": ArchivedTaskDoesNotExistsHTTPException.detail,
+        },
+    },
+    summary="Get one archived task",
+    description="Get one archived task by ID",
+)
+async def get_archived_task(
+    task_id: uuid.UUID,
+    transaction: DbTransactionDep,
+) -> Response:
+    try:
+        task = await ArchivedTaskService(transaction).get_one(task_id)
+    except ArchivedTaskDoesNotExistsServiceException as ex:
+        raise ArchivedTaskDoesNotExistsHTTPException from ex
+    return SchemaJSONResponse(
+        task,
+        adapter=archived_task_adapter,
+    )
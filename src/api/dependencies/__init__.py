@@ -1,4 +1,12 @@
 from src.api.dependencies.db import DbTransactionDep
+from src.api.dependencies.db import ReplicaSessionFactoryDep
+from src.api.dependencies.db import SessionFactoryDep
+from src.api.dependencies.db import TransactionFactoryDep
 
 
-__all__ = ("DbTransactionDep",)
+__all__ = (
+    "DbTransactionDep",
+    "ReplicaSessionFactoryDep",
+    "SessionFactoryDep",
+    "TransactionFactoryDep",
+)
@@ -1,27 +1,137 @@
+from functools import partial
 from typing import Annotated
+from typing import Callable
 
 from fastapi import Depends
+from fastapi import Request
+from fastapi import Response
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import async_sessionmaker
 
-from src.db.database import async_session
+from src.config import settings
+from src.db.database import database
+from src.repositories.memory import memory_store
+from src.utils.transaction import BaseManager
+from src.utils.transaction import InMemoryTransactionManager
 from src.utils.transaction import TransactionManager
 
 
-async def get_db_transaction():
+PRIMARY_PIN_COOKIE = "db_primary_pin"
+
+
+def get_session_factory() -> async_sessionmaker[AsyncSession]:
+    """
+    Provides the database session factory as a FastAPI dependency.
+    Handlers that keep working with the database after the
+    dependencies are closed (e.g. streaming responses)
+    open their own transactions with it.
+
+    :return: The session factory bound to the application engine.
+    """
+
+    return database.session_factory
+
+
+SessionFactoryDep = Annotated[
+    async_sessionmaker[AsyncSession],
+    Depends(get_session_factory),
+]
+
+
+def get_replica_session_factory(
+    request: Request,
+) -> async_sessionmaker[AsyncSession] | None:
+    """
+    Provides the session factory of a read replica as a FastAPI dependency.
+    Clients that have written recently are pinned to the primary
+    with a cookie, so they always read their own writes.
+
+    :param request: The current request.
+    :return: The replica session factory or None to read from the primary.
+    """
+
+    if PRIMARY_PIN_COOKIE in request.cookies:
+        return None
+    return database.replica_set.choose()
+
+
+ReplicaSessionFactoryDep = Annotated[
+    async_sessionmaker[AsyncSession] | None,
+    Depends(get_replica_session_factory),
+]
+
+
+def pin_to_primary(response: Response) -> None:
+    """
+    Route reads of the client to the primary for
+    ``read_your_writes_seconds`` after a write.
+
+    :param response: The response to set the pinning cookie on.
+    """
+
+    response.set_cookie(
+        PRIMARY_PIN_COOKIE,
+        "1",
+        max_age=settings.db.read_your_writes_seconds,
+        httponly=True,
+    )
+
+
+def get_transaction_factory(
+    session_factory: SessionFactoryDep,
+    replica_session_factory: ReplicaSessionFactoryDep,
+) -> Callable[..., BaseManager]:
+    """
+    Provides the factory of transaction managers of the configured
+    backend as a FastAPI dependency.
+
+    :param session_factory: The factory used to create sessions.
+    :param replica_session_factory: The factory used to create sessions
+                                    for read-only queries.
+    :return: A factory that accepts the ``on_commit`` callback.
+    """
+
+    if settings.app.db_backend == "memory":
+        return partial(InMemoryTransactionManager, store=memory_store)
+    return partial(
+        TransactionManager,
+        session_factory=session_factory,
+        replica_session_factory=replica_session_factory,
+    )
+
+
+TransactionFactoryDep = Annotated[
+    Callable[..., BaseManager],
+    Depends(get_transaction_factory),
+]
+
+
+async def get_db_transaction(
+    transaction_factory: TransactionFactoryDep,
+    response: Response,
+):
     """
     Provides a transactional database session as a FastAPI dependency.
     This function is a generator that creates and manages a database
     transaction.
 
+    :param transaction_factory: The factory used to create the manager.
+    :param response: The response to set the pinning cookie on.
     :return: A generator that yields an instance of the transaction manager.
     """
 
-    async with TransactionManager(
-        session_factory=async_session,
-    ) as transaction:
+    on_commit = None
+    if (
+        database.replica_set.engines
+        and settings.db.read_your_writes_seconds > 0
+    ):
+        on_commit = partial(pin_to_primary, response)
+
+    async with transaction_factory(on_commit=on_commit) as transaction:
         yield transaction
 
 
 DbTransactionDep = Annotated[
-    TransactionManager,
+    BaseManager,
     Depends(get_db_transaction),
 ]
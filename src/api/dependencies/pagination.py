@@ -2,6 +2,9 @@ from typing import Annotated
 
 from fastapi import Depends
 
+from src.exceptions.api.pagination import InvalidPaginationCursorHTTPException
+from src.schemas.pagination import CursorSchema
+from src.schemas.pagination import OffsetPaginationRequestSchema
 from src.schemas.pagination import PaginationRequestSchema
 from src.schemas.pagination import PaginationSchema
 
@@ -11,6 +14,28 @@ def get_pagination_params(
         PaginationRequestSchema,
         Depends(),
     ],
+) -> PaginationSchema:
+    if params.cursor is None:
+        return PaginationSchema(
+            limit=params.per_page,
+            offset=params.per_page * (params.page - 1),
+        )
+    try:
+        cursor = CursorSchema.decode(params.cursor)
+    except ValueError as ex:
+        raise InvalidPaginationCursorHTTPException from ex
+    return PaginationSchema(
+        limit=params.per_page,
+        offset=0,
+        cursor=cursor,
+    )
+
+
+def get_offset_pagination_params(
+    params: Annotated[
+        OffsetPaginationRequestSchema,
+        Depends(),
+    ],
 ) -> PaginationSchema:
     return PaginationSchema(
         limit=params.per_page,
@@ -22,3 +47,8 @@ PaginationDep = Annotated[
     PaginationSchema,
     Depends(get_pagination_params),
 ]
+
+OffsetPaginationDep = Annotated[
+    PaginationSchema,
+    Depends(get_offset_pagination_params),
+]
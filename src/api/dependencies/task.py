@@ -0,0 +1,69 @@
+from datetime import datetime
+from typing import Annotated
+
+from fastapi import Depends
+from fastapi import Query
+
+from src.config import TaskStatus
+from src.schemas.sorting import SortingSchema
+from src.schemas.sorting import SortOrder
+from src.schemas.task import TaskFilterSchema
+from src.schemas.task import TaskSortField
+
+
+def get_task_filters(
+    status: Annotated[
+        list[TaskStatus] | None,
+        Query(),
+    ] = None,
+    created_at_from: Annotated[
+        datetime | None,
+        Query(description="Inclusive lower bound"),
+    ] = None,
+    created_at_to: Annotated[
+        datetime | None,
+        Query(description="Exclusive upper bound"),
+    ] = None,
+    updated_at_from: Annotated[
+        datetime | None,
+        Query(description="Inclusive lower bound"),
+    ] = None,
+    updated_at_to: Annotated[
+        datetime | None,
+        Query(description="Exclusive upper bound"),
+    ] = None,
+) -> TaskFilterSchema:
+    return TaskFilterSchema(
+        status=status or None,
+        created_at_from=created_at_from,
+        created_at_to=created_at_to,
+        updated_at_from=updated_at_from,
+        updated_at_to=updated_at_to,
+    )
+
+
+def get_task_sorting(
+    sort_by: Annotated[
+        TaskSortField,
+        Query(),
+    ] = TaskSortField.CREATED_AT,
+    order: Annotated[
+        SortOrder,
+        Query(),
+    ] = SortOrder.ASC,
+) -> SortingSchema:
+    return SortingSchema(
+        field=sort_by.value,
+        descending=order is SortOrder.DESC,
+    )
+
+
+TaskFilterDep = Annotated[
+    TaskFilterSchema,
+    Depends(get_task_filters),
+]
+
+TaskSortingDep = Annotated[
+    SortingSchema,
+    Depends(get_task_sorting),
+]
@@ -0,0 +1,64 @@
+from fastapi import APIRouter
+from fastapi import status
+
+from src.db.pool import get_pool_stats
+from src.exceptions.api.internal import CacheDisabledHTTPException
+from src.schemas.base.schemas import BaseHTTPExceptionSchema
+from src.schemas.internal import CacheStatsSchema
+from src.schemas.internal import PoolStatsSchema
+from src.schemas.internal import StatementCacheStatsSchema
+from src.utils.cache import statement_cache
+from src.utils.cache import task_cache
+
+
+router = APIRouter(
+    prefix="/internal",
+    tags=["Internal"],
+)
+
+
+@router.get(
+    "/cache",
+    response_model=CacheStatsSchema,
+    status_code=status.HTTP_200_OK,
+    responses={
+        CacheDisabledHTTPException.status_code: {
+            "model": BaseHTTPExceptionSchema,
+            "description": CacheDisabledHTTPException.detail,
+        },
+    },
+    summary="Get cache stats",
+    description="Get hit, miss and eviction counters of the task cache",
+)
+async def get_cache_stats() -> CacheStatsSchema:
+    if task_cache is None:
+        raise CacheDisabledHTTPException
+    return task_cache.stats()
+
+
+@router.get(
+    "/pool",
+    response_model=dict[str, PoolStatsSchema],
+    status_code=status.HTTP_200_OK,
+    summary="Get connection pool stats",
+    description=(
+        "Get usage and checkout wait time of the connection pools "
+        "of the worker process that served the request"
+    ),
+)
+async def get_pool_stats_by_engine() -> dict[str, PoolStatsSchema]:
+    return get_pool_stats()
+
+
+@router.get(
+    "/statements",
+    response_model=StatementCacheStatsSchema,
+    status_code=status.HTTP_200_OK,
+    summary="Get statement cache stats",
+    description=(
+        "Get the number of pre-built repository statements "
+        "and the hit rate of their cache"
+    ),
+)
+async def get_statement_cache_stats() -> StatementCacheStatsSchema:
+    return statement_cache.stats()
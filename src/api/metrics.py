@@ -0,0 +1,87 @@
+from fastapi import APIRouter
+from fastapi import status
+from fastapi.responses import PlainTextResponse
+
+from src.db.pool import instrumented_engines
+from src.utils.metrics import phase_metrics
+from src.utils.metrics import render_histogram
+
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+router = APIRouter(
+    tags=["Metrics"],
+)
+
+
+def render_metrics() -> str:
+    """
+    Render the request phase, query count and connection pool
+    histograms of this worker process in the Prometheus text format.
+
+    :return: The exposition text.
+    """
+
+    lines = [
+        "# HELP http_request_phase_seconds "
+        "Time spent by requests in each phase.",
+        "# TYPE http_request_phase_seconds histogram",
+    ]
+    for (method, route, phase), histogram in phase_metrics.histograms.items():
+        lines.extend(
+            render_histogram(
+                "http_request_phase_seconds",
+                {"method": method, "route": route, "phase": phase},
+                histogram,
+            )
+        )
+    lines.extend(
+        [
+            "# HELP http_request_queries "
+            "Number of SQL statements executed by requests.",
+            "# TYPE http_request_queries histogram",
+        ]
+    )
+    for (method, route), histogram in phase_metrics.query_counts.items():
+        lines.extend(
+            render_histogram(
+                "http_request_queries",
+                {"method": method, "route": route},
+                histogram,
+            )
+        )
+    lines.extend(
+        [
+            "# HELP db_pool_checkout_wait_seconds "
+            "Time spent waiting for a pool connection.",
+            "# TYPE db_pool_checkout_wait_seconds histogram",
+        ]
+    )
+    for name, engine in instrumented_engines.items():
+        lines.extend(
+            render_histogram(
+                "db_pool_checkout_wait_seconds",
+                {"engine": name},
+                engine.pool.metrics.checkout_wait,  # type: ignore
+            )
+        )
+    return "\n".join(lines) + "\n"
+
+
+@router.get(
+    "/metrics",
+    response_class=PlainTextResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Get metrics",
+    description=(
+        "Get histograms of request phases and query counts by route "
+        "and of connection pool checkout waits "
+        "in the Prometheus text format"
+    ),
+)
+async def get_metrics() -> PlainTextResponse:
+    return PlainTextResponse(
+        render_metrics(),
+        media_type=PROMETHEUS_CONTENT_TYPE,
+    )
@@ -0,0 +1,81 @@
+import time
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp
+from starlette.types import Message
+from starlette.types import Receive
+from starlette.types import Scope
+from starlette.types import Send
+
+from src.config import settings
+from src.db.instrumentation import count_queries
+from src.utils.metrics import phase_metrics
+from src.utils.timing import RequestTimings
+from src.utils.timing import request_timings
+
+
+class ServerTimingMiddleware:
+    """
+    Record the phases of each request, e.g. waiting for a connection,
+    SQL, mapping and serialization, and the executed statements.
+    The durations are returned in the ``Server-Timing`` header
+    and aggregated into histograms by route. Phases after the response
+    has started (e.g. streaming) are not included. Does nothing
+    unless metrics are enabled.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+    ) -> None:
+        self.app = app
+
+    async def __call__(
+        self,
+        scope: Scope,
+        receive: Receive,
+        send: Send,
+    ) -> None:
+        if scope["type"] != "http" or not settings.metrics.enabled:
+            await self.app(scope, receive, send)
+            return
+
+        timings = RequestTimings()
+        token = request_timings.set(timings)
+        started_at = time.perf_counter()
+
+        async def send_with_timings(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                durations = {
+                    **timings.durations,
+                    "total": time.perf_counter() - started_at,
+                }
+                route = scope.get("route")
+                if route is not None:
+                    phase_metrics.observe(
+                        scope["method"],
+                        route.path,
+                        durations,
+                        queries.count,
+                    )
+                entries = [
+                    f"{name};dur={duration * 1000:.3f}"
+                    for name, duration in durations.items()
+                ]
+                # Time of the statements in the database and the driver,
+                # it overlaps with the repository phases.
+                entries.append(
+                    f"sql;dur={queries.duration * 1000:.3f};"
+                    f'desc="{queries.count} queries"'
+                )
+                MutableHeaders(scope=message).append(
+                    "Server-Timing",
+                    ", ".join(entries),
+                )
+            await send(message)
+
+        try:
+            with count_queries() as queries:
+                await self.app(scope, receive, send_with_timings)
+        finally:
+            request_timings.reset(token)
@@ -0,0 +1,61 @@
+from typing import Any
+from typing import Mapping
+
+from fastapi import Response
+from fastapi import status
+from pydantic import TypeAdapter
+
+from src.schemas.base.schemas import UUIDSchema
+from src.schemas.pagination import PageSchema
+from src.schemas.task import ArchivedTaskSchema
+from src.schemas.task import TaskSchema
+from src.utils.timing import phase
+
+
+class SchemaJSONResponse(Response):
+    """
+    JSON response encoded straight to bytes by a precompiled
+    pydantic-core serializer. Returning it from a handler skips
+    the validation against ``response_model`` and the generic
+    encoding that FastAPI performs for other return values.
+    The content must already be valid for the adapter type.
+    """
+
+    media_type = "application/json"
+
+    def __init__(
+        self,
+        content: Any,
+        adapter: TypeAdapter,
+        status_code: int = status.HTTP_200_OK,
+        headers: Mapping[str, str] | None = None,
+        sub_response: Response | None = None,
+    ) -> None:
+        """
+        :param content: Schema instances to serialize.
+        :param adapter: Type adapter of the content type.
+        :param status_code: HTTP status code.
+        :param headers: Additional response headers.
+        :param sub_response: The ``Response`` injected into the handler.
+                             FastAPI drops it when a response
+                             is returned, so its headers (e.g. cookies
+                             set by dependencies) are copied here.
+        """
+
+        with phase("serialize"):
+            body = adapter.dump_json(content)
+        super().__init__(
+            content=body,
+            status_code=status_code,
+            headers=headers,
+        )
+        if sub_response is not None:
+            self.raw_headers.extend(sub_response.raw_headers)
+
+
+task_adapter = TypeAdapter(TaskSchema)
+task_list_adapter = TypeAdapter(list[TaskSchema])
+task_page_adapter = TypeAdapter(PageSchema[TaskSchema])
+uuid_list_adapter = TypeAdapter(list[UUIDSchema])
+archived_task_adapter = TypeAdapter(ArchivedTaskSchema)
+archived_task_list_adapter = TypeAdapter(list[ArchivedTaskSchema])
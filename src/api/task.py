@@ -1,18 +1,54 @@
 import uuid
+from typing import Annotated
+from typing import AsyncIterator
 
 from fastapi import APIRouter
+from fastapi import Body
+from fastapi import Header
+from fastapi import Query
+from fastapi import Response
 from fastapi import status
+from fastapi.responses import StreamingResponse
 
 from src.api.dependencies import DbTransactionDep
+from src.api.dependencies import TransactionFactoryDep
+from src.api.dependencies.pagination import OffsetPaginationDep
 from src.api.dependencies.pagination import PaginationDep
+from src.api.dependencies.task import TaskFilterDep
+from src.api.dependencies.task import TaskSortingDep
+from src.api.responses import SchemaJSONResponse
+from src.api.responses import task_adapter
+from src.api.responses import task_list_adapter
+from src.api.responses import task_page_adapter
+from src.api.responses import uuid_list_adapter
+from src.config import settings
+from src.exceptions.api.pagination import (
+    PaginationCursorSortingMismatchHTTPException,
+)
+from src.exceptions.api.task import CannotAddTaskHTTPException
 from src.exceptions.api.task import TaskDoesNotExistsHTTPException
+from src.exceptions.api.task import TaskVersionConflictHTTPException
+from src.exceptions.service.task import CannotAddTaskServiceException
 from src.exceptions.service.task import TaskDoesNotExistsServiceException
+from src.exceptions.service.task import TaskVersionConflictServiceException
 from src.schemas.base.schemas import BaseHTTPExceptionSchema
+from src.schemas.base.schemas import BulkResultSchema
 from src.schemas.base.schemas import UUIDSchema
+from src.schemas.pagination import CursorSchema
+from src.schemas.pagination import PageSchema
+from src.schemas.pagination import TotalMode
+from src.schemas.task import TaskBulkUpdateSchema
 from src.schemas.task import TaskCreateSchema
 from src.schemas.task import TaskSchema
+from src.schemas.task import TaskSearchResultSchema
+from src.schemas.task import TaskSelectionSchema
+from src.schemas.task import TaskStatsSchema
 from src.schemas.task import TaskUpdateSchema
 from src.services import TaskService
+from src.utils.etag import etag_matches
+from src.utils.etag import get_collection_etag
+from src.utils.etag import get_entity_etag
+from src.utils.etag import get_etag_version
 
 
 router = APIRouter(
@@ -20,19 +56,219 @@ router = APIRouter(
     tags=["Tasks"],
 )
 
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+IfNoneMatchHeader = Annotated[
+    str | None,
+    Header(),
+]
+
+PreferHeader = Annotated[
+    str | None,
+    Header(
+        description=(
+            "`return=representation` to receive the updated task "
+            "instead of its ID"
+        ),
+    ),
+]
+
+IfMatchHeader = Annotated[
+    str | None,
+    Header(
+        description=(
+            "ETag of the task from a previous response. The task is "
+            "updated only if it has not been modified since."
+        ),
+    ),
+]
+
+
+def prefers_representation(
+    prefer: str | None,
+) -> bool:
+    """
+    Check whether the `Prefer` header asks for the resource
+    in the response (RFC 7240).
+
+    :param prefer: Value of the header.
+    :return: True if `return=representation` is preferred.
+    """
+
+    if prefer is None:
+        return False
+    for preference in prefer.split(","):
+        token, _, value = preference.split(";")[0].partition("=")
+        if (
+            token.strip().lower() == "return"
+            and value.strip().strip('"').lower() == "representation"
+        ):
+            return True
+    return False
+
 
 @router.get(
     "",
-    response_model=list[TaskSchema],
+    response_model=list[TaskSchema] | PageSchema[TaskSchema],
     status_code=status.HTTP_200_OK,
+    responses={
+        status.HTTP_304_NOT_MODIFIED: {
+            "description": "The page matches the `If-None-Match` ETag",
+        },
+    },
     summary="Get all tasks",
-    description="Get all tasks with pagination",
+    description=(
+        "Get tasks matching the filters, sorted by `sort_by` "
+        "(ties broken by ID) with pagination. "
+        f"If the page is full, the `{NEXT_CURSOR_HEADER}` header "
+        "contains a cursor for fetching the next page "
+        "with the same sorting. "
+        "With `envelope=true` the tasks are wrapped in an object "
+        "with `total`, `has_next`, `next_page` and `next_cursor`. "
+        "Enveloped pages are not cached with ETags."
+    ),
 )
 async def get_all_tasks(
     transaction: DbTransactionDep,
     pagination: PaginationDep,
-) -> list[TaskSchema]:
-    return await TaskService(transaction).get_all(
+    filters: TaskFilterDep,
+    sorting: TaskSortingDep,
+    envelope: Annotated[
+        bool,
+        Query(description="Wrap the tasks in a page object"),
+    ] = False,
+    total: Annotated[
+        TotalMode,
+        Query(
+            description=(
+                "How to compute `total` of an enveloped page: "
+                "`exact` counts the tasks (cached for a few seconds), "
+                "`estimated` uses the planner statistics."
+            ),
+        ),
+    ] = TotalMode.NONE,
+    if_none_match: IfNoneMatchHeader = None,
+) -> Response:
+    if pagination.cursor is not None and not pagination.cursor.matches(
+        sorting,
+    ):
+        raise PaginationCursorSortingMismatchHTTPException
+    service = TaskService(transaction)
+    if envelope:
+        page = await service.get_page(
+            pagination=pagination,
+            filters=filters,
+            sorting=sorting,
+            total_mode=total,
+        )
+        return SchemaJSONResponse(
+            page,
+            adapter=task_page_adapter,
+        )
+
+    if if_none_match is not None:
+        etag = await service.get_all_etag(
+            pagination=pagination,
+            filters=filters,
+            sorting=sorting,
+        )
+        if etag_matches(if_none_match, etag):
+            return Response(
+                status_code=status.HTTP_304_NOT_MODIFIED,
+                headers={"ETag": etag},
+            )
+
+    tasks = await service.get_all(
+        pagination=pagination,
+        filters=filters,
+        sorting=sorting,
+    )
+    headers = {
+        "ETag": get_collection_etag(
+            (task.id, task.updated_at) for task in tasks
+        ),
+    }
+    if len(tasks) == pagination.limit:
+        last_task = tasks[-1]
+        headers[NEXT_CURSOR_HEADER] = CursorSchema.after(
+            last_task,
+            sorting,
+        ).encode()
+    return SchemaJSONResponse(
+        tasks,
+        adapter=task_list_adapter,
+        headers=headers,
+    )
+
+
+@router.get(
+    "/export",
+    response_class=StreamingResponse,
+    status_code=status.HTTP_200_OK,
+    responses={
+        status.HTTP_200_OK: {
+            "content": {"application/x-ndjson": {}},
+            "description": "One JSON-encoded task per line",
+        },
+    },
+    summary="Export all tasks",
+    description="Stream all tasks ordered by creation time as NDJSON",
+)
+async def export_tasks(
+    transaction_factory: TransactionFactoryDep,
+) -> StreamingResponse:
+    async def generate() -> AsyncIterator[str]:
+        async with transaction_factory() as transaction:
+            async for tasks in TaskService(transaction).stream_all():
+                yield "".join(f"{task.model_dump_json()}\n" for task in tasks)
+
+    return StreamingResponse(
+        generate(),
+        media_type="application/x-ndjson",
+    )
+
+
+@router.get(
+    "/stats",
+    response_model=TaskStatsSchema,
+    status_code=status.HTTP_200_OK,
+    summary="Get task statistics",
+    description=(
+        "Get the number of tasks in each status and in total. "
+        "Only active tasks are counted, archived tasks are not."
+    ),
+)
+async def get_task_stats(
+    transaction: DbTransactionDep,
+) -> TaskStatsSchema:
+    return await TaskService(transaction).get_stats()
+
+
+@router.get(
+    "/search",
+    response_model=list[TaskSearchResultSchema],
+    status_code=status.HTTP_200_OK,
+    summary="Search tasks",
+    description=(
+        "Full-text search over task names and descriptions. "
+        "Supports quoted phrases, `or` and `-` to exclude a word. "
+        "Results are ordered by relevance, and the snippet "
+        "highlights the matched words with `<b>` tags."
+    ),
+)
+async def search_tasks(
+    transaction: DbTransactionDep,
+    pagination: OffsetPaginationDep,
+    q: Annotated[
+        str,
+        Query(
+            min_length=1,
+            max_length=200,
+        ),
+    ],
+) -> list[TaskSearchResultSchema]:
+    return await TaskService(transaction).search(
+        text=q,
         pagination=pagination,
     )
 
@@ -42,24 +278,44 @@ async def get_all_tasks(
     response_model=TaskSchema,
     status_code=status.HTTP_200_OK,
     responses={
+        status.HTTP_304_NOT_MODIFIED: {
+            "description": "The task matches the `If-None-Match` ETag",
+        },
         TaskDoesNotExistsHTTPException.status_code: {
             "model": BaseHTTPExceptionSchema,
             "description": TaskDoesNotExistsHTTPException.detail,
         },
     },
     summary="Get one task",
-    description="Get one task by ID",
+    description=(
+        "Get one task by ID. Archived tasks are returned as well, "
+        "but cannot be modified."
+    ),
 )
 async def get_one_task(
     task_id: uuid.UUID,
     transaction: DbTransactionDep,
-) -> TaskSchema:
+    if_none_match: IfNoneMatchHeader = None,
+) -> Response:
+    service = TaskService(transaction)
     try:
-        return await TaskService(transaction).get_one(
+        if if_none_match is not None:
+            etag = await service.get_etag(task_id)
+            if etag_matches(if_none_match, etag):
+                return Response(
+                    status_code=status.HTTP_304_NOT_MODIFIED,
+                    headers={"ETag": etag},
+                )
+        task = await service.get_one(
             id=task_id,
         )
     except TaskDoesNotExistsServiceException as ex:
         raise TaskDoesNotExistsHTTPException from ex
+    return SchemaJSONResponse(
+        task,
+        adapter=task_adapter,
+        headers={"ETag": get_entity_etag(task.id, task.version)},
+    )
 
 
 @router.post(
@@ -72,38 +328,163 @@ async def get_one_task(
 async def add_task(
     transaction: DbTransactionDep,
     data: TaskCreateSchema,
-) -> TaskSchema:
-    return await TaskService(transaction).create(
-        data=data,
+    response: Response,
+) -> Response:
+    try:
+        created_task = await TaskService(transaction).create(
+            data=data,
+        )
+    except CannotAddTaskServiceException as ex:
+        raise CannotAddTaskHTTPException from ex
+    return SchemaJSONResponse(
+        created_task,
+        adapter=task_adapter,
+        status_code=status.HTTP_201_CREATED,
+        sub_response=response,
+    )
+
+
+@router.post(
+    "/bulk",
+    response_model=list[TaskSchema] | list[UUIDSchema],
+    status_code=status.HTTP_201_CREATED,
+    summary="Add multiple tasks",
+    description=(
+        "Add multiple tasks in a single transaction. "
+        "If `only_ids` is passed, only the IDs of the new tasks are returned."
+    ),
+)
+async def add_tasks_bulk(
+    transaction: DbTransactionDep,
+    data: Annotated[
+        list[TaskCreateSchema],
+        Body(
+            min_length=1,
+            max_length=settings.bulk.max_entities,
+        ),
+    ],
+    response: Response,
+    only_ids: Annotated[
+        bool,
+        Query(),
+    ] = False,
+) -> Response:
+    service = TaskService(transaction)
+    try:
+        if only_ids:
+            task_ids = await service.create_bulk_ids(data=data)
+            return SchemaJSONResponse(
+                [UUIDSchema(id=task_id) for task_id in task_ids],
+                adapter=uuid_list_adapter,
+                status_code=status.HTTP_201_CREATED,
+                sub_response=response,
+            )
+        created_tasks = await service.create_bulk(data=data)
+    except CannotAddTaskServiceException as ex:
+        raise CannotAddTaskHTTPException from ex
+    return SchemaJSONResponse(
+        created_tasks,
+        adapter=task_list_adapter,
+        status_code=status.HTTP_201_CREATED,
+        sub_response=response,
+    )
+
+
+@router.patch(
+    "/bulk",
+    response_model=BulkResultSchema,
+    status_code=status.HTTP_200_OK,
+    summary="Update multiple tasks",
+    description="Update all tasks selected by IDs or filters",
+)
+async def update_tasks_bulk(
+    transaction: DbTransactionDep,
+    data: TaskBulkUpdateSchema,
+) -> BulkResultSchema:
+    return await TaskService(transaction).update_bulk(
+        selection=data,
+        data=data.data,
     )
 
 
 @router.patch(
     "/{task_id}",
-    response_model=UUIDSchema,
+    response_model=UUIDSchema | TaskSchema,
     status_code=status.HTTP_200_OK,
     responses={
         TaskDoesNotExistsHTTPException.status_code: {
             "model": BaseHTTPExceptionSchema,
             "description": TaskDoesNotExistsHTTPException.detail,
         },
+        TaskVersionConflictHTTPException.status_code: {
+            "model": BaseHTTPExceptionSchema,
+            "description": (
+                "The task does not match `If-Match`: it was modified "
+                "by another request or deleted"
+            ),
+        },
     },
     summary="Update one task",
-    description="Update one task",
+    description=(
+        "Update one task. Pass the ETag of the task in `If-Match` "
+        "to avoid overwriting concurrent changes. "
+        "With `Prefer: return=representation` the updated task "
+        "is returned instead of its ID."
+    ),
 )
 async def update_task(
     task_id: uuid.UUID,
     transaction: DbTransactionDep,
     data: TaskUpdateSchema,
-) -> UUIDSchema:
+    response: Response,
+    if_match: IfMatchHeader = None,
+    prefer: PreferHeader = None,
+) -> UUIDSchema | Response:
+    return_task = prefers_representation(prefer)
+    response.headers["Vary"] = "Prefer"
+    expected_version = None
+    if if_match is not None and if_match.strip() != "*":
+        expected_version = get_etag_version(if_match, task_id)
+        if expected_version is None:
+            raise TaskVersionConflictHTTPException
     try:
-        await TaskService(transaction).update_one(
+        updated = await TaskService(transaction).update_one(
             task_id=task_id,
             data=data,
+            expected_version=expected_version,
+            return_task=return_task,
         )
     except TaskDoesNotExistsServiceException as ex:
         raise TaskDoesNotExistsHTTPException from ex
-    return UUIDSchema(id=task_id)
+    except TaskVersionConflictServiceException as ex:
+        raise TaskVersionConflictHTTPException from ex
+    if not isinstance(updated, TaskSchema):
+        return UUIDSchema(id=task_id)
+    return SchemaJSONResponse(
+        updated,
+        adapter=task_adapter,
+        headers={
+            "ETag": get_entity_etag(updated.id, updated.version),
+            "Preference-Applied": "return=representation",
+        },
+        sub_response=response,
+    )
+
+
+@router.delete(
+    "/bulk",
+    response_model=BulkResultSchema,
+    status_code=status.HTTP_200_OK,
+    summary="Delete multiple tasks",
+    description="Delete all tasks selected by IDs or filters",
+)
+async def delete_tasks_bulk(
+    transaction: DbTransactionDep,
+    data: TaskSelectionSchema,
+) -> BulkResultSchema:
+    return await TaskService(transaction).delete_bulk(
+        selection=data,
+    )
 
 
 @router.delete(
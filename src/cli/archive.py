@@ -0,0 +1,69 @@
+"""
+Move completed tasks to the ``archived_tasks`` table in batches.
+Intended to be run periodically, e.g. by cron, while the service
+is running: each batch is a short transaction, and the batches
+are separated by a pause to limit the load on the database.
+
+Usage::
+
+    uv run python -m src.cli.archive --older-than-days 90
+"""
+
+import argparse
+import asyncio
+import logging
+import time
+from datetime import timedelta
+
+from src.config import settings
+from src.db.database import database
+from src.services import ArchivedTaskService
+from src.utils.transaction import TransactionManager
+
+
+async def main(arguments: argparse.Namespace) -> None:
+    started_at = time.perf_counter()
+    async with TransactionManager(
+        session_factory=database.session_factory
+    ) as db:
+        archived = await ArchivedTaskService(db).archive_completed(
+            older_than=timedelta(days=arguments.older_than_days),
+            batch_size=arguments.batch_size,
+            pause=arguments.pause_ms / 1000,
+            max_batches=arguments.max_batches,
+        )
+    elapsed = time.perf_counter() - started_at
+    print(f"Archived {archived} tasks in {elapsed:.1f} s")
+    await database.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument(
+        "--older-than-days",
+        type=float,
+        default=settings.archive.after_days,
+        help="Archive tasks completed at least this many days ago",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=settings.archive.batch_size,
+    )
+    parser.add_argument(
+        "--pause-ms",
+        type=float,
+        default=settings.archive.pause_ms,
+        help="Pause between batches",
+    )
+    parser.add_argument(
+        "--max-batches",
+        type=int,
+        default=None,
+        help="Stop after this many batches, by default archive all",
+    )
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(main(parser.parse_args()))
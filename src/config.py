@@ -26,10 +26,97 @@ class DatabaseSettings(BaseModel):
     url: PostgresDsn = (
         f"postgresql+asyncpg://{user}:{password}@{host}:{port}/{name}"  # type: ignore
     )
+    pool_size: int = int(os.getenv("DB_POOL_SIZE", "5"))
+    max_overflow: int = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+    pool_timeout: float = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+    # Seconds after which a connection is replaced, -1 disables recycling
+    pool_recycle: int = int(os.getenv("DB_POOL_RECYCLE", "-1"))
+    pool_pre_ping: bool = (
+        os.getenv("DB_POOL_PRE_PING", "false").lower() == "true"
+    )
+    # Size of the asyncpg prepared statement cache per connection
+    statement_cache_size: int = int(
+        os.getenv("DB_STATEMENT_CACHE_SIZE", "100")
+    )
+    # Comma-separated URLs of read replicas
+    replica_urls: list[PostgresDsn] = [
+        replica_url.strip()  # type: ignore
+        for replica_url in os.getenv("DB_REPLICA_URLS", "").split(",")
+        if replica_url.strip()
+    ]
+    replica_strategy: Literal[
+        "round_robin",
+        "least_connections",
+    ] = os.getenv("DB_REPLICA_STRATEGY", "round_robin")  # type: ignore
+    # Statements slower than this are logged with their parameters.
+    # A negative value disables the log.
+    slow_query_ms: float = float(os.getenv("DB_SLOW_QUERY_MS", "500"))
+    # Also log EXPLAIN (ANALYZE, BUFFERS) of slow SELECT statements.
+    # Ignored in the PROD mode.
+    explain_slow_queries: bool = (
+        os.getenv("DB_EXPLAIN_SLOW_QUERIES", "false").lower() == "true"
+    )
+    # For how long reads of a client go to the primary after its write.
+    # 0 disables pinning.
+    read_your_writes_seconds: int = int(
+        os.getenv("DB_READ_YOUR_WRITES_SECONDS", "0")
+    )
+    # Connections per engine opened at startup, with the hot statements
+    # prepared on them. Capped by the pool size, 0 disables the warm-up.
+    warmup_connections: int = int(os.getenv("DB_WARMUP_CONNECTIONS", "0"))
 
 
 class PaginationSettings(BaseModel):
     max_entities_per_page: int = 100
+    # Exact totals are cached per filter set and may lag behind
+    # writes for up to `count_cache_ttl` seconds. 0 disables the cache.
+    count_cache_ttl: float = float(
+        os.getenv("PAGINATION_COUNT_CACHE_TTL", "10"),
+    )
+    count_cache_max_size: int = int(
+        os.getenv("PAGINATION_COUNT_CACHE_MAX_SIZE", "1000"),
+    )
+
+
+class ExportSettings(BaseModel):
+    batch_size: int = int(os.getenv("EXPORT_BATCH_SIZE", "1000"))
+
+
+class BulkSettings(BaseModel):
+    max_entities: int = 10_000
+    chunk_size: int = int(os.getenv("BULK_CHUNK_SIZE", "1000"))
+
+
+class CacheSettings(BaseModel):
+    # The cache is per worker process, so other workers
+    # may return stale tasks for up to `ttl` seconds after a write.
+    enabled: bool = os.getenv("TASK_CACHE_ENABLED", "false").lower() == "true"
+    max_size: int = int(os.getenv("TASK_CACHE_MAX_SIZE", "10000"))
+    ttl: float = float(os.getenv("TASK_CACHE_TTL", "5"))
+    negative_ttl: float = float(os.getenv("TASK_CACHE_NEGATIVE_TTL", "1"))
+
+
+class WriteBatchSettings(BaseModel):
+    # Coalesce concurrent task creations of a worker
+    # into one INSERT and one commit
+    enabled: bool = os.getenv("WRITE_BATCH_ENABLED", "false").lower() == "true"
+    # How long a batch waits for more creations
+    window_ms: float = float(os.getenv("WRITE_BATCH_WINDOW_MS", "2"))
+    max_size: int = int(os.getenv("WRITE_BATCH_MAX_SIZE", "100"))
+
+
+class ArchiveSettings(BaseModel):
+    # Completed tasks not updated for this long are moved to the archive
+    after_days: float = float(os.getenv("ARCHIVE_AFTER_DAYS", "90"))
+    batch_size: int = int(os.getenv("ARCHIVE_BATCH_SIZE", "1000"))
+    # Pause between batches, so archiving does not saturate the database
+    pause_ms: float = float(os.getenv("ARCHIVE_PAUSE_MS", "100"))
+
+
+class MetricsSettings(BaseModel):
+    # Per-request phase timings in the Server-Timing header
+    # and their histograms on /metrics
+    enabled: bool = os.getenv("METRICS_ENABLED", "false").lower() == "true"
 
 
 class AppSettings(BaseModel):
@@ -39,12 +126,24 @@ class AppSettings(BaseModel):
         "DEV",
         "PROD",
     ] = os.getenv("APP_MODE")  # type: ignore
+    # "memory" keeps tasks in process memory instead of the database,
+    # for benchmarks without I/O and fast tests
+    db_backend: Literal[
+        "postgres",
+        "memory",
+    ] = os.getenv("DB_BACKEND", "postgres")  # type: ignore
 
 
 class Settings(BaseSettings):
     app: AppSettings = AppSettings()
     db: DatabaseSettings = DatabaseSettings()
     pagination: PaginationSettings = PaginationSettings()
+    export: ExportSettings = ExportSettings()
+    bulk: BulkSettings = BulkSettings()
+    write_batch: WriteBatchSettings = WriteBatchSettings()
+    cache: CacheSettings = CacheSettings()
+    metrics: MetricsSettings = MetricsSettings()
+    archive: ArchiveSettings = ArchiveSettings()
 
 
 settings = Settings()
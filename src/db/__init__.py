@@ -1,8 +1,12 @@
 from src.db.database import Base
+from src.models.archived_task import ArchivedTask
 from src.models.task import Task
+from src.models.task_status_count import TaskStatusCount
 
 
 __all__ = (
+    "ArchivedTask",
     "Base",
     "Task",
+    "TaskStatusCount",
 )
@@ -1,47 +1,208 @@
 import re
+from functools import cache
+from typing import TYPE_CHECKING
 
-import inflect
 from sqlalchemy import NullPool
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.ext.asyncio import async_sessionmaker
 from sqlalchemy.ext.asyncio import create_async_engine
 from sqlalchemy.orm import DeclarativeBase
 from sqlalchemy.orm import declared_attr
 
 from src.config import settings
+from src.db.instrumentation import instrument_queries
+from src.db.pool import InstrumentedAsyncQueuePool
+from src.db.pool import instrument_pool
+from src.db.replicas import ReplicaSet
 
 
-async_engine = create_async_engine(
-    url=settings.db.url,  # type: ignore
-)
-async_engine_null_pull = create_async_engine(
-    url=settings.db.url,  # type: ignore
-    poolclass=NullPool,
-)
-async_session = async_sessionmaker(
-    async_engine,
-    expire_on_commit=False,
-)
-async_session_null_pool = async_sessionmaker(
-    async_engine_null_pull,
-    expire_on_commit=False,
-)
+def create_pooled_engine(
+    url: str,
+    name: str,
+    **kwargs,
+) -> AsyncEngine:
+    """
+    Create an engine with the configured and instrumented connection pool
+    and instrumented queries.
 
-inflect_engine = inflect.engine()
+    :param url: Database URL.
+    :param name: Name of the engine in the pool stats.
+    :param kwargs: Additional arguments for ``create_async_engine``.
+    :return: The created engine.
+    """
 
+    engine = create_async_engine(
+        url=url,
+        poolclass=InstrumentedAsyncQueuePool,
+        pool_size=settings.db.pool_size,
+        max_overflow=settings.db.max_overflow,
+        pool_timeout=settings.db.pool_timeout,
+        pool_recycle=settings.db.pool_recycle,
+        pool_pre_ping=settings.db.pool_pre_ping,
+        connect_args={
+            "prepared_statement_cache_size": settings.db.statement_cache_size,
+        },
+        **kwargs,
+    )
+    instrument_pool(engine, name)
+    instrument_queries(engine)
+    return engine
 
-class Base(DeclarativeBase):
-    @declared_attr.directive
-    @classmethod
-    def __tablename__(cls) -> str:
+
+class Database:
+    """
+    Engines of the application and their session factories.
+    Nothing is created on import: the application creates the engines
+    at startup by ``connect`` and disposes of them at shutdown,
+    while scripts and tests get them created on first access.
+    """
+
+    def __init__(self) -> None:
+        self._engine: AsyncEngine | None = None
+        self._session_factory: async_sessionmaker[AsyncSession] | None = None
+        self._replica_set: ReplicaSet | None = None
+        self._null_pool_engine: AsyncEngine | None = None
+        self._null_pool_session_factory: (
+            async_sessionmaker[AsyncSession] | None
+        ) = None
+
+    def connect(self) -> None:
         """
-        Converts `CamelCase` class name
-        to plural `snake_case` table name.
+        Create the pooled engines of the primary and the replicas,
+        if they are not created yet. Connections are opened on demand.
+        """
+
+        if self._engine is not None:
+            return
+        self._engine = create_pooled_engine(
+            url=settings.db.url,  # type: ignore
+            name="primary",
+        )
+        self._session_factory = async_sessionmaker(
+            self._engine,
+            expire_on_commit=False,
+        )
+        self._replica_set = ReplicaSet(
+            engines=[
+                create_pooled_engine(
+                    url=replica_url,  # type: ignore
+                    name=f"replica_{number}",
+                    execution_options={"postgresql_readonly": True},
+                )
+                for number, replica_url in enumerate(settings.db.replica_urls)
+            ],
+            strategy=settings.db.replica_strategy,
+        )
+
+    @property
+    def engine(self) -> AsyncEngine:
+        self.connect()
+        return self._engine  # type: ignore
+
+    @property
+    def session_factory(self) -> async_sessionmaker[AsyncSession]:
+        self.connect()
+        return self._session_factory  # type: ignore
 
-        :return: Pluralized snake_case table name.
+    @property
+    def replica_set(self) -> ReplicaSet:
+        self.connect()
+        return self._replica_set  # type: ignore
+
+    @property
+    def null_pool_engine(self) -> AsyncEngine:
+        """Engine without a pool, used by tests and migrations"""
+        if self._null_pool_engine is None:
+            self._null_pool_engine = create_async_engine(
+                url=settings.db.url,  # type: ignore
+                poolclass=NullPool,
+            )
+            instrument_queries(self._null_pool_engine)
+        return self._null_pool_engine
+
+    @property
+    def null_pool_session_factory(self) -> async_sessionmaker[AsyncSession]:
+        if self._null_pool_session_factory is None:
+            self._null_pool_session_factory = async_sessionmaker(
+                self.null_pool_engine,
+                expire_on_commit=False,
+            )
+        return self._null_pool_session_factory
+
+    async def dispose(self) -> None:
+        """
+        Close the connections of all created engines and forget
+        the engines, so they are created again on the next access.
         """
-        name = re.sub(
-            r"(?<!^)(?=[A-Z])",
-            "_",
-            cls.__name__,
-        ).lower()
-        return inflect_engine.plural(name)  # type: ignore
+
+        engines = [self._engine, self._null_pool_engine]
+        if self._replica_set is not None:
+            engines.extend(self._replica_set.engines)
+        for engine in engines:
+            if engine is not None:
+                await engine.dispose()
+        self.__init__()
+
+
+database = Database()
+
+
+@cache
+def pluralize(
+    name: str,
+) -> str:
+    """
+    Pluralize a snake_case name. ``inflect`` takes a second to import,
+    so it is imported only when a table name is not set explicitly.
+
+    :param name: Singular snake_case name.
+    :return: Plural snake_case name.
+    """
+
+    import inflect
+
+    return inflect.engine().plural(name)  # type: ignore
+
+
+def get_table_name(
+    class_name: str,
+) -> str:
+    """
+    Convert a `CamelCase` class name to a plural `snake_case` table name.
+
+    :param class_name: Name of the model class.
+    :return: Pluralized snake_case table name.
+    """
+
+    name = re.sub(
+        r"(?<!^)(?=[A-Z])",
+        "_",
+        class_name,
+    ).lower()
+    return pluralize(name)
+
+
+class Base(DeclarativeBase):
+    """
+    Base of the models. Table names are derived from the class names
+    by ``get_table_name``. Models set them explicitly to avoid
+    importing ``inflect`` at startup, and a test checks that
+    the explicit names follow the convention.
+    """
+
+    if TYPE_CHECKING:
+        # Lets the models assign a plain string.
+        __tablename__: str
+    else:
+
+        @declared_attr.directive
+        @classmethod
+        def __tablename__(cls) -> str:
+            """
+            Converts `CamelCase` class name
+            to plural `snake_case` table name.
+
+            :return: Pluralized snake_case table name.
+            """
+            return get_table_name(cls.__name__)
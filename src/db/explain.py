@@ -0,0 +1,46 @@
+from typing import Any
+
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.base import Executable
+from sqlalchemy.sql.elements import ClauseElement
+
+
+class Explain(Executable, ClauseElement):
+    """
+    ``EXPLAIN`` of a statement. Bound parameters
+    of the statement are passed to the database as is.
+
+    Example: ``Explain(select(Task), format="json", analyze=True)``.
+    """
+
+    inherit_cache = False
+
+    def __init__(
+        self,
+        statement: Executable,
+        **options: Any,
+    ) -> None:
+        """
+        :param statement: The statement to explain.
+        :param options: ``EXPLAIN`` options, e.g. ``format="json"``
+                        or ``buffers=True``.
+        """
+
+        self.statement = statement
+        self.explain_options = options
+
+
+@compiles(Explain, "postgresql")
+def compile_explain(
+    element: Explain,
+    compiler: Any,
+    **kwargs: Any,
+) -> str:
+    options = ", ".join(
+        f"{name.upper()} {str(value).upper()}"
+        for name, value in element.explain_options.items()
+    )
+    statement = compiler.process(element.statement, **kwargs)
+    if not options:
+        return f"EXPLAIN {statement}"
+    return f"EXPLAIN ({options}) {statement}"
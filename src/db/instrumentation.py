@@ -0,0 +1,159 @@
+import logging
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+from typing import Iterator
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.config import settings
+
+
+logger = logging.getLogger(__name__)
+
+
+class QueryStats:
+    """
+    Statements executed within a request or a test block.
+    """
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.duration = 0.0
+        self.statements: list[str] = []
+
+    def record(
+        self,
+        statement: str,
+        duration: float,
+    ) -> None:
+        self.count += 1
+        self.duration += duration
+        self.statements.append(statement)
+
+
+query_stats: ContextVar[QueryStats | None] = ContextVar(
+    "query_stats",
+    default=None,
+)
+
+
+@contextmanager
+def count_queries() -> Iterator[QueryStats]:
+    """
+    Count the statements executed in the enclosed block by instrumented
+    engines. The statements are also counted by the enclosing block.
+
+    :return: Context manager yielding the stats of the block.
+    """
+
+    outer_stats = query_stats.get()
+    stats = QueryStats()
+    token = query_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        query_stats.reset(token)
+        if outer_stats is not None:
+            outer_stats.count += stats.count
+            outer_stats.duration += stats.duration
+            outer_stats.statements.extend(stats.statements)
+
+
+def explain_analyze(
+    connection: Any,
+    statement: str,
+    parameters: Any,
+) -> str:
+    """
+    Execute the statement again with ``EXPLAIN (ANALYZE, BUFFERS)``
+    through a separate cursor of the same DBAPI connection,
+    so the events do not fire and the original result is kept.
+
+    :param connection: Connection that executed the statement.
+    :param statement: Statement as sent to the driver.
+    :param parameters: Parameters as sent to the driver.
+    :return: The plan in the text format.
+    """
+
+    cursor = connection.connection.dbapi_connection.cursor()
+    try:
+        cursor.execute(f"EXPLAIN (ANALYZE, BUFFERS) {statement}", parameters)
+        return "\n".join(row[0] for row in cursor.fetchall())
+    finally:
+        cursor.close()
+
+
+def log_slow_query(
+    connection: Any,
+    statement: str,
+    parameters: Any,
+    duration: float,
+    executemany: bool,
+) -> None:
+    logger.warning(
+        "Slow query (%.1f ms): %s\nParameters: %r",
+        duration * 1000,
+        statement,
+        parameters,
+    )
+    # ANALYZE executes the statement, so only reads are explained.
+    if (
+        not settings.db.explain_slow_queries
+        or settings.app.mode == "PROD"
+        or executemany
+        or not statement.lstrip().upper().startswith("SELECT")
+    ):
+        return
+    try:
+        plan = explain_analyze(connection, statement, parameters)
+    except Exception:
+        logger.exception("Cannot explain the slow query")
+        return
+    logger.warning("Plan of the slow query:\n%s", plan)
+
+
+def instrument_queries(
+    engine: AsyncEngine,
+) -> None:
+    """
+    Count the statements of the engine per request and log the slow ones.
+
+    :param engine: The engine to instrument.
+    """
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def start_timer(
+        connection,
+        cursor,
+        statement,
+        parameters,
+        context,
+        executemany,
+    ):
+        context.query_started_at = time.perf_counter()
+
+    @event.listens_for(engine.sync_engine, "after_cursor_execute")
+    def stop_timer(
+        connection,
+        cursor,
+        statement,
+        parameters,
+        context,
+        executemany,
+    ):
+        duration = time.perf_counter() - context.query_started_at
+        stats = query_stats.get()
+        if stats is not None:
+            stats.record(statement, duration)
+        threshold = settings.db.slow_query_ms
+        if threshold >= 0 and duration * 1000 >= threshold:
+            log_slow_query(
+                connection,
+                statement,
+                parameters,
+                duration,
+                executemany,
+            )
@@ -1,8 +1,10 @@
 from src.db.mixins.pk import UUIDPkMixin
 from src.db.mixins.timestamp import TimestampMixin
+from src.db.mixins.version import VersionMixin
 
 
 __all__ = (
     "TimestampMixin",
     "UUIDPkMixin",
+    "VersionMixin",
 )
@@ -0,0 +1,16 @@
+from sqlalchemy import literal_column
+from sqlalchemy import text
+from sqlalchemy.orm import Mapped
+from sqlalchemy.orm import mapped_column
+
+
+class VersionMixin:
+    """
+    Mixin for optimistic concurrency control.
+    Every UPDATE of the row increments the version in the same statement.
+    """
+
+    version: Mapped[int] = mapped_column(
+        server_default=text("1"),
+        onupdate=literal_column("version + 1"),
+    )
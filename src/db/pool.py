@@ -0,0 +1,168 @@
+import asyncio
+import os
+import time
+from contextlib import AsyncExitStack
+from typing import Any
+from typing import Callable
+from typing import Coroutine
+
+from sqlalchemy import AsyncAdaptedQueuePool
+from sqlalchemy import event
+from sqlalchemy.exc import TimeoutError
+from sqlalchemy.ext.asyncio import AsyncConnection
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.schemas.internal import PoolStatsSchema
+from src.utils.metrics import Histogram
+from src.utils.timing import phase
+
+
+CHECKOUT_WAIT_BUCKETS = (
+    0.001,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1,
+    2.5,
+    5,
+    10,
+)
+
+
+class PoolMetrics:
+    """
+    Connection pool counters of a single engine.
+    """
+
+    def __init__(self) -> None:
+        self.checkout_wait = Histogram(CHECKOUT_WAIT_BUCKETS)
+        self.connections_opened = 0
+        self.overflow_opened = 0
+        self.timeouts = 0
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """
+    Queue pool that measures how long a checkout waits for a connection.
+    Pool events fire only after a connection is obtained,
+    so the wait time is measured around ``connect``.
+    The wait is also recorded as the ``pool`` phase of the request.
+    """
+
+    metrics: PoolMetrics | None = None
+
+    def connect(self):
+        started_at = time.perf_counter()
+        try:
+            with phase("pool"):
+                return super().connect()
+        except TimeoutError:
+            if self.metrics is not None:
+                self.metrics.timeouts += 1
+            raise
+        finally:
+            if self.metrics is not None:
+                self.metrics.checkout_wait.observe(
+                    time.perf_counter() - started_at
+                )
+
+    def recreate(self):
+        pool = super().recreate()
+        pool.metrics = self.metrics  # type: ignore
+        return pool
+
+
+instrumented_engines: dict[str, AsyncEngine] = {}
+
+
+def instrument_pool(
+    engine: AsyncEngine,
+    name: str,
+) -> PoolMetrics:
+    """
+    Attach metrics to the pool of an engine
+    created with ``InstrumentedAsyncQueuePool``.
+
+    :param engine: The engine to instrument.
+    :param name: Name of the engine in the pool stats.
+    :return: Metrics of the engine pool.
+    """
+
+    metrics = PoolMetrics()
+    engine.pool.metrics = metrics  # type: ignore
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def count_connection(dbapi_connection, connection_record):
+        metrics.connections_opened += 1
+        if engine.pool.overflow() > 0:  # type: ignore
+            metrics.overflow_opened += 1
+
+    instrumented_engines[name] = engine
+    return metrics
+
+
+async def warm_up_pool(
+    engine: AsyncEngine,
+    connections: int,
+    prepare: Callable[[AsyncConnection], Coroutine[Any, Any, None]]
+    | None = None,
+) -> int:
+    """
+    Open pool connections in advance, so the first requests
+    do not wait for connecting and authentication. The connections
+    are held at the same time, otherwise the pool would hand out
+    the same connection again, and are returned to the pool after.
+
+    :param engine: The engine to warm up.
+    :param connections: The number of connections to open,
+                        capped by the pool size.
+    :param prepare: Called on each connection, e.g. to prepare statements.
+    :return: The number of opened connections.
+    """
+
+    count = min(connections, engine.pool.size())  # type: ignore
+    async with AsyncExitStack() as stack:
+        # If a connection fails, the group cancels the others
+        # and raises, and the stack returns the opened connections.
+        async with asyncio.TaskGroup() as group:
+            tasks = [
+                group.create_task(
+                    stack.enter_async_context(engine.connect()),
+                )
+                for _ in range(count)
+            ]
+        if prepare is not None:
+            async with asyncio.TaskGroup() as group:
+                for task in tasks:
+                    group.create_task(prepare(task.result()))
+    return count
+
+
+def get_pool_stats() -> dict[str, PoolStatsSchema]:
+    """
+    Get the current state and counters of all instrumented pools
+    of this worker process.
+
+    :return: Pool stats by engine name.
+    """
+
+    stats = {}
+    for name, engine in instrumented_engines.items():
+        pool = engine.pool
+        metrics: PoolMetrics = pool.metrics  # type: ignore
+        stats[name] = PoolStatsSchema(
+            pid=os.getpid(),
+            size=pool.size(),  # type: ignore
+            checked_in=pool.checkedin(),  # type: ignore
+            checked_out=pool.checkedout(),  # type: ignore
+            overflow=max(pool.overflow(), 0),  # type: ignore
+            connections_opened=metrics.connections_opened,
+            overflow_opened=metrics.overflow_opened,
+            timeouts=metrics.timeouts,
+            checkout_wait_seconds=metrics.checkout_wait.snapshot(),
+        )
+    return stats
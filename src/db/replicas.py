@@ -0,0 +1,56 @@
+import itertools
+from typing import Literal
+
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+
+class ReplicaSet:
+    """
+    Chooses a read replica for a read-only transaction.
+    """
+
+    def __init__(
+        self,
+        engines: list[AsyncEngine],
+        strategy: Literal[
+            "round_robin",
+            "least_connections",
+        ] = "round_robin",
+    ) -> None:
+        """
+        :param engines: Engines connected to the replicas.
+        :param strategy: ``round_robin`` cycles through the replicas,
+                         ``least_connections`` picks the replica
+                         with the fewest checked out connections.
+        """
+
+        self.engines = engines
+        self.strategy = strategy
+        self._session_factories = {
+            engine: async_sessionmaker(
+                engine,
+                expire_on_commit=False,
+            )
+            for engine in engines
+        }
+        self._round_robin = itertools.cycle(engines)
+
+    def choose(self) -> async_sessionmaker[AsyncSession] | None:
+        """
+        Choose the session factory of the next replica.
+
+        :return: The session factory or None if there are no replicas.
+        """
+
+        if not self.engines:
+            return None
+        if self.strategy == "least_connections":
+            engine = min(
+                self.engines,
+                key=lambda engine: engine.pool.checkedout(),  # type: ignore
+            )
+        else:
+            engine = next(self._round_robin)
+        return self._session_factories[engine]
@@ -0,0 +1,8 @@
+from fastapi import status
+
+from src.exceptions.api.base import BaseHTTPException
+
+
+class CacheDisabledHTTPException(BaseHTTPException):
+    status_code = status.HTTP_404_NOT_FOUND
+    detail = "Cache is disabled"
@@ -0,0 +1,13 @@
+from fastapi import status
+
+from src.exceptions.api.base import BaseHTTPException
+
+
+class InvalidPaginationCursorHTTPException(BaseHTTPException):
+    status_code = status.HTTP_400_BAD_REQUEST
+    detail = "Invalid pagination cursor"
+
+
+class PaginationCursorSortingMismatchHTTPException(BaseHTTPException):
+    status_code = status.HTTP_400_BAD_REQUEST
+    detail = "Pagination cursor was issued for a different sorting"
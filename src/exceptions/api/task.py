@@ -3,6 +3,21 @@ from fastapi import status
 from src.exceptions.api.base import BaseHTTPException
 
 
+class CannotAddTaskHTTPException(BaseHTTPException):
+    status_code = status.HTTP_422_UNPROCESSABLE_ENTITY
+    detail = "Task cannot be added"
+
+
 class TaskDoesNotExistsHTTPException(BaseHTTPException):
     status_code = status.HTTP_404_NOT_FOUND
     detail = "Task does not exists"
+
+
+class TaskVersionConflictHTTPException(BaseHTTPException):
+    status_code = status.HTTP_409_CONFLICT
+    detail = "Task was modified by another request"
+
+
+class ArchivedTaskDoesNotExistsHTTPException(BaseHTTPException):
+    status_code = status.HTTP_404_NOT_FOUND
+    detail = "Archived task does not exists"
@@ -5,5 +5,17 @@ class TaskAlreadyExistsServiceException(BaseServiceException):
     detail = "Task already exists"
 
 
+class CannotAddTaskServiceException(BaseServiceException):
+    detail = "Task cannot be added"
+
+
 class TaskDoesNotExistsServiceException(BaseServiceException):
     detail = "Task does not exists"
+
+
+class TaskVersionConflictServiceException(BaseServiceException):
+    detail = "Task was modified by another request"
+
+
+class ArchivedTaskDoesNotExistsServiceException(BaseServiceException):
+    detail = "Archived task does not exists"
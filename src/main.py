@@ -1,13 +1,38 @@
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
 from fastapi import FastAPI
 
 from src.api import main_router
+from src.api.middlewares import ServerTimingMiddleware
+from src.config import settings
+from src.db.database import database
+from src.utils.warmup import warm_up_database
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """
+    Create the database engines when the worker starts and dispose
+    of them when it stops. With the warm-up enabled, the worker
+    accepts requests only after the connections are opened.
+    """
+
+    if settings.app.db_backend == "postgres":
+        database.connect()
+        if settings.db.warmup_connections > 0:
+            await warm_up_database(settings.db.warmup_connections)
+    yield
+    await database.dispose()
 
 
 app = FastAPI(
     title="Simple task manager API",
     version="0.1.0",
     root_path="/api",
+    lifespan=lifespan,
 )
 
 
+app.add_middleware(ServerTimingMiddleware)
 app.include_router(main_router)
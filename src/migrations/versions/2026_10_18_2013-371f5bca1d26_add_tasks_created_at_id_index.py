@@ -0,0 +1,28 @@
+"""Add tasks created_at id index
+
+Revision ID: 371f5bca1d26
+Revises: 4f40af8a5367
+Create Date: 2026-10-18 20:13:15.150497
+
+"""
+from typing import Sequence
+from typing import Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '371f5bca1d26'
+down_revision: Union[str, Sequence[str], None] = '4f40af8a5367'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_tasks_created_at_id', 'tasks', ['created_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_tasks_created_at_id', table_name='tasks')
@@ -0,0 +1,32 @@
+"""Add tasks filter and sort indexes
+
+Revision ID: 1177ed3114bf
+Revises: 371f5bca1d26
+Create Date: 2026-10-18 20:28:58.984434
+
+"""
+from typing import Sequence
+from typing import Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '1177ed3114bf'
+down_revision: Union[str, Sequence[str], None] = '371f5bca1d26'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_tasks_status_created_at_id', 'tasks', ['status', 'created_at', 'id'], unique=False)
+    op.create_index('ix_tasks_status_updated_at_id', 'tasks', ['status', 'updated_at', 'id'], unique=False)
+    op.create_index('ix_tasks_updated_at_id', 'tasks', ['updated_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_tasks_updated_at_id', table_name='tasks')
+    op.drop_index('ix_tasks_status_updated_at_id', table_name='tasks')
+    op.drop_index('ix_tasks_status_created_at_id', table_name='tasks')
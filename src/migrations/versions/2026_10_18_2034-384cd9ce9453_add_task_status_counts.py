@@ -0,0 +1,109 @@
+"""Add task status counts
+
+Revision ID: 384cd9ce9453
+Revises: 61c623e57590
+Create Date: 2026-10-18 20:34:05.481371
+
+"""
+from typing import Sequence
+from typing import Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '384cd9ce9453'
+down_revision: Union[str, Sequence[str], None] = '61c623e57590'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+UPDATE_COUNTS_FUNCTION = """
+CREATE OR REPLACE FUNCTION update_task_status_counts()
+RETURNS trigger
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    target_shard smallint := floor(random() * 16);
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        INSERT INTO task_status_counts (status, shard, count)
+        SELECT status, target_shard, count(*)
+        FROM new_tasks
+        GROUP BY status
+        ON CONFLICT (status, shard) DO UPDATE
+        SET count = task_status_counts.count + EXCLUDED.count;
+    ELSIF TG_OP = 'DELETE' THEN
+        INSERT INTO task_status_counts (status, shard, count)
+        SELECT status, target_shard, -count(*)
+        FROM old_tasks
+        GROUP BY status
+        ON CONFLICT (status, shard) DO UPDATE
+        SET count = task_status_counts.count + EXCLUDED.count;
+    ELSIF TG_OP = 'UPDATE' THEN
+        INSERT INTO task_status_counts (status, shard, count)
+        SELECT status, target_shard, sum(delta)
+        FROM (
+            SELECT status, 1 AS delta FROM new_tasks
+            UNION ALL
+            SELECT status, -1 AS delta FROM old_tasks
+        ) AS changes
+        GROUP BY status
+        HAVING sum(delta) <> 0
+        ON CONFLICT (status, shard) DO UPDATE
+        SET count = task_status_counts.count + EXCLUDED.count;
+    ELSE
+        DELETE FROM task_status_counts;
+    END IF;
+    RETURN NULL;
+END;
+$$
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('task_status_counts',
+    sa.Column('status', postgresql.ENUM('CREATED', 'IN_PROGRESS', 'COMPLETED', name='task_status', create_type=False), nullable=False),
+    sa.Column('shard', sa.SmallInteger(), nullable=False),
+    sa.Column('count', sa.BigInteger(), nullable=False),
+    sa.PrimaryKeyConstraint('status', 'shard')
+    )
+    # Lock the table, so no write is counted twice or missed
+    # between the backfill and the creation of the triggers.
+    op.execute('LOCK TABLE tasks IN SHARE MODE')
+    op.execute(
+        'INSERT INTO task_status_counts (status, shard, count) '
+        'SELECT status, 0, count(*) FROM tasks GROUP BY status'
+    )
+    op.execute(UPDATE_COUNTS_FUNCTION)
+    op.execute(
+        'CREATE TRIGGER tasks_count_insert AFTER INSERT ON tasks '
+        'REFERENCING NEW TABLE AS new_tasks '
+        'FOR EACH STATEMENT EXECUTE FUNCTION update_task_status_counts()'
+    )
+    op.execute(
+        'CREATE TRIGGER tasks_count_update AFTER UPDATE ON tasks '
+        'REFERENCING OLD TABLE AS old_tasks NEW TABLE AS new_tasks '
+        'FOR EACH STATEMENT EXECUTE FUNCTION update_task_status_counts()'
+    )
+    op.execute(
+        'CREATE TRIGGER tasks_count_delete AFTER DELETE ON tasks '
+        'REFERENCING OLD TABLE AS old_tasks '
+        'FOR EACH STATEMENT EXECUTE FUNCTION update_task_status_counts()'
+    )
+    op.execute(
+        'CREATE TRIGGER tasks_count_truncate AFTER TRUNCATE ON tasks '
+        'FOR EACH STATEMENT EXECUTE FUNCTION update_task_status_counts()'
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute('DROP TRIGGER tasks_count_truncate ON tasks')
+    op.execute('DROP TRIGGER tasks_count_delete ON tasks')
+    op.execute('DROP TRIGGER tasks_count_update ON tasks')
+    op.execute('DROP TRIGGER tasks_count_insert ON tasks')
+    op.execute('DROP FUNCTION update_task_status_counts()')
+    op.drop_table('task_status_counts')
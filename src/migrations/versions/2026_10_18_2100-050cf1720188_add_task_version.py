@@ -0,0 +1,31 @@
+"""add task version
+
+Revision ID: 050cf1720188
+Revises: 384cd9ce9453
+Create Date: 2026-10-18 21:00:09.812033
+
+"""
+from typing import Sequence
+from typing import Union
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '050cf1720188'
+down_revision: Union[str, Sequence[str], None] = '384cd9ce9453'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # A constant default is stored in the catalog,
+    # so existing rows are not rewritten.
+    op.add_column('tasks', sa.Column('version', sa.Integer(), server_default=sa.text('1'), nullable=False))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('tasks', 'version')
@@ -0,0 +1,46 @@
+"""add archived tasks
+
+Revision ID: 36569b7c2318
+Revises: 050cf1720188
+Create Date: 2026-10-18 21:07:13.120271
+
+"""
+from typing import Sequence
+from typing import Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '36569b7c2318'
+down_revision: Union[str, Sequence[str], None] = '050cf1720188'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Monthly partitions are created by the archiver on demand.
+    op.create_table('archived_tasks',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('name', sa.String(length=100), nullable=False),
+    sa.Column('description', sa.String(length=2000), nullable=False),
+    sa.Column('status', postgresql.ENUM('CREATED', 'IN_PROGRESS', 'COMPLETED', name='task_status', create_type=False), nullable=False),
+    sa.Column('created_at', sa.TIMESTAMP(timezone=True), nullable=False),
+    sa.Column('updated_at', sa.TIMESTAMP(timezone=True), nullable=False),
+    sa.Column('version', sa.Integer(), nullable=False),
+    sa.Column('archived_at', sa.TIMESTAMP(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.PrimaryKeyConstraint('id', 'updated_at'),
+    postgresql_partition_by='RANGE (updated_at)'
+    )
+    op.create_index('ix_archived_tasks_created_at_id', 'archived_tasks', ['created_at', 'id'], unique=False)
+    op.create_index('ix_archived_tasks_updated_at_id', 'archived_tasks', ['updated_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_archived_tasks_updated_at_id', table_name='archived_tasks')
+    op.drop_index('ix_archived_tasks_created_at_id', table_name='archived_tasks')
+    op.drop_table('archived_tasks')
@@ -0,0 +1,117 @@
+import uuid
+from datetime import datetime
+from datetime import timezone
+
+from sqlalchemy import TIMESTAMP
+from sqlalchemy import UUID
+from sqlalchemy import Index
+from sqlalchemy import String
+from sqlalchemy import TextClause
+from sqlalchemy import func
+from sqlalchemy import text
+from sqlalchemy.orm import Mapped
+from sqlalchemy.orm import mapped_column
+
+from src.config import TaskStatus
+from src.db import Base
+from src.models.task import task_status_enum
+
+
+class ArchivedTask(Base):
+    """
+    Completed task moved out of ``tasks`` by the archiver.
+    The table is partitioned by the month of ``updated_at``,
+    i.e. of the completion, so a whole month can be detached
+    or dropped at once. Partitions are created by the archiver.
+    """
+
+    __tablename__ = "archived_tasks"
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        primary_key=True,
+    )
+    name: Mapped[str] = mapped_column(
+        String(100),
+    )
+    description: Mapped[str] = mapped_column(
+        String(2000),
+    )
+    status: Mapped[TaskStatus] = mapped_column(
+        task_status_enum,
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP(timezone=True),
+    )
+    # The partition key has to be a part of the primary key
+    updated_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP(timezone=True),
+        primary_key=True,
+    )
+    version: Mapped[int]
+    archived_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP(timezone=True),
+        server_default=func.now(),
+    )
+
+    __table_args__ = (
+        Index(
+            "ix_archived_tasks_created_at_id",
+            "created_at",
+            "id",
+        ),
+        Index(
+            "ix_archived_tasks_updated_at_id",
+            "updated_at",
+            "id",
+        ),
+        {"postgresql_partition_by": "RANGE (updated_at)"},
+    )
+
+
+def get_month_start(
+    moment: datetime,
+) -> datetime:
+    """
+    Get the start of the UTC month of a moment.
+
+    :param moment: An aware datetime.
+    :return: Midnight of the first day of the month in UTC.
+    """
+
+    return moment.astimezone(timezone.utc).replace(
+        day=1,
+        hour=0,
+        minute=0,
+        second=0,
+        microsecond=0,
+    )
+
+
+def get_next_month_start(
+    month_start: datetime,
+) -> datetime:
+    if month_start.month == 12:
+        return month_start.replace(year=month_start.year + 1, month=1)
+    return month_start.replace(month=month_start.month + 1)
+
+
+def build_month_partition_ddl(
+    month_start: datetime,
+) -> TextClause:
+    """
+    Build the DDL of the partition of ``archived_tasks``
+    for a month, which does nothing if the partition exists.
+
+    :param month_start: Start of the month from ``get_month_start``.
+    :return: The ``CREATE TABLE`` statement.
+    """
+
+    table = ArchivedTask.__tablename__
+    month_end = get_next_month_start(month_start)
+    return text(
+        f"CREATE TABLE IF NOT EXISTS {table}_{month_start:%Y_%m} "
+        f"PARTITION OF {table} "
+        f"FOR VALUES FROM ('{month_start.isoformat()}') "
+        f"TO ('{month_end.isoformat()}')"
+    )
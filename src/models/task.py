@@ -1,5 +1,8 @@
+from sqlalchemy import Computed
 from sqlalchemy import Enum
+from sqlalchemy import Index
 from sqlalchemy import String
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import Mapped
 from sqlalchemy.orm import mapped_column
 
@@ -7,13 +10,24 @@ from src.config import TaskStatus
 from src.db import Base
 from src.db.mixins import TimestampMixin
 from src.db.mixins import UUIDPkMixin
+from src.db.mixins import VersionMixin
+
+
+# Text search configuration of the search vector and search queries.
+# Changing it requires a migration that regenerates ``search_vector``.
+SEARCH_CONFIG = "english"
+
+task_status_enum = Enum(TaskStatus, name="task_status")
 
 
 class Task(
     Base,
     UUIDPkMixin,
     TimestampMixin,
+    VersionMixin,
 ):
+    __tablename__ = "tasks"
+
     name: Mapped[str] = mapped_column(
         String(100),
     )
@@ -22,6 +36,46 @@ class Task(
         server_default="",
     )
     status: Mapped[TaskStatus] = mapped_column(
-        Enum(TaskStatus, name="task_status"),
+        task_status_enum,
         default=TaskStatus.CREATED,
     )
+    # Name matches rank higher than description matches.
+    search_vector: Mapped[str] = mapped_column(
+        TSVECTOR,
+        Computed(
+            f"setweight(to_tsvector('{SEARCH_CONFIG}', name), 'A') || "
+            f"setweight(to_tsvector('{SEARCH_CONFIG}', description), 'B')",
+            persisted=True,
+        ),
+        deferred=True,
+    )
+
+    __table_args__ = (
+        Index(
+            "ix_tasks_created_at_id",
+            "created_at",
+            "id",
+        ),
+        Index(
+            "ix_tasks_updated_at_id",
+            "updated_at",
+            "id",
+        ),
+        Index(
+            "ix_tasks_status_created_at_id",
+            "status",
+            "created_at",
+            "id",
+        ),
+        Index(
+            "ix_tasks_status_updated_at_id",
+            "status",
+            "updated_at",
+            "id",
+        ),
+        Index(
+            "ix_tasks_search_vector",
+            "search_vector",
+            postgresql_using="gin",
+        ),
+    )
@@ -0,0 +1,119 @@
+from sqlalchemy import DDL
+from sqlalchemy import BigInteger
+from sqlalchemy import SmallInteger
+from sqlalchemy import event
+from sqlalchemy.orm import Mapped
+from sqlalchemy.orm import mapped_column
+
+from src.config import TaskStatus
+from src.db import Base
+from src.models.task import task_status_enum
+
+
+# Each write statement adds its deltas to a random shard,
+# so concurrent transactions rarely wait for the same counter row.
+# The count of a status is the sum over its shards.
+COUNTER_SHARDS = 16
+
+UPDATE_COUNTS_FUNCTION = DDL(
+    f"""
+    CREATE OR REPLACE FUNCTION update_task_status_counts()
+    RETURNS trigger
+    LANGUAGE plpgsql
+    AS $$
+    DECLARE
+        target_shard smallint := floor(random() * {COUNTER_SHARDS});
+    BEGIN
+        IF TG_OP = 'INSERT' THEN
+            INSERT INTO task_status_counts (status, shard, count)
+            SELECT status, target_shard, count(*)
+            FROM new_tasks
+            GROUP BY status
+            ON CONFLICT (status, shard) DO UPDATE
+            SET count = task_status_counts.count + EXCLUDED.count;
+        ELSIF TG_OP = 'DELETE' THEN
+            INSERT INTO task_status_counts (status, shard, count)
+            SELECT status, target_shard, -count(*)
+            FROM old_tasks
+            GROUP BY status
+            ON CONFLICT (status, shard) DO UPDATE
+            SET count = task_status_counts.count + EXCLUDED.count;
+        ELSIF TG_OP = 'UPDATE' THEN
+            INSERT INTO task_status_counts (status, shard, count)
+            SELECT status, target_shard, sum(delta)
+            FROM (
+                SELECT status, 1 AS delta FROM new_tasks
+                UNION ALL
+                SELECT status, -1 AS delta FROM old_tasks
+            ) AS changes
+            GROUP BY status
+            HAVING sum(delta) <> 0
+            ON CONFLICT (status, shard) DO UPDATE
+            SET count = task_status_counts.count + EXCLUDED.count;
+        ELSE
+            DELETE FROM task_status_counts;
+        END IF;
+        RETURN NULL;
+    END;
+    $$
+    """
+)
+
+COUNT_TRIGGERS = (
+    DDL(
+        "CREATE TRIGGER tasks_count_insert AFTER INSERT ON tasks "
+        "REFERENCING NEW TABLE AS new_tasks "
+        "FOR EACH STATEMENT EXECUTE FUNCTION update_task_status_counts()"
+    ),
+    DDL(
+        "CREATE TRIGGER tasks_count_update AFTER UPDATE ON tasks "
+        "REFERENCING OLD TABLE AS old_tasks NEW TABLE AS new_tasks "
+        "FOR EACH STATEMENT EXECUTE FUNCTION update_task_status_counts()"
+    ),
+    DDL(
+        "CREATE TRIGGER tasks_count_delete AFTER DELETE ON tasks "
+        "REFERENCING OLD TABLE AS old_tasks "
+        "FOR EACH STATEMENT EXECUTE FUNCTION update_task_status_counts()"
+    ),
+    DDL(
+        "CREATE TRIGGER tasks_count_truncate AFTER TRUNCATE ON tasks "
+        "FOR EACH STATEMENT EXECUTE FUNCTION update_task_status_counts()"
+    ),
+)
+
+
+class TaskStatusCount(Base):
+    """
+    Number of tasks per status, kept current
+    by statement-level triggers on the ``tasks`` table.
+    """
+
+    __tablename__ = "task_status_counts"
+
+    status: Mapped[TaskStatus] = mapped_column(
+        task_status_enum,
+        primary_key=True,
+    )
+    shard: Mapped[int] = mapped_column(
+        SmallInteger,
+        primary_key=True,
+    )
+    count: Mapped[int] = mapped_column(
+        BigInteger,
+        default=0,
+    )
+
+
+# Migrations create the triggers themselves, these listeners
+# cover databases created by ``Base.metadata.create_all``.
+event.listen(
+    Base.metadata,
+    "after_create",
+    UPDATE_COUNTS_FUNCTION,
+)
+for trigger in COUNT_TRIGGERS:
+    event.listen(
+        Base.metadata,
+        "after_create",
+        trigger,
+    )
@@ -1,4 +1,8 @@
+from src.repositories.archived_task import ArchivedTaskRepository
 from src.repositories.task import TaskRepository
 
 
-__all__ = ("TaskRepository",)
+__all__ = (
+    "ArchivedTaskRepository",
+    "TaskRepository",
+)
@@ -0,0 +1,152 @@
+from datetime import datetime
+from typing import cast
+
+from sqlalchemy import Insert
+from sqlalchemy import Table
+from sqlalchemy import bindparam
+from sqlalchemy import delete
+from sqlalchemy import func
+from sqlalchemy import insert
+from sqlalchemy import select
+
+from src.config import TaskStatus
+from src.models.archived_task import ArchivedTask
+from src.models.archived_task import build_month_partition_ddl
+from src.models.archived_task import get_month_start
+from src.models.archived_task import get_next_month_start
+from src.models.task import Task
+from src.repositories.base import BaseRepository
+from src.repositories.mappers.task import ArchivedTaskDataMapper
+from src.utils.timing import timed
+
+
+# Columns copied from ``tasks``, ``archived_at`` is set by the database.
+ARCHIVED_COLUMNS = (
+    "id",
+    "name",
+    "description",
+    "status",
+    "created_at",
+    "updated_at",
+    "version",
+)
+
+
+class ArchivedTaskRepository(BaseRepository):
+    model = ArchivedTask
+    mapper = ArchivedTaskDataMapper
+
+    @timed("db")
+    async def get_oldest_archivable(
+        self,
+        completed_before: datetime,
+    ) -> datetime | None:
+        """
+        Get the completion time of the oldest task to archive.
+
+        :param completed_before: Only tasks completed earlier are archived.
+        :return: ``updated_at`` of the task or None if there is none.
+        """
+
+        # fmt: off
+        query = self._get_statement(
+            ("get_oldest_archivable",),
+            lambda: (
+                select(func.min(Task.updated_at))
+                .where(
+                    Task.status == TaskStatus.COMPLETED,
+                    Task.updated_at < bindparam("completed_before"),
+                )
+            ),
+        )
+        # fmt: on
+        result = await self.session.execute(
+            query,
+            {"completed_before": completed_before},
+        )
+        return result.scalar_one()
+
+    @timed("db")
+    async def create_partitions(
+        self,
+        start: datetime,
+        end: datetime,
+    ) -> None:
+        """
+        Create the missing monthly partitions for a period.
+
+        :param start: The first moment of the period.
+        :param end: The last moment of the period.
+        """
+
+        month_start = get_month_start(start)
+        while month_start <= end:
+            await self.session.execute(build_month_partition_ddl(month_start))
+            month_start = get_next_month_start(month_start)
+
+    @timed("db")
+    async def archive_completed(
+        self,
+        completed_before: datetime,
+        limit: int,
+    ) -> int:
+        """
+        Move a batch of the oldest completed tasks to the archive
+        by one statement. Rows locked by other transactions are skipped
+        instead of waited for, so user requests are never blocked
+        for longer than the batch takes.
+
+        :param completed_before: Only tasks completed earlier are archived.
+        :param limit: The maximum number of tasks to move.
+        :return: The number of moved tasks.
+        """
+
+        query = self._get_statement(
+            ("archive_completed",),
+            self._build_archive_query,
+        )
+        result = await self.session.execute(
+            query,
+            {"completed_before": completed_before, "limit": limit},
+        )
+        return len(result.all())
+
+    @staticmethod
+    def _build_archive_query() -> Insert:
+        """
+        Build the statement moving tasks with bound parameters
+        ``completed_before`` and ``limit``.
+
+        :return: The ``INSERT`` with the ``DELETE`` in a CTE.
+        """
+
+        # fmt: off
+        batch = (
+            select(Task.id)
+            .where(
+                Task.status == TaskStatus.COMPLETED,
+                Task.updated_at < bindparam("completed_before"),
+            )
+            .order_by(Task.updated_at, Task.id)
+            .limit(bindparam("limit"))
+            .with_for_update(skip_locked=True)
+        )
+        moved = (
+            delete(Task)
+            .where(Task.id.in_(batch.scalar_subquery()))
+            .returning(
+                *(getattr(Task, column) for column in ARCHIVED_COLUMNS)
+            )
+            .cte("moved")
+        )
+        # A data-modifying CTE is only allowed at the top level,
+        # not in the SELECT of the INSERT. The INSERT is built
+        # on the table, since the session treats the parameters
+        # of an ORM INSERT as rows to insert.
+        return (
+            insert(cast(Table, ArchivedTask.__table__))
+            .from_select(ARCHIVED_COLUMNS, select(moved))
+            .add_cte(moved)
+            .returning(ArchivedTask.id)
+        )
+        # fmt: on
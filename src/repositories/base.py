@@ -1,23 +1,43 @@
 import uuid
+from datetime import datetime
 from typing import Any
+from typing import AsyncIterator
+from typing import Callable
 from typing import Generic
+from typing import Hashable
 from typing import Iterable
+from typing import Sequence
 from typing import TypeVar
 
 from pydantic import BaseModel
+from sqlalchemy import UUID
+from sqlalchemy import BindParameter
+from sqlalchemy import ColumnElement
+from sqlalchemy import Select
+from sqlalchemy import any_
+from sqlalchemy import bindparam
 from sqlalchemy import delete
+from sqlalchemy import func
 from sqlalchemy import insert
 from sqlalchemy import select
+from sqlalchemy import text
+from sqlalchemy import tuple_
 from sqlalchemy import update
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.exc import NoResultFound
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.sql.base import ExecutableOption
 
 from src.db import Base
+from src.db.explain import Explain
 from src.exceptions.repository.base import CannotAddObjectRepoException
 from src.exceptions.repository.base import ObjectNotFoundRepoException
 from src.repositories.mappers.base import BaseDataMapper
+from src.schemas.pagination import CursorSchema
+from src.schemas.sorting import SortingSchema
+from src.utils.cache import statement_cache
+from src.utils.timing import timed
 
 
 SchemaType = TypeVar(
@@ -25,6 +45,13 @@ SchemaType = TypeVar(
     bound=BaseModel,
 )
 
+# Pairs of a filtered field name and whether its value is a list
+WhereShape = tuple[tuple[str, bool], ...]
+
+RELTUPLES_QUERY = text(
+    "SELECT reltuples FROM pg_class WHERE oid = CAST(:table AS regclass)"
+)
+
 
 class BaseRepository(Generic[SchemaType]):
     """
@@ -34,6 +61,9 @@ class BaseRepository(Generic[SchemaType]):
 
     model: type[Base] = None  # type: ignore
     mapper: type[BaseDataMapper] = None  # type: ignore
+    # Lists are ordered by ``(<sort field>, id)``,
+    # so the order is stable for offset and keyset pagination.
+    default_sorting = SortingSchema(field="created_at")
 
     def __init__(
         self,
@@ -47,28 +77,422 @@ class BaseRepository(Generic[SchemaType]):
 
         self.session = session
 
+    def _get_statement(
+        self,
+        key: Hashable,
+        build: Callable[[], Any],
+    ) -> Any:
+        """
+        Get a pre-built statement of this repository from the
+        statement cache. Values must be passed on execution.
+
+        :param key: The shape of the statement.
+        :param build: Builds the statement on a cache miss.
+        :return: The statement.
+        """
+
+        return statement_cache.get_or_build((type(self), key), build)
+
+    @staticmethod
+    def _get_where(
+        ids: Sequence[uuid.UUID] | None = None,
+        filters: BaseModel | None = None,
+        **filter_by,
+    ) -> tuple[WhereShape, dict[str, Any]]:
+        """
+        Split WHERE conditions into their shape, which defines
+        the statement, and the values of its bound parameters.
+        Fields set to None are ignored.
+
+        :param ids: IDs of the entities to match.
+        :param filters: A Pydantic model with filter values.
+        :param filter_by: Column values to match with equality.
+        :return: The shape for ``_build_where`` and the parameters.
+        """
+
+        values: dict[str, Any] = {}
+        if ids is not None:
+            values["ids"] = list(ids)
+        if filters is not None:
+            values.update(filters.model_dump(exclude_none=True))
+        values.update(filter_by)
+        shape = tuple(
+            sorted(
+                (field, isinstance(value, list))
+                for field, value in values.items()
+            )
+        )
+        params = {f"where_{field}": value for field, value in values.items()}
+        return shape, params
+
+    def _build_where(
+        self,
+        shape: WhereShape,
+    ) -> list[ColumnElement[bool]]:
+        """
+        Build WHERE clauses with bound parameters ``where_<field>``.
+        Fields are mapped to model columns by name:
+        ``ids`` is a list of IDs, ``<column>_from`` and ``<column>_to``
+        are range bounds (inclusive and exclusive respectively),
+        list values are matched with IN and other values with equality.
+
+        :param shape: Pairs of a field name and whether its value is a list.
+        :return: A list of clauses to be combined with AND.
+        """
+
+        clauses: list[ColumnElement[bool]] = []
+        for field, is_list in shape:
+            name = f"where_{field}"
+            if field == "ids":
+                ids_param = bindparam(
+                    name,
+                    type_=ARRAY(UUID(as_uuid=True)),
+                )
+                id_column = self.model.id  # type: ignore
+                clauses.append(id_column == any_(ids_param))
+            elif field.endswith("_from"):
+                column = getattr(self.model, field.removesuffix("_from"))
+                clauses.append(column >= bindparam(name))
+            elif field.endswith("_to"):
+                column = getattr(self.model, field.removesuffix("_to"))
+                clauses.append(column < bindparam(name))
+            elif is_list:
+                column = getattr(self.model, field)
+                clauses.append(column.in_(bindparam(name, expanding=True)))
+            else:
+                clauses.append(getattr(self.model, field) == bindparam(name))
+        return clauses
+
+    @staticmethod
+    def _get_values_params(
+        values: dict[str, Any],
+    ) -> dict[str, Any]:
+        """
+        Name the new column values as bound parameters
+        of statements built by ``_build_values``.
+
+        :param values: Column values.
+        :return: Parameters ``value_<column>``.
+        """
+
+        return {f"value_{column}": value for column, value in values.items()}
+
+    @staticmethod
+    def _build_values(
+        columns: Iterable[str],
+    ) -> dict[str, BindParameter]:
+        """
+        Build bound parameters ``value_<column>`` for INSERT and UPDATE.
+
+        :param columns: Names of the columns to set.
+        :return: Mapping of column names to bound parameters.
+        """
+
+        return {column: bindparam(f"value_{column}") for column in columns}
+
+    def _get_schema_columns(self) -> list[Any]:
+        """
+        Get the table columns needed to build the domain schema.
+        Other columns, e.g. generated search vectors, are not selected.
+
+        :return: Columns named after the fields of the mapper schema.
+        """
+
+        columns = self.model.__table__.columns
+        return [columns[field] for field in self.mapper.schema.model_fields]
+
+    def _get_sort_columns(
+        self,
+        sorting: SortingSchema | None = None,
+    ) -> list[Any]:
+        """
+        Get the columns of the ``(<sort field>, id)`` sort key.
+
+        :param sorting: Sort field and direction, the default if None.
+        :return: Columns in the sort order.
+        """
+
+        sorting = sorting or self.default_sorting
+        return [
+            getattr(self.model, sorting.field),
+            self.model.id,  # type: ignore
+        ]
+
+    def _paginate(
+        self,
+        query: Select,
+        where_shape: WhereShape,
+        sorting: SortingSchema,
+        with_cursor: bool,
+    ) -> Select:
+        """
+        Filter and order the query and restrict it to one page.
+        The page is defined by the bound parameters
+        from ``_get_page_params``.
+
+        :param query: The query to paginate.
+        :param where_shape: The shape of the filters from ``_get_where``.
+        :param sorting: Sort field and direction.
+        :param with_cursor: If True, keyset pagination is used
+                            instead of offset.
+        :return: The paginated query.
+        """
+
+        sort_columns = self._get_sort_columns(sorting)
+        # fmt: off
+        query = (
+            query
+            .where(*self._build_where(where_shape))
+            .order_by(
+                *(
+                    column.desc() if sorting.descending else column.asc()
+                    for column in sort_columns
+                )
+            )
+            .limit(bindparam("limit"))
+        )
+        # fmt: on
+        if not with_cursor:
+            return query.offset(bindparam("offset"))
+        sort_column, id_column = sort_columns
+        sort_key = tuple_(sort_column, id_column)
+        cursor_key = tuple_(
+            bindparam("cursor_value", type_=sort_column.type),
+            bindparam("cursor_id", type_=id_column.type),
+        )
+        if sorting.descending:
+            return query.where(sort_key < cursor_key)
+        return query.where(sort_key > cursor_key)
+
+    @staticmethod
+    def _get_page_params(
+        limit: int,
+        offset: int = 0,
+        cursor: CursorSchema | None = None,
+    ) -> dict[str, Any]:
+        """
+        Get the bound parameters of a query built by ``_paginate``.
+
+        :param limit: The maximum number of rows to return.
+        :param offset: The number of rows to skip.
+                       Ignored when ``cursor`` is passed.
+        :param cursor: Position of the last row of the previous page.
+        :return: The parameters of the page.
+        """
+
+        if cursor is None:
+            return {"limit": limit, "offset": offset}
+        return {
+            "limit": limit,
+            "cursor_value": cursor.value,
+            "cursor_id": cursor.id,
+        }
+
+    @timed("db")
     async def get_all(
         self,
         limit: int,
-        offset: int,
+        offset: int = 0,
+        cursor: CursorSchema | None = None,
+        filters: BaseModel | None = None,
+        sorting: SortingSchema | None = None,
     ) -> list[SchemaType | Any]:
         """
-        Get all entities with pagination.
+        Get all entities matching the filters with sorting and pagination.
 
         :param limit: The maximum number of entities to return.
         :param offset: The number of entities to skip.
+                       Ignored when ``cursor`` is passed.
+        :param cursor: Position of the last entity of the previous page.
+                       If passed, keyset pagination is used instead of offset.
+        :param filters: A Pydantic model with filter values.
+        :param sorting: Sort field and direction, the default if None.
         :return: A list of domain entities.
         """
 
-        query = select(self.model).limit(limit).offset(offset)
-        result = await self.session.execute(query)
+        where_shape, params = self._get_where(filters=filters)
+        sorting = sorting or self.default_sorting
+        # Plain columns are selected instead of the ORM entity,
+        # so no model instances or identity map entries are created.
+        query = self._get_statement(
+            (
+                "get_all",
+                where_shape,
+                sorting.field,
+                sorting.descending,
+                cursor is not None,
+            ),
+            lambda: self._paginate(
+                select(*self._get_schema_columns()),
+                where_shape,
+                sorting,
+                cursor is not None,
+            ),
+        )
+        result = await self.session.execute(
+            query,
+            params | self._get_page_params(limit, offset, cursor),
+        )
+        return self.mapper.map_rows_to_domain_entities(
+            result.mappings().all(),
+        )  # type: ignore
+
+    @timed("db")
+    async def get_all_versions(
+        self,
+        limit: int,
+        offset: int = 0,
+        cursor: CursorSchema | None = None,
+        filters: BaseModel | None = None,
+        sorting: SortingSchema | None = None,
+    ) -> list[tuple[uuid.UUID, datetime]]:
+        """
+        Get only the IDs and modification times of the entities
+        on the same page as ``get_all`` would return.
+
+        :param limit: The maximum number of entities to return.
+        :param offset: The number of entities to skip.
+        :param cursor: Position of the last entity of the previous page.
+        :param filters: A Pydantic model with filter values.
+        :param sorting: Sort field and direction, the default if None.
+        :return: A list of ``(id, updated_at)`` pairs.
+        """
+
+        where_shape, params = self._get_where(filters=filters)
+        sorting = sorting or self.default_sorting
+        query = self._get_statement(
+            (
+                "get_all_versions",
+                where_shape,
+                sorting.field,
+                sorting.descending,
+                cursor is not None,
+            ),
+            lambda: self._paginate(
+                select(self.model.id, self.model.updated_at),  # type: ignore
+                where_shape,
+                sorting,
+                cursor is not None,
+            ),
+        )
+        result = await self.session.execute(
+            query,
+            params | self._get_page_params(limit, offset, cursor),
+        )
+        return [tuple(row) for row in result.all()]  # type: ignore
+
+    @timed("db")
+    async def count(
+        self,
+        filters: BaseModel | None = None,
+    ) -> int:
+        """
+        Count the entities matching the filters exactly.
+
+        :param filters: A Pydantic model with filter values.
+        :return: The number of matching entities.
+        """
+
+        where_shape, params = self._get_where(filters=filters)
         # fmt: off
-        return [
-            self.mapper.map_to_domain_entity(model)
-            for model in result.scalars().all()
-        ]
+        query = self._get_statement(
+            ("count", where_shape),
+            lambda: (
+                select(func.count())
+                .select_from(self.model)
+                .where(*self._build_where(where_shape))
+            ),
+        )
         # fmt: on
+        result = await self.session.execute(query, params)
+        return result.scalar_one()
 
+    @timed("db")
+    async def estimate_count(
+        self,
+        filters: BaseModel | None = None,
+    ) -> int:
+        """
+        Estimate the number of entities matching the filters
+        from the planner statistics without scanning the table.
+
+        :param filters: A Pydantic model with filter values.
+        :return: The estimated number of matching entities.
+        """
+
+        where_shape, params = self._get_where(filters=filters)
+        if not where_shape:
+            result = await self.session.execute(
+                RELTUPLES_QUERY,
+                {"table": self.model.__tablename__},
+            )
+            reltuples = result.scalar_one()
+            # -1 means that the table has never been analyzed.
+            if reltuples >= 0:
+                return int(reltuples)
+        # fmt: off
+        query = (
+            select(self.model.id)  # type: ignore
+            .where(*self._build_where(where_shape))
+        )
+        # fmt: on
+        result = await self.session.execute(
+            Explain(query, format="json"),
+            params,
+        )
+        return result.scalar_one()[0]["Plan"]["Plan Rows"]
+
+    async def stream_all(
+        self,
+        batch_size: int,
+    ) -> AsyncIterator[list[SchemaType | Any]]:
+        """
+        Stream all entities ordered by the sort key using a server-side cursor.
+        Rows are selected as plain tuples, so they are not kept
+        in the session identity map and memory usage stays bounded.
+
+        :param batch_size: The number of rows fetched from the cursor at once.
+        :return: An async iterator over batches of domain entities.
+        """
+
+        # fmt: off
+        query = self._get_statement(
+            ("stream_all",),
+            lambda: (
+                select(*self._get_schema_columns())
+                .order_by(*self._get_sort_columns())
+            ),
+        )
+        # fmt: on
+        result = await self.session.stream(
+            query,
+            execution_options={"yield_per": batch_size},
+        )
+        async for rows in result.mappings().partitions():
+            yield self.mapper.map_rows_to_domain_entities(rows)  # type: ignore
+
+    def _get_one_query(
+        self,
+        where_shape: WhereShape,
+    ) -> Select:
+        """
+        Get the cached query of a single model instance.
+
+        :param where_shape: The shape of the filters from ``_get_where``.
+        :return: The query.
+        """
+
+        # fmt: off
+        return self._get_statement(
+            ("get_one", where_shape),
+            lambda: (
+                select(self.model)
+                .where(*self._build_where(where_shape))
+            ),
+        )
+        # fmt: on
+
+    @timed("db")
     async def get_one_or_none(
         self,
         **filter_by,
@@ -80,18 +504,44 @@ class BaseRepository(Generic[SchemaType]):
         :return: A domain entity or None if no entity is found.
         """
 
-        # fmt: off
-        query = (
-            select(self.model)
-            .filter_by(**filter_by)
-        )
-        # fmt: on
-        result = await self.session.execute(query)
+        where_shape, params = self._get_where(**filter_by)
+        query = self._get_one_query(where_shape)
+        result = await self.session.execute(query, params)
         model = result.scalar_one_or_none()
         if model is None:
             return model
         return self.mapper.map_to_domain_entity(model)
 
+    @timed("db")
+    async def get_version(
+        self,
+        **filter_by,
+    ) -> int:
+        """
+        Get the version of a single entity without loading it.
+
+        :param filter_by: Keyword arguments to filter the query.
+        :return: The ``version`` value of the found entity.
+        :raises ObjectNotFoundRepoException: If no entity is found.
+        """
+
+        where_shape, params = self._get_where(**filter_by)
+        # fmt: off
+        query = self._get_statement(
+            ("get_version", where_shape),
+            lambda: (
+                select(self.model.version)  # type: ignore
+                .where(*self._build_where(where_shape))
+            ),
+        )
+        # fmt: on
+        result = await self.session.execute(query, params)
+        try:
+            return result.scalar_one()
+        except NoResultFound as ex:
+            raise ObjectNotFoundRepoException from ex
+
+    @timed("db")
     async def get_one(
         self,
         query_options: Iterable[ExecutableOption] | None = None,
@@ -108,15 +558,11 @@ class BaseRepository(Generic[SchemaType]):
         :raises ObjectNotFoundRepoException: If no entity is found.
         """
 
-        # fmt: off
-        query = (
-            select(self.model)
-            .filter_by(**filter_by)
-        )
-        # fmt: on
+        where_shape, params = self._get_where(**filter_by)
+        query = self._get_one_query(where_shape)
         if query_options is not None:
             query = query.options(*query_options)
-        result = await self.session.execute(query)
+        result = await self.session.execute(query, params)
 
         try:
             model = result.scalar_one()
@@ -125,6 +571,7 @@ class BaseRepository(Generic[SchemaType]):
 
         return self.mapper.map_to_domain_entity(model, with_rels=with_rels)
 
+    @timed("db")
     async def add(
         self,
         data: SchemaType,
@@ -138,72 +585,131 @@ class BaseRepository(Generic[SchemaType]):
                                               e.g., due to a unique constraint violation.
         """
 
+        values = data.model_dump()
         # fmt: off
-        stmt = (
-            insert(self.model)
-            .values(**data.model_dump())
-            .returning(self.model)
+        stmt = self._get_statement(
+            ("add", tuple(values)),
+            lambda: (
+                insert(self.model)
+                .values(self._build_values(values))
+                .returning(self.model)
+            ),
         )
         # fmt: on
         try:
-            result = await self.session.execute(stmt)
+            result = await self.session.execute(
+                stmt,
+                self._get_values_params(values),
+            )
             model = result.scalar_one()
         except IntegrityError as ex:
             raise CannotAddObjectRepoException from ex
         return self.mapper.map_to_domain_entity(model)
 
+    @timed("db")
     async def add_bulk(
         self,
         data: list[SchemaType],
-    ) -> None:
+        chunk_size: int | None = None,
+        only_ids: bool = False,
+    ) -> list[SchemaType | uuid.UUID | Any]:
         """
-        Add multiple entities to the database in a single operation.
+        Add multiple entities to the database using
+        multi-row inserts within the current transaction.
 
         :param data: A list of Pydantic models to be added.
+        :param chunk_size: The maximum number of rows per INSERT statement.
+                           If None, all rows are inserted by one statement.
+        :param only_ids: If True, return only the IDs of the new entities.
+        :return: The newly created domain entities or their IDs.
         :raises CannotAddObjectRepoException: If entities cannot be added.
         """
 
+        if not data:
+            return []
+        chunk_size = chunk_size or len(data)
+        returning = self.model.id if only_ids else self.model  # type: ignore
+        created = []
+        for start in range(0, len(data), chunk_size):
+            chunk = data[start : start + chunk_size]
+            # fmt: off
+            stmt = (
+                insert(self.model)
+                .values([item.model_dump() for item in chunk])
+                .returning(returning)
+            )
+            # fmt: on
+            try:
+                result = await self.session.execute(stmt)
+            except IntegrityError as ex:
+                raise CannotAddObjectRepoException from ex
+            created.extend(result.scalars().all())
+        if only_ids:
+            return created
         # fmt: off
-        stmt = (
-            insert(self.model)
-            .values([item.model_dump() for item in data])
-        )
+        return [
+            self.mapper.map_to_domain_entity(model)
+            for model in created
+        ]
         # fmt: on
-        try:
-            await self.session.execute(stmt)
-        except IntegrityError as ex:
-            raise CannotAddObjectRepoException from ex
 
+    @timed("db")
     async def update_one(
         self,
         data: SchemaType,
         partially: bool = False,
+        returning_entity: bool = False,
         **filter_by,
-    ) -> uuid.UUID:
+    ) -> uuid.UUID | SchemaType | Any:
         """
         Update a single entity matching the filter criteria.
 
         :param data: A Pydantic model with the new data.
         :param partially: If True, performs a partial update (excludes unset fields).
+        :param returning_entity: If True, return the whole updated entity
+                                 from the same statement instead of its ID.
         :param filter_by: Keyword arguments to find the entity to update.
-        :return: The ID of the updated entity.
+        :return: The ID of the updated entity or the entity itself.
         :raises ObjectNotFoundRepoException: If no entity matching the filter is found.
         """
 
+        values = data.model_dump(exclude_unset=partially)
+        where_shape, params = self._get_where(**filter_by)
+        # Values are bound on execution, so the session is synchronized
+        # by the returned primary keys instead of evaluating the criteria.
         # fmt: off
-        stmt = (
-            update(self.model)
-            .values(**data.model_dump(exclude_unset=partially))
-            .filter_by(**filter_by)
-            .returning(self.model.id)  # type: ignore
+        stmt = self._get_statement(
+            ("update_one", where_shape, tuple(values), returning_entity),
+            lambda: (
+                update(self.model)
+                .values(self._build_values(values))
+                .where(*self._build_where(where_shape))
+                .returning(
+                    *(
+                        self._get_schema_columns()
+                        if returning_entity
+                        else [self.model.id]  # type: ignore
+                    )
+                )
+                .execution_options(synchronize_session="fetch")
+            ),
         )
         # fmt: on
-        result = await self.session.execute(stmt)
-        try:
-            return result.scalar_one()
-        except NoResultFound as ex:
-            raise ObjectNotFoundRepoException from ex
-
+        result = await self.session.execute(
+            stmt,
+            params | self._get_values_params(values),
+        )
+        if not returning_entity:
+            try:
+                return result.scalar_one()
+            except NoResultFound as ex:
+                raise ObjectNotFoundRepoException from ex
+        row = result.mappings().one_or_none()
+        if row is None:
+            raise ObjectNotFoundRepoException
+        return self.mapper.map_rows_to_domain_entities([row])[0]
+
+    @timed("db")
     async def delete_one(
         self,
         **filter_by,
@@ -216,33 +722,91 @@ class BaseRepository(Generic[SchemaType]):
         :raises ObjectNotFoundRepoException: If no entity matching the filter is found.
         """
 
+        where_shape, params = self._get_where(**filter_by)
         # fmt: off
-        stmt = (
-            delete(self.model)
-            .filter_by(**filter_by)
-            .returning(self.model.id)  # type: ignore
+        stmt = self._get_statement(
+            ("delete_one", where_shape),
+            lambda: (
+                delete(self.model)
+                .where(*self._build_where(where_shape))
+                .returning(self.model.id)  # type: ignore
+                .execution_options(synchronize_session="fetch")
+            ),
         )
         # fmt: on
-        result = await self.session.execute(stmt)
+        result = await self.session.execute(stmt, params)
         try:
             return result.scalar_one()
         except NoResultFound as ex:
             raise ObjectNotFoundRepoException from ex
 
+    @timed("db")
+    async def update_bulk(
+        self,
+        data: SchemaType,
+        ids: Sequence[uuid.UUID] | None = None,
+        filters: BaseModel | None = None,
+        partially: bool = False,
+    ) -> list[uuid.UUID]:
+        """
+        Update all entities matching the IDs and filters
+        with a single UPDATE statement.
+
+        :param data: A Pydantic model with the new data.
+        :param ids: IDs of the entities to update.
+        :param filters: A Pydantic model with filter values.
+        :param partially: If True, performs a partial update (excludes unset fields).
+        :return: The IDs of the updated entities.
+        """
+
+        values = data.model_dump(exclude_unset=partially)
+        where_shape, params = self._get_where(ids, filters)
+        # fmt: off
+        stmt = self._get_statement(
+            ("update_bulk", where_shape, tuple(values)),
+            lambda: (
+                update(self.model)
+                .where(*self._build_where(where_shape))
+                .values(self._build_values(values))
+                .returning(self.model.id)  # type: ignore
+                .execution_options(synchronize_session=False)
+            ),
+        )
+        # fmt: on
+        result = await self.session.execute(
+            stmt,
+            params | self._get_values_params(values),
+        )
+        return list(result.scalars().all())
+
+    @timed("db")
     async def delete_bulk(
         self,
+        ids: Sequence[uuid.UUID] | None = None,
+        filters: BaseModel | None = None,
         **filter_by,
-    ) -> None:
+    ) -> list[uuid.UUID]:
         """
-        Delete multiple entities matching the filter criteria.
+        Delete all entities matching the IDs and filters
+        with a single DELETE statement.
 
+        :param ids: IDs of the entities to delete.
+        :param filters: A Pydantic model with filter values.
         :param filter_by: Keyword arguments to find the entities to delete.
+        :return: The IDs of the deleted entities.
         """
 
+        where_shape, params = self._get_where(ids, filters, **filter_by)
         # fmt: off
-        stmt = (
-            delete(self.model)
-            .filter_by(**filter_by)
+        stmt = self._get_statement(
+            ("delete_bulk", where_shape),
+            lambda: (
+                delete(self.model)
+                .where(*self._build_where(where_shape))
+                .returning(self.model.id)  # type: ignore
+                .execution_options(synchronize_session=False)
+            ),
         )
         # fmt: on
-        await self.session.execute(stmt)
+        result = await self.session.execute(stmt, params)
+        return list(result.scalars().all())
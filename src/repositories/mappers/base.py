@@ -1,9 +1,30 @@
+from functools import cache
+from typing import Any
 from typing import ClassVar
+from typing import Iterable
+from typing import Mapping
 from typing import Type
 
 from pydantic import BaseModel
+from pydantic import TypeAdapter
 
 from src.db import Base
+from src.utils.timing import timed
+
+
+@cache
+def get_list_adapter(
+    schema: Type[BaseModel],
+) -> TypeAdapter[list[Any]]:
+    """
+    Build the validator of a list of schemas once per schema.
+
+    :param schema: Pydantic schema of the list items.
+    :return: Type adapter for ``list[schema]``.
+    """
+
+    # The item type is only known at runtime, which is the point here.
+    return TypeAdapter(list[schema])  # pyright: ignore[reportInvalidTypeForm]
 
 
 class BaseDataMapper:
@@ -17,6 +38,7 @@ class BaseDataMapper:
     schema_with_rels: ClassVar[Type[BaseModel] | None] = None
 
     @classmethod
+    @timed("map")
     def map_to_domain_entity(
         cls,
         model_instance: Base,
@@ -40,6 +62,22 @@ class BaseDataMapper:
             from_attributes=True,
         )
 
+    @classmethod
+    @timed("map")
+    def map_rows_to_domain_entities(
+        cls,
+        rows: Iterable[Mapping[str, Any]],
+    ) -> list[BaseModel]:
+        """
+        Converts column mappings of Core result rows to Pydantic schemas
+        in a single validation call, bypassing ORM model instances.
+
+        :param rows: Result rows as mappings of column names to values.
+        :return: List of Pydantic schema instances.
+        """
+
+        return get_list_adapter(cls.schema).validate_python(rows)
+
     @classmethod
     def map_to_persistence_entity(
         cls,
@@ -1,8 +1,15 @@
+from src.models.archived_task import ArchivedTask
 from src.models.task import Task
 from src.repositories.mappers.base import BaseDataMapper
+from src.schemas.task import ArchivedTaskSchema
 from src.schemas.task import TaskSchema
 
 
 class TaskDataMapper(BaseDataMapper):
     model = Task
     schema = TaskSchema
+
+
+class ArchivedTaskDataMapper(BaseDataMapper):
+    model = ArchivedTask
+    schema = ArchivedTaskSchema
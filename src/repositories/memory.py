@@ -0,0 +1,648 @@
+import bisect
+import html
+import re
+import uuid
+from collections import defaultdict
+from datetime import datetime
+from datetime import timezone
+from itertools import islice
+from typing import Any
+from typing import AsyncIterator
+from typing import Callable
+from typing import Iterable
+from typing import Iterator
+from typing import Sequence
+
+from pydantic import BaseModel
+from sqlalchemy.sql.base import ExecutableOption
+
+from src.config import TaskStatus
+from src.exceptions.repository.base import CannotAddObjectRepoException
+from src.exceptions.repository.base import ObjectNotFoundRepoException
+from src.repositories.mappers.base import get_list_adapter
+from src.repositories.mappers.task import ArchivedTaskDataMapper
+from src.repositories.mappers.task import TaskDataMapper
+from src.schemas.pagination import CursorSchema
+from src.schemas.sorting import SortingSchema
+from src.schemas.task import TaskCreateSchema
+from src.schemas.task import TaskSchema
+from src.schemas.task import TaskSearchResultSchema
+from src.schemas.task import TaskUpdateSchema
+from src.utils.timing import timed
+
+
+Row = dict[str, Any]
+
+# Previous version of a row in a store, None if the row did not exist
+UndoLog = list[tuple["InMemoryTaskStore", uuid.UUID, Row | None]]
+
+WORD_PATTERN = re.compile(r"\w+")
+
+
+class InMemoryTaskStore:
+    """
+    Tasks kept in process memory: rows by ID plus secondary indexes
+    by status and by ``(created_at, id)`` in ascending order.
+    Archived tasks are kept in the nested ``archive`` store,
+    like in the ``archived_tasks`` table.
+    """
+
+    def __init__(
+        self,
+        with_archive: bool = True,
+    ) -> None:
+        """
+        :param with_archive: If False, the store has no archive,
+                             e.g. if it is an archive itself.
+        """
+
+        self.rows: dict[uuid.UUID, Row] = {}
+        self.by_status: dict[TaskStatus, set[uuid.UUID]] = defaultdict(set)
+        self.by_created_at: list[tuple[datetime, uuid.UUID]] = []
+        self.archive = (
+            InMemoryTaskStore(with_archive=False) if with_archive else None
+        )
+
+    def put(
+        self,
+        row: Row,
+    ) -> None:
+        """
+        Insert or replace a row and update the indexes.
+
+        :param row: The row with all task fields.
+        """
+
+        self.remove(row["id"])
+        self.rows[row["id"]] = row
+        self.by_status[row["status"]].add(row["id"])
+        bisect.insort(self.by_created_at, (row["created_at"], row["id"]))
+
+    def remove(
+        self,
+        row_id: uuid.UUID,
+    ) -> Row | None:
+        """
+        Remove a row and its index entries.
+
+        :param row_id: ID of the row.
+        :return: The removed row or None if there was no such row.
+        """
+
+        row = self.rows.pop(row_id, None)
+        if row is None:
+            return None
+        self.by_status[row["status"]].discard(row_id)
+        key = (row["created_at"], row_id)
+        del self.by_created_at[bisect.bisect_left(self.by_created_at, key)]
+        return row
+
+    def clear(self) -> None:
+        self.rows.clear()
+        self.by_status.clear()
+        self.by_created_at.clear()
+        if self.archive is not None:
+            self.archive.clear()
+
+
+class InMemoryTaskRepository:
+    """
+    Task repository over an ``InMemoryTaskStore`` with the same
+    contract as ``TaskRepository``. Changes are applied to the store
+    immediately, and their previous versions are appended to
+    the undo log of the transaction.
+
+    Full-text search matches lowercase words with a naive stemmer
+    instead of the PostgreSQL text search configuration.
+    """
+
+    mapper = TaskDataMapper
+    default_sorting = SortingSchema(field="created_at")
+
+    def __init__(
+        self,
+        store: InMemoryTaskStore,
+        undo_log: UndoLog,
+    ):
+        """
+        :param store: The store with the tasks.
+        :param undo_log: The undo log of the current transaction.
+        """
+
+        self.store = store
+        self.undo_log = undo_log
+
+    def _write(
+        self,
+        row_id: uuid.UUID,
+        row: Row | None,
+        store: InMemoryTaskStore | None = None,
+    ) -> None:
+        """
+        Replace or delete a row, remembering its previous version.
+
+        :param row_id: ID of the row.
+        :param row: The new version of the row, None to delete it.
+        :param store: The store of the row, the repository store if None.
+        """
+
+        store = store or self.store
+        self.undo_log.append((store, row_id, store.rows.get(row_id)))
+        if row is None:
+            store.remove(row_id)
+        else:
+            store.put(row)
+
+    @staticmethod
+    def _get_where(
+        ids: Sequence[uuid.UUID] | None = None,
+        filters: BaseModel | None = None,
+        **filter_by,
+    ) -> dict[str, Any]:
+        """
+        Collect the filter values the way ``BaseRepository`` does.
+        Naive datetimes are treated as UTC, as by ``timestamptz``.
+
+        :return: Filter values by field name.
+        """
+
+        values: dict[str, Any] = {}
+        if ids is not None:
+            values["ids"] = {uuid.UUID(str(row_id)) for row_id in ids}
+        if filters is not None:
+            values.update(filters.model_dump(exclude_none=True))
+        values.update(filter_by)
+        if "id" in values:
+            # The database coerces string IDs, and so does this.
+            values["id"] = uuid.UUID(str(values["id"]))
+        for field, value in values.items():
+            if isinstance(value, datetime) and value.tzinfo is None:
+                values[field] = value.replace(tzinfo=timezone.utc)
+        return values
+
+    @staticmethod
+    def _build_predicate(
+        values: dict[str, Any],
+    ) -> Callable[[Row], bool]:
+        """
+        Build a row predicate with the semantics of
+        ``BaseRepository._build_where``.
+
+        :param values: Filter values from ``_get_where``.
+        :return: True for matching rows.
+        """
+
+        checks: list[Callable[[Row], bool]] = []
+        for field, value in values.items():
+            if field == "ids":
+                checks.append(lambda row, ids=value: row["id"] in ids)
+            elif field.endswith("_from"):
+                column = field.removesuffix("_from")
+                checks.append(
+                    lambda row, column=column, bound=value: (
+                        row[column] >= bound
+                    )
+                )
+            elif field.endswith("_to"):
+                column = field.removesuffix("_to")
+                checks.append(
+                    lambda row, column=column, bound=value: (
+                        row[column] < bound
+                    )
+                )
+            elif isinstance(value, list):
+                checks.append(
+                    lambda row, column=field, options=set(value): (
+                        row[column] in options
+                    )
+                )
+            else:
+                checks.append(
+                    lambda row, column=field, expected=value: (
+                        row[column] == expected
+                    )
+                )
+        return lambda row: all(check(row) for check in checks)
+
+    def _get_candidates(
+        self,
+        values: dict[str, Any],
+    ) -> Iterable[Row]:
+        """
+        Narrow down the rows by ID or by the status index.
+        The result still has to be checked against all filters.
+
+        :param values: Filter values from ``_get_where``.
+        :return: Rows in no particular order.
+        """
+
+        rows = self.store.rows
+        if "ids" in values or "id" in values:
+            ids = values["ids"] if "ids" in values else [values["id"]]
+            return [rows[row_id] for row_id in ids if row_id in rows]
+        if "status" in values:
+            statuses = values["status"]
+            if not isinstance(statuses, list):
+                statuses = [statuses]
+            return [
+                rows[row_id]
+                for status in statuses
+                for row_id in self.store.by_status.get(status, ())
+            ]
+        return rows.values()
+
+    def _select(
+        self,
+        values: dict[str, Any],
+        sorting: SortingSchema | None = None,
+        cursor: CursorSchema | None = None,
+    ) -> Iterator[Row]:
+        """
+        Iterate over the matching rows in the ``(<sort field>, id)`` order.
+        Without ID filters, rows sorted by creation time are read
+        from the index lazily, so a page does not sort the store.
+
+        :param values: Filter values from ``_get_where``.
+        :param sorting: Sort field and direction, the default if None.
+        :param cursor: Position of the last row of the previous page.
+        :return: An iterator over the matching rows.
+        """
+
+        sorting = sorting or self.default_sorting
+        predicate = self._build_predicate(values)
+        cursor_key = None if cursor is None else (cursor.value, cursor.id)
+        if sorting.field == "created_at" and not (
+            values.keys() & {"ids", "id"}
+        ):
+            index = self.store.by_created_at
+            if sorting.descending:
+                end = len(index)
+                if cursor_key is not None:
+                    end = bisect.bisect_left(index, cursor_key)
+                keys: Iterable = reversed(index[:end])
+            else:
+                start = 0
+                if cursor_key is not None:
+                    start = bisect.bisect_right(index, cursor_key)
+                keys = islice(index, start, None)
+            rows = (self.store.rows[row_id] for _, row_id in keys)
+            return (row for row in rows if predicate(row))
+
+        def sort_key(row: Row) -> tuple:
+            return row[sorting.field], row["id"]
+
+        rows = [row for row in self._get_candidates(values) if predicate(row)]
+        if cursor_key is not None:
+            if sorting.descending:
+                rows = [row for row in rows if sort_key(row) < cursor_key]
+            else:
+                rows = [row for row in rows if sort_key(row) > cursor_key]
+        rows.sort(key=sort_key, reverse=sorting.descending)
+        return iter(rows)
+
+    def _find_one(
+        self,
+        **filter_by,
+    ) -> Row | None:
+        values = self._get_where(**filter_by)
+        return next(self._select(values), None)
+
+    @timed("db")
+    async def get_all(
+        self,
+        limit: int,
+        offset: int = 0,
+        cursor: CursorSchema | None = None,
+        filters: BaseModel | None = None,
+        sorting: SortingSchema | None = None,
+    ) -> list[TaskSchema | Any]:
+        rows = self._select(self._get_where(filters=filters), sorting, cursor)
+        if cursor is None:
+            rows = islice(rows, offset, None)
+        return self.mapper.map_rows_to_domain_entities(islice(rows, limit))
+
+    @timed("db")
+    async def get_all_versions(
+        self,
+        limit: int,
+        offset: int = 0,
+        cursor: CursorSchema | None = None,
+        filters: BaseModel | None = None,
+        sorting: SortingSchema | None = None,
+    ) -> list[tuple[uuid.UUID, datetime]]:
+        rows = self._select(self._get_where(filters=filters), sorting, cursor)
+        if cursor is None:
+            rows = islice(rows, offset, None)
+        return [(row["id"], row["updated_at"]) for row in islice(rows, limit)]
+
+    @timed("db")
+    async def count(
+        self,
+        filters: BaseModel | None = None,
+    ) -> int:
+        values = self._get_where(filters=filters)
+        if not values:
+            return len(self.store.rows)
+        predicate = self._build_predicate(values)
+        return sum(1 for row in self._get_candidates(values) if predicate(row))
+
+    async def estimate_count(
+        self,
+        filters: BaseModel | None = None,
+    ) -> int:
+        return await self.count(filters)
+
+    async def stream_all(
+        self,
+        batch_size: int,
+    ) -> AsyncIterator[list[TaskSchema | Any]]:
+        rows = self._select({})
+        while batch := list(islice(rows, batch_size)):
+            yield self.mapper.map_rows_to_domain_entities(batch)
+
+    @timed("db")
+    async def get_one_or_none(
+        self,
+        **filter_by,
+    ) -> TaskSchema | None | Any:
+        row = self._find_one(**filter_by)
+        if row is None:
+            return None
+        return self.mapper.map_to_domain_entity(row)  # type: ignore
+
+    @timed("db")
+    async def get_version(
+        self,
+        **filter_by,
+    ) -> int:
+        row = self._find_one(**filter_by)
+        if row is None:
+            raise ObjectNotFoundRepoException
+        return row["version"]
+
+    @timed("db")
+    async def get_one(
+        self,
+        query_options: Iterable[ExecutableOption] | None = None,
+        with_rels: bool = False,
+        **filter_by,
+    ) -> TaskSchema | Any:
+        row = self._find_one(**filter_by)
+        if row is None:
+            raise ObjectNotFoundRepoException
+        return self.mapper.map_to_domain_entity(
+            row,  # type: ignore
+            with_rels=with_rels,
+        )
+
+    def _insert(
+        self,
+        data: TaskCreateSchema,
+        now: datetime,
+    ) -> Row:
+        values = data.model_dump()
+        if values.get("status") is None:
+            # The column is NOT NULL, as in the database.
+            raise CannotAddObjectRepoException
+        row = {
+            "id": uuid.uuid4(),
+            **values,
+            "created_at": now,
+            "updated_at": now,
+            "version": 1,
+        }
+        self._write(row["id"], row)
+        return row
+
+    @timed("db")
+    async def add(
+        self,
+        data: TaskCreateSchema,
+    ) -> TaskSchema | Any:
+        return self.mapper.map_to_domain_entity(
+            self._insert(data, datetime.now(timezone.utc)),  # type: ignore
+        )
+
+    @timed("db")
+    async def add_bulk(
+        self,
+        data: list[TaskCreateSchema],
+        chunk_size: int | None = None,
+        only_ids: bool = False,
+    ) -> list[TaskSchema | uuid.UUID | Any]:
+        # All rows of a statement share the timestamp, like with now().
+        now = datetime.now(timezone.utc)
+        rows = [self._insert(item, now) for item in data]
+        if only_ids:
+            return [row["id"] for row in rows]
+        return self.mapper.map_rows_to_domain_entities(rows)
+
+    def _update(
+        self,
+        rows: Iterable[Row],
+        data: TaskUpdateSchema,
+        partially: bool,
+    ) -> list[uuid.UUID]:
+        values = data.model_dump(exclude_unset=partially)
+        now = datetime.now(timezone.utc)
+        updated_ids = []
+        for row in list(rows):
+            self._write(
+                row["id"],
+                {
+                    **row,
+                    **values,
+                    "updated_at": now,
+                    "version": row["version"] + 1,
+                },
+            )
+            updated_ids.append(row["id"])
+        return updated_ids
+
+    @timed("db")
+    async def update_one(
+        self,
+        data: TaskUpdateSchema,
+        partially: bool = False,
+        returning_entity: bool = False,
+        **filter_by,
+    ) -> uuid.UUID | TaskSchema | Any:
+        row = self._find_one(**filter_by)
+        if row is None:
+            raise ObjectNotFoundRepoException
+        row_id = self._update([row], data, partially)[0]
+        if not returning_entity:
+            return row_id
+        return self.mapper.map_to_domain_entity(
+            self.store.rows[row_id],  # type: ignore
+        )
+
+    @timed("db")
+    async def delete_one(
+        self,
+        **filter_by,
+    ) -> uuid.UUID:
+        row = self._find_one(**filter_by)
+        if row is None:
+            raise ObjectNotFoundRepoException
+        self._write(row["id"], None)
+        return row["id"]
+
+    @timed("db")
+    async def update_bulk(
+        self,
+        data: TaskUpdateSchema,
+        ids: Sequence[uuid.UUID] | None = None,
+        filters: BaseModel | None = None,
+        partially: bool = False,
+    ) -> list[uuid.UUID]:
+        rows = self._select(self._get_where(ids, filters))
+        return self._update(rows, data, partially)
+
+    @timed("db")
+    async def delete_bulk(
+        self,
+        ids: Sequence[uuid.UUID] | None = None,
+        filters: BaseModel | None = None,
+        **filter_by,
+    ) -> list[uuid.UUID]:
+        rows = list(self._select(self._get_where(ids, filters, **filter_by)))
+        for row in rows:
+            self._write(row["id"], None)
+        return [row["id"] for row in rows]
+
+    @staticmethod
+    def _stem(word: str) -> str:
+        word = word.lower()
+        return word[:-1] if len(word) > 3 and word.endswith("s") else word
+
+    @timed("db")
+    async def search(
+        self,
+        text: str,
+        limit: int,
+        offset: int = 0,
+    ) -> list[TaskSearchResultSchema | Any]:
+        included = set()
+        excluded = set()
+        for term in text.split():
+            target = excluded if term.startswith("-") else included
+            target.update(map(self._stem, WORD_PATTERN.findall(term)))
+        if not included:
+            return []
+
+        found = []
+        for row in self.store.rows.values():
+            name_words = set(
+                map(self._stem, WORD_PATTERN.findall(row["name"]))
+            )
+            description_words = set(
+                map(self._stem, WORD_PATTERN.findall(row["description"]))
+            )
+            words = name_words | description_words
+            if not included <= words or excluded & words:
+                continue
+            # Name matches weigh more, like the A and B weights
+            # of the search vector.
+            rank = sum(
+                1.0 if word in name_words else 0.4 for word in included
+            ) / len(included)
+            found.append((rank, row))
+        found.sort(key=lambda match: (-match[0], match[1]["id"]))
+
+        def highlight(match: re.Match) -> str:
+            word = match.group()
+            if self._stem(word) in included:
+                return f"<b>{word}</b>"
+            return word
+
+        return get_list_adapter(TaskSearchResultSchema).validate_python(
+            [
+                {
+                    **row,
+                    "rank": rank,
+                    "snippet": WORD_PATTERN.sub(
+                        highlight,
+                        html.unescape(f"{row['name']} {row['description']}"),
+                    ),
+                }
+                for rank, row in found[offset : offset + limit]
+            ]
+        )
+
+    @timed("db")
+    async def get_status_counts(self) -> dict[TaskStatus, int]:
+        return {
+            status: len(ids)
+            for status, ids in self.store.by_status.items()
+            if ids
+        }
+
+
+class InMemoryArchivedTaskRepository(InMemoryTaskRepository):
+    """
+    Archived task repository over the ``archive`` of a task store
+    with the same contract as ``ArchivedTaskRepository``.
+    """
+
+    mapper = ArchivedTaskDataMapper
+
+    def __init__(
+        self,
+        store: InMemoryTaskStore,
+        undo_log: UndoLog,
+        task_store: InMemoryTaskStore,
+    ):
+        """
+        :param store: The store with the archived tasks.
+        :param undo_log: The undo log of the current transaction.
+        :param task_store: The store to archive the tasks from.
+        """
+
+        super().__init__(store, undo_log)
+        self.task_store = task_store
+
+    def _get_archivable(
+        self,
+        completed_before: datetime,
+    ) -> list[Row]:
+        rows = [
+            self.task_store.rows[row_id]
+            for row_id in self.task_store.by_status[TaskStatus.COMPLETED]
+        ]
+        return sorted(
+            (row for row in rows if row["updated_at"] < completed_before),
+            key=lambda row: (row["updated_at"], row["id"]),
+        )
+
+    @timed("db")
+    async def get_oldest_archivable(
+        self,
+        completed_before: datetime,
+    ) -> datetime | None:
+        rows = self._get_archivable(completed_before)
+        return rows[0]["updated_at"] if rows else None
+
+    async def create_partitions(
+        self,
+        start: datetime,
+        end: datetime,
+    ) -> None:
+        # The store is not partitioned.
+        pass
+
+    @timed("db")
+    async def archive_completed(
+        self,
+        completed_before: datetime,
+        limit: int,
+    ) -> int:
+        rows = self._get_archivable(completed_before)[:limit]
+        now = datetime.now(timezone.utc)
+        for row in rows:
+            self._write(row["id"], None, self.task_store)
+            self._write(row["id"], {**row, "archived_at": now})
+        return len(rows)
+
+
+memory_store = InMemoryTaskStore()
@@ -1,8 +1,170 @@
+import uuid
+from typing import Any
+
+from sqlalchemy import Select
+from sqlalchemy import String
+from sqlalchemy import bindparam
+from sqlalchemy import func
+from sqlalchemy import literal
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import REGCONFIG
+
+from src.config import TaskStatus
+from src.exceptions.repository.base import ObjectNotFoundRepoException
+from src.models.task import SEARCH_CONFIG
 from src.models.task import Task
+from src.models.task_status_count import TaskStatusCount
 from src.repositories.base import BaseRepository
+from src.repositories.mappers.base import get_list_adapter
 from src.repositories.mappers.task import TaskDataMapper
+from src.schemas.task import TaskCreateSchema
+from src.schemas.task import TaskSearchResultSchema
+from src.schemas.task import TaskUpdateSchema
+from src.utils.timing import phase
+from src.utils.timing import timed
+
+
+# Options of ``ts_headline`` used to build search snippets.
+SNIPPET_OPTIONS = "StartSel=<b>, StopSel=</b>, MaxWords=35, MinWords=15"
 
 
 class TaskRepository(BaseRepository):
     model = Task
     mapper = TaskDataMapper
+
+    @timed("db")
+    async def search(
+        self,
+        text: str,
+        limit: int,
+        offset: int = 0,
+    ) -> list[TaskSearchResultSchema | Any]:
+        """
+        Full-text search over task names and descriptions,
+        ordered by relevance.
+
+        :param text: Search query in the web search syntax
+                     (quoted phrases, ``or``, ``-`` to exclude a word).
+        :param limit: The maximum number of tasks to return.
+        :param offset: The number of tasks to skip.
+        :return: Found tasks with their rank and highlighted snippet.
+        """
+
+        query = self._get_statement(("search",), self._build_search_query)
+        result = await self.session.execute(
+            query,
+            {
+                "text": text,
+                "limit": limit,
+                "offset": offset,
+            },
+        )
+        rows = result.mappings().all()
+        with phase("map"):
+            return get_list_adapter(TaskSearchResultSchema).validate_python(
+                rows,
+            )
+
+    def _build_search_query(self) -> Select:
+        """
+        Build the search query with bound parameters
+        ``text``, ``limit`` and ``offset``.
+
+        :return: The search query.
+        """
+
+        config = literal(SEARCH_CONFIG).cast(REGCONFIG)
+        ts_query = func.websearch_to_tsquery(
+            config,
+            bindparam("text", type_=String),
+        )
+        rank = func.ts_rank(Task.search_vector, ts_query)
+        # Matches are ranked using the GIN index, and snippets,
+        # which need the full text to be parsed again,
+        # are built only for the rows of the requested page.
+        # fmt: off
+        page = (
+            select(Task.id, rank.label("rank"))
+            .where(Task.search_vector.bool_op("@@")(ts_query))
+            .order_by(rank.desc(), Task.id)
+            .limit(bindparam("limit"))
+            .offset(bindparam("offset"))
+            .subquery()
+        )
+        return (
+            select(
+                *self._get_schema_columns(),
+                page.c.rank,
+                func.ts_headline(
+                    config,
+                    Task.name + " " + Task.description,
+                    ts_query,
+                    SNIPPET_OPTIONS,
+                ).label("snippet"),
+            )
+            .join(page, page.c.id == Task.id)
+            .order_by(page.c.rank.desc(), Task.id)
+        )
+        # fmt: on
+
+    async def warm_up(
+        self,
+        read_only: bool = False,
+    ) -> None:
+        """
+        Execute the statements of the most frequent requests,
+        so they are compiled by this process and prepared
+        on the connection of the session. A task is written
+        and deleted, so the caller must roll the transaction back.
+
+        :param read_only: If True, only reads are executed,
+                          e.g. on a replica.
+        """
+
+        await self.get_all(limit=1)
+        await self.get_status_counts()
+        await self.get_one_or_none(id=uuid.uuid4())
+        try:
+            await self.get_version(id=uuid.uuid4())
+        except ObjectNotFoundRepoException:
+            pass
+        if read_only:
+            return
+        task = await self.add(
+            TaskCreateSchema(
+                name="Warm-up",
+                description="",
+                status=TaskStatus.CREATED,
+            )
+        )
+        await self.update_one(
+            TaskUpdateSchema(status=TaskStatus.IN_PROGRESS),
+            partially=True,
+            id=task.id,
+        )
+        await self.delete_one(id=task.id)
+
+    @timed("db")
+    async def get_status_counts(self) -> dict[TaskStatus, int]:
+        """
+        Get the number of tasks per status from the counters
+        maintained by triggers, without reading the tasks.
+
+        :return: Mapping of statuses to the numbers of tasks.
+                 Statuses without tasks may be missing.
+        """
+
+        # fmt: off
+        query = self._get_statement(
+            ("get_status_counts",),
+            lambda: (
+                select(
+                    TaskStatusCount.status,
+                    func.sum(TaskStatusCount.count),
+                )
+                .group_by(TaskStatusCount.status)
+            ),
+        )
+        # fmt: on
+        result = await self.session.execute(query)
+        return {status: int(count) for status, count in result.tuples().all()}
@@ -13,5 +13,10 @@ class TimestampSchema(BaseModel):
     updated_at: datetime
 
 
+class BulkResultSchema(BaseModel):
+    matched: list[uuid.UUID]
+    missing: list[uuid.UUID]
+
+
 class BaseHTTPExceptionSchema(BaseModel):
     detail: str
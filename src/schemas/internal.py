@@ -0,0 +1,35 @@
+from pydantic import BaseModel
+
+
+class CacheStatsSchema(BaseModel):
+    size: int
+    max_size: int
+    hits: int
+    misses: int
+    evictions: int
+
+
+class StatementCacheStatsSchema(BaseModel):
+    size: int
+    hits: int
+    misses: int
+    hit_rate: float
+
+
+class HistogramSchema(BaseModel):
+    # Cumulative counts of observations by upper bound, as in Prometheus
+    buckets: dict[str, int]
+    count: int
+    sum: float
+
+
+class PoolStatsSchema(BaseModel):
+    pid: int
+    size: int
+    checked_in: int
+    checked_out: int
+    overflow: int
+    connections_opened: int
+    overflow_opened: int
+    timeouts: int
+    checkout_wait_seconds: HistogramSchema
@@ -1,12 +1,106 @@
+import base64
+import enum
+from datetime import datetime
 from typing import Annotated
+from typing import Any
+from typing import Generic
+from typing import TypeVar
 
 from fastapi import Query
 from pydantic import BaseModel
 
 from src.config import settings
+from src.schemas.base.schemas import UUIDSchema
+from src.schemas.sorting import SortingSchema
 
 
-class PaginationRequestSchema(BaseModel):
+ItemType = TypeVar("ItemType")
+
+
+class TotalMode(str, enum.Enum):
+    EXACT = "exact"
+    ESTIMATED = "estimated"
+    NONE = "none"
+
+
+class CursorSchema(UUIDSchema):
+    """
+    Position of the last returned entity in the
+    ``(<sort field>, id)`` keyset ordering. The sorting is encoded
+    too, since the position is meaningless in another ordering.
+    """
+
+    value: datetime
+    field: str
+    descending: bool = False
+
+    @classmethod
+    def after(
+        cls,
+        entity: Any,
+        sorting: SortingSchema,
+    ) -> "CursorSchema":
+        """
+        Build the cursor pointing right after the entity.
+
+        :param entity: The last entity of the page.
+        :param sorting: The sorting of the page.
+        :return: Cursor instance.
+        """
+
+        return cls(
+            id=entity.id,
+            value=getattr(entity, sorting.field),
+            field=sorting.field,
+            descending=sorting.descending,
+        )
+
+    def matches(
+        self,
+        sorting: SortingSchema,
+    ) -> bool:
+        """
+        Check that the cursor was issued for the sorting.
+
+        :param sorting: The sorting of the requested page.
+        :return: True if the sort field and direction are the same.
+        """
+
+        return (
+            self.field == sorting.field
+            and self.descending == sorting.descending
+        )
+
+    def encode(self) -> str:
+        """
+        Serialize the cursor into an opaque URL-safe token.
+
+        :return: Encoded cursor token.
+        """
+
+        return base64.urlsafe_b64encode(
+            self.model_dump_json().encode(),
+        ).decode()
+
+    @classmethod
+    def decode(
+        cls,
+        token: str,
+    ) -> "CursorSchema":
+        """
+        Restore the cursor from a token produced by ``encode``.
+
+        :param token: Encoded cursor token.
+        :return: Cursor instance.
+        :raises ValueError: If the token is malformed.
+        """
+
+        return cls.model_validate_json(
+            base64.urlsafe_b64decode(token.encode()),
+        )
+
+
+class OffsetPaginationRequestSchema(BaseModel):
     page: Annotated[
         int,
         Query(
@@ -24,6 +118,33 @@ class PaginationRequestSchema(BaseModel):
     ]
 
 
+class PaginationRequestSchema(OffsetPaginationRequestSchema):
+    cursor: Annotated[
+        str | None,
+        Query(
+            None,
+            description=(
+                "Opaque token from the `X-Next-Cursor` header. "
+                "When passed, `page` is ignored."
+            ),
+        ),
+    ]
+
+
 class PaginationSchema(BaseModel):
     limit: int
     offset: int
+    cursor: CursorSchema | None = None
+
+
+class PageSchema(BaseModel, Generic[ItemType]):
+    """
+    Page of entities with pagination metadata.
+    ``total`` is None if it was not requested.
+    """
+
+    items: list[ItemType]
+    total: int | None = None
+    has_next: bool
+    next_page: int | None = None
+    next_cursor: str | None = None
@@ -0,0 +1,13 @@
+import enum
+
+from pydantic import BaseModel
+
+
+class SortOrder(str, enum.Enum):
+    ASC = "asc"
+    DESC = "desc"
+
+
+class SortingSchema(BaseModel):
+    field: str
+    descending: bool = False
@@ -1,9 +1,16 @@
+import enum
+import uuid
+from datetime import datetime
 from typing import Annotated
+from typing import Self
 
 from annotated_types import MaxLen
+from annotated_types import MinLen
 from pydantic import BaseModel
+from pydantic import model_validator
 
 from src.config import TaskStatus
+from src.config import settings
 from src.schemas.base.schemas import TimestampSchema
 from src.schemas.base.schemas import UUIDSchema
 
@@ -20,7 +27,19 @@ class TaskCreateSchema(BaseModel):
     status: TaskStatus | None
 
 
+class TaskCreateWithIdSchema(
+    UUIDSchema,
+    TaskCreateSchema,
+):
+    pass
+
+
 class TaskUpdateSchema(BaseModel):
+    """
+    Fields to update. Omitted fields are left unchanged,
+    and none of the fields can be set to null.
+    """
+
     name: Annotated[
         str | None,
         MaxLen(100),
@@ -31,10 +50,87 @@ class TaskUpdateSchema(BaseModel):
     ] = None
     status: TaskStatus | None = None
 
+    @model_validator(mode="after")
+    def check_not_null(self) -> Self:
+        null_fields = sorted(
+            field
+            for field in self.model_fields_set
+            if getattr(self, field) is None
+        )
+        if null_fields:
+            raise ValueError(
+                f"Fields cannot be null: {', '.join(null_fields)}"
+            )
+        return self
+
 
 class TaskSchema(
     UUIDSchema,
     TimestampSchema,
     TaskCreateSchema,
 ):
-    pass
+    # Incremented by every update, see the ``If-Match`` header of PATCH
+    version: int
+
+
+class ArchivedTaskSchema(TaskSchema):
+    archived_at: datetime
+
+
+class TaskSearchResultSchema(TaskSchema):
+    rank: float
+    snippet: str
+
+
+class TaskStatsSchema(BaseModel):
+    total: int
+    by_status: dict[TaskStatus, int]
+
+
+class TaskFilterSchema(BaseModel):
+    """
+    Task filters. Range bounds are ``<column>_from`` (inclusive)
+    and ``<column>_to`` (exclusive).
+    """
+
+    status: Annotated[
+        list[TaskStatus] | None,
+        MinLen(1),
+    ] = None
+    created_at_from: datetime | None = None
+    created_at_to: datetime | None = None
+    updated_at_from: datetime | None = None
+    updated_at_to: datetime | None = None
+
+
+class TaskSortField(str, enum.Enum):
+    CREATED_AT = "created_at"
+    UPDATED_AT = "updated_at"
+
+
+class TaskSelectionSchema(BaseModel):
+    """
+    Selects tasks for a bulk operation
+    either by a list of IDs or by filters.
+    """
+
+    ids: Annotated[
+        list[uuid.UUID] | None,
+        MinLen(1),
+        MaxLen(settings.bulk.max_entities),
+    ] = None
+    filters: TaskFilterSchema | None = None
+
+    @model_validator(mode="after")
+    def check_selection(self) -> Self:
+        if (self.ids is None) == (self.filters is None):
+            raise ValueError("Exactly one of `ids` or `filters` is required")
+        if self.filters is not None and not self.filters.model_dump(
+            exclude_none=True,
+        ):
+            raise ValueError("At least one filter is required")
+        return self
+
+
+class TaskBulkUpdateSchema(TaskSelectionSchema):
+    data: TaskUpdateSchema
@@ -1,4 +1,8 @@
+from src.services.archived_task import ArchivedTaskService
 from src.services.task import TaskService
 
 
-__all__ = ("TaskService",)
+__all__ = (
+    "ArchivedTaskService",
+    "TaskService",
+)
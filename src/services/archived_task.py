@@ -0,0 +1,116 @@
+import asyncio
+import logging
+import uuid
+from datetime import datetime
+from datetime import timedelta
+from datetime import timezone
+
+from src.exceptions.repository.base import ObjectNotFoundRepoException
+from src.exceptions.service.task import (
+    ArchivedTaskDoesNotExistsServiceException,
+)
+from src.schemas.pagination import PaginationSchema
+from src.schemas.sorting import SortingSchema
+from src.schemas.task import ArchivedTaskSchema
+from src.schemas.task import TaskFilterSchema
+from src.services.base import BaseService
+
+
+logger = logging.getLogger(__name__)
+
+
+class ArchivedTaskService(BaseService):
+    async def get_one(
+        self,
+        task_id: uuid.UUID,
+    ) -> ArchivedTaskSchema:
+        """
+        Retrieve a single archived task.
+
+        :param task_id: ID of the task
+        :raises ArchivedTaskDoesNotExistsServiceException: If the task
+                                                           is not archived
+        """
+
+        try:
+            return await self.db.replica.archived_task.get_one(
+                query_options=None,
+                with_rels=False,
+                id=task_id,
+            )
+        except ObjectNotFoundRepoException as ex:
+            raise ArchivedTaskDoesNotExistsServiceException from ex
+
+    async def get_all(
+        self,
+        pagination: PaginationSchema,
+        filters: TaskFilterSchema | None = None,
+        sorting: SortingSchema | None = None,
+    ) -> list[ArchivedTaskSchema]:
+        """
+        Retrieve a filtered and sorted list of archived tasks
+        with pagination. Filters by ``updated_at``, the completion time,
+        read only the partitions of the matching months.
+
+        :param pagination: Object containing limit and offset
+                           or keyset cursor for pagination
+        :param filters: Task filters.
+        :param sorting: Sort field and direction.
+        """
+
+        return await self.db.replica.archived_task.get_all(
+            pagination.limit,
+            pagination.offset,
+            pagination.cursor,
+            filters,
+            sorting,
+        )
+
+    async def archive_completed(
+        self,
+        older_than: timedelta,
+        batch_size: int,
+        pause: float = 0,
+        max_batches: int | None = None,
+    ) -> int:
+        """
+        Move the tasks completed earlier than ``older_than`` ago
+        to the archive. Each batch is a separate transaction,
+        so the locks are held only while a batch is moved,
+        and the batches are separated by a pause to throttle the load.
+        Tasks locked by other transactions are left for the next run.
+
+        :param older_than: Minimum time since the completion of a task.
+        :param batch_size: The maximum number of tasks in a batch.
+        :param pause: Pause between batches in seconds.
+        :param max_batches: Stop after this number of batches,
+                            if None, archive all the tasks.
+        :return: The number of archived tasks.
+        """
+
+        completed_before = datetime.now(timezone.utc) - older_than
+        oldest = await self.db.archived_task.get_oldest_archivable(
+            completed_before,
+        )
+        if oldest is None:
+            return 0
+        await self.db.archived_task.create_partitions(
+            oldest,
+            completed_before,
+        )
+        await self.db.commit()
+
+        archived = batches = 0
+        while max_batches is None or batches < max_batches:
+            moved = await self.db.archived_task.archive_completed(
+                completed_before,
+                batch_size,
+            )
+            await self.db.commit()
+            archived += moved
+            batches += 1
+            logger.info("Archived %d tasks, %d in total", moved, archived)
+            if moved < batch_size:
+                break
+            await asyncio.sleep(pause)
+        return archived
@@ -1,4 +1,4 @@
-from src.utils.transaction import TransactionManager
+from src.utils.transaction import BaseManager
 
 
 class BaseService:
@@ -8,7 +8,7 @@ class BaseService:
 
     def __init__(
         self,
-        db: TransactionManager | None = None,
+        db: BaseManager | None = None,
     ) -> None:
         """
         Initialize the service with a transaction manager.
@@ -20,7 +20,7 @@ class BaseService:
         self._db = db
 
     @property
-    def db(self) -> TransactionManager:
+    def db(self) -> BaseManager:
         if self._db is None:
             raise RuntimeError(
                 "Database connection is required for this operation, "
@@ -1,61 +1,420 @@
 import uuid
+from typing import Any
+from typing import AsyncIterator
 
+from src.config import TaskStatus
+from src.config import settings
+from src.exceptions.repository.base import CannotAddObjectRepoException
 from src.exceptions.repository.base import ObjectNotFoundRepoException
+from src.exceptions.service.task import CannotAddTaskServiceException
 from src.exceptions.service.task import TaskDoesNotExistsServiceException
+from src.exceptions.service.task import TaskVersionConflictServiceException
+from src.schemas.base.schemas import BulkResultSchema
+from src.schemas.pagination import CursorSchema
+from src.schemas.pagination import PageSchema
 from src.schemas.pagination import PaginationSchema
+from src.schemas.pagination import TotalMode
+from src.schemas.sorting import SortingSchema
 from src.schemas.task import TaskCreateSchema
+from src.schemas.task import TaskCreateWithIdSchema
+from src.schemas.task import TaskFilterSchema
 from src.schemas.task import TaskSchema
+from src.schemas.task import TaskSearchResultSchema
+from src.schemas.task import TaskSelectionSchema
+from src.schemas.task import TaskStatsSchema
 from src.schemas.task import TaskUpdateSchema
 from src.services.base import BaseService
+from src.utils.batching import WriteBatcher
+from src.utils.cache import TTLCache
+from src.utils.cache import count_cache
+from src.utils.cache import task_cache
+from src.utils.etag import get_collection_etag
+from src.utils.etag import get_entity_etag
+from src.utils.transaction import BaseManager
+
+
+_NOT_CACHED = object()
+
+
+async def create_tasks_batch(
+    requests: list[tuple[BaseManager, TaskCreateSchema]],
+) -> list[TaskSchema | Exception]:
+    """
+    Create the tasks of concurrent requests by one INSERT and one commit
+    in a transaction of the batch, so a request that is cancelled
+    or finished in the meantime does not affect the others.
+    The transactions of the requests are not used, but their commit
+    callbacks are called after the commit. If the batch fails,
+    each task is created in a separate transaction,
+    so an invalid task fails only its request.
+
+    :param requests: Transactions of the requests and the tasks to create.
+    :return: The created task or the exception for each request.
+    """
+
+    # The IDs are generated here to match the returned rows to requests.
+    data = [
+        TaskCreateWithIdSchema(id=uuid.uuid4(), **task.model_dump())
+        for _, task in requests
+    ]
+    async with requests[0][0].fork() as db:
+        try:
+            created_data = await db.task.add_bulk(data)
+            await db.commit()
+        except Exception as ex:
+            await db.rollback()
+            if len(requests) == 1:
+                return [ex]
+        else:
+            for request_db, _ in requests:
+                if request_db.on_commit is not None:
+                    request_db.on_commit()
+            created_by_id = {task.id: task for task in created_data}
+            return [created_by_id[task.id] for task in data]
+
+    results: list[TaskSchema | Exception] = []
+    for (request_db, _), task in zip(requests, data):
+        async with request_db.fork() as db:
+            try:
+                created = await db.task.add(task)
+                await db.commit()
+            except Exception as ex:
+                await db.rollback()
+                results.append(ex)
+                continue
+        if request_db.on_commit is not None:
+            request_db.on_commit()
+        results.append(created)
+    return results
+
+
+task_create_batcher = (
+    WriteBatcher(
+        create_tasks_batch,
+        window=settings.write_batch.window_ms / 1000,
+        max_size=settings.write_batch.max_size,
+    )
+    if settings.write_batch.enabled
+    else None
+)
 
 
 class TaskService(BaseService):
+    # A cached None means that the task does not exist.
+    cache: TTLCache | None = task_cache
+    # Exact totals keyed by the JSON of the filters.
+    count_cache: TTLCache | None = count_cache
+    # Coalesces concurrent creations, None if disabled.
+    create_batcher: WriteBatcher | None = task_create_batcher
+
     async def get_one(
         self,
         **filters,
     ) -> TaskSchema:
         """
         Retrieve a single task by given filters.
+        Tasks that are not found are looked up in the archive.
+        Lookups by ID only are served from the cache, if it is enabled.
 
         :param filters: Arbitrary filters to search for the task
         :raises TaskDoesNotExistsServiceException: If the task is not found
         """
 
+        cache_key = filters["id"] if filters.keys() == {"id"} else None
+        if self.cache is not None and cache_key is not None:
+            cached_task = self.cache.get(cache_key, _NOT_CACHED)
+            if cached_task is None:
+                raise TaskDoesNotExistsServiceException
+            if cached_task is not _NOT_CACHED:
+                return cached_task
+
         try:
-            return await self.db.task.get_one(
+            task = await self.db.replica.task.get_one(
                 query_options=None,
                 with_rels=False,
                 **filters,
             )
-        except ObjectNotFoundRepoException as ex:
-            raise TaskDoesNotExistsServiceException from ex
+        except ObjectNotFoundRepoException:
+            task = await self.db.replica.archived_task.get_one_or_none(
+                **filters,
+            )
+        if task is None:
+            if self.cache is not None and cache_key is not None:
+                self.cache.set(
+                    cache_key,
+                    None,
+                    ttl=settings.cache.negative_ttl,
+                )
+            raise TaskDoesNotExistsServiceException
+
+        if self.cache is not None and cache_key is not None:
+            self.cache.set(cache_key, task)
+        return task
+
+    async def get_etag(
+        self,
+        task_id: uuid.UUID,
+    ) -> str:
+        """
+        Get the ETag of a task without loading the whole task.
+        Tasks that are not found are looked up in the archive.
+
+        :param task_id: ID of the task
+        :raises TaskDoesNotExistsServiceException: If the task is not found
+        """
+
+        if self.cache is not None:
+            cached_task = self.cache.get(task_id, _NOT_CACHED)
+            if cached_task is None:
+                raise TaskDoesNotExistsServiceException
+            if cached_task is not _NOT_CACHED:
+                return get_entity_etag(task_id, cached_task.version)
+
+        try:
+            version = await self.db.replica.task.get_version(id=task_id)
+        except ObjectNotFoundRepoException:
+            try:
+                version = await self.db.replica.archived_task.get_version(
+                    id=task_id,
+                )
+            except ObjectNotFoundRepoException as ex:
+                raise TaskDoesNotExistsServiceException from ex
+        return get_entity_etag(task_id, version)
+
+    async def get_all_etag(
+        self,
+        pagination: PaginationSchema,
+        filters: TaskFilterSchema | None = None,
+        sorting: SortingSchema | None = None,
+    ) -> str:
+        """
+        Get the ETag of a page of tasks without loading the tasks.
+
+        :param pagination: Object containing limit and offset
+                           or keyset cursor for pagination
+        :param filters: Task filters.
+        :param sorting: Sort field and direction.
+        """
+
+        versions = await self.db.replica.task.get_all_versions(
+            pagination.limit,
+            pagination.offset,
+            pagination.cursor,
+            filters,
+            sorting,
+        )
+        return get_collection_etag(versions)
 
     async def get_all(
         self,
         pagination: PaginationSchema,
+        filters: TaskFilterSchema | None = None,
+        sorting: SortingSchema | None = None,
     ) -> list[TaskSchema]:
         """
-        Retrieve a list of tasks with pagination.
+        Retrieve a filtered and sorted list of tasks with pagination.
+
+        :param pagination: Object containing limit and offset
+                           or keyset cursor for pagination
+        :param filters: Task filters.
+        :param sorting: Sort field and direction.
+        """
+
+        return await self.db.replica.task.get_all(
+            pagination.limit,
+            pagination.offset,
+            pagination.cursor,
+            filters,
+            sorting,
+        )
+
+    async def get_page(
+        self,
+        pagination: PaginationSchema,
+        filters: TaskFilterSchema,
+        sorting: SortingSchema,
+        total_mode: TotalMode = TotalMode.NONE,
+    ) -> PageSchema[TaskSchema]:
+        """
+        Retrieve a page of tasks with pagination metadata.
+        One extra task is fetched to find out if there is a next page.
+
+        :param pagination: Object containing limit and offset
+                           or keyset cursor for pagination
+        :param filters: Task filters.
+        :param sorting: Sort field and direction.
+        :param total_mode: How to compute the total number of tasks.
+        """
+
+        tasks = await self.db.replica.task.get_all(
+            pagination.limit + 1,
+            pagination.offset,
+            pagination.cursor,
+            filters,
+            sorting,
+        )
+        has_next = len(tasks) > pagination.limit
+        tasks = tasks[: pagination.limit]
+        next_page = next_cursor = None
+        if has_next:
+            if pagination.cursor is None:
+                next_page = pagination.offset // pagination.limit + 2
+            next_cursor = CursorSchema.after(
+                tasks[-1],
+                sorting,
+            ).encode()
+        return PageSchema[TaskSchema](
+            items=tasks,
+            total=await self.get_total(filters, total_mode),
+            has_next=has_next,
+            next_page=next_page,
+            next_cursor=next_cursor,
+        )
+
+    async def get_total(
+        self,
+        filters: TaskFilterSchema,
+        mode: TotalMode,
+    ) -> int | None:
+        """
+        Get the total number of tasks matching the filters.
+
+        :param filters: Task filters.
+        :param mode: ``exact`` counts the tasks, ``estimated`` takes
+                     the number from the planner statistics
+                     and ``none`` skips the total.
+        """
+
+        if mode is TotalMode.NONE:
+            return None
+        if mode is TotalMode.ESTIMATED:
+            return await self.db.replica.task.estimate_count(filters)
+
+        cache_key = filters.model_dump_json()
+        if self.count_cache is not None:
+            total = self.count_cache.get(cache_key)
+            if total is not None:
+                return total
+        total = await self.db.replica.task.count(filters)
+        if self.count_cache is not None:
+            self.count_cache.set(cache_key, total)
+        return total
+
+    async def get_stats(self) -> TaskStatsSchema:
+        """
+        Get the number of tasks in each status and in total.
+        Archived tasks are not counted.
+        """
 
+        counts = await self.db.replica.task.get_status_counts()
+        by_status = {
+            task_status: counts.get(task_status, 0)
+            for task_status in TaskStatus
+        }
+        return TaskStatsSchema(
+            total=sum(by_status.values()),
+            by_status=by_status,
+        )
+
+    async def search(
+        self,
+        text: str,
+        pagination: PaginationSchema,
+    ) -> list[TaskSearchResultSchema]:
+        """
+        Search tasks by name and description, most relevant first.
+
+        :param text: Search query
         :param pagination: Object containing limit and offset for pagination
         """
 
-        return await self.db.task.get_all(
+        return await self.db.replica.task.search(
+            text,
             pagination.limit,
             pagination.offset,
         )
 
+    async def stream_all(
+        self,
+    ) -> AsyncIterator[list[TaskSchema]]:
+        """
+        Stream all tasks in batches of the configured export size.
+        """
+
+        async for tasks in self.db.replica.task.stream_all(
+            settings.export.batch_size,
+        ):
+            yield tasks
+
     async def create(
         self,
         data: TaskCreateSchema,
     ) -> TaskSchema:
         """
-        Create a new task.
+        Create a new task. If write batching is enabled, the task
+        is created together with the tasks of concurrent requests.
 
         :param data: Data required to create a new task
+        :raises CannotAddTaskServiceException: If the task cannot be added
         """
 
-        created_data = await self.db.task.add(data)
+        try:
+            if self.create_batcher is not None:
+                created_data = await self.create_batcher.submit(
+                    (self.db, data),
+                )
+            else:
+                created_data = await self.db.task.add(data)
+                await self.db.commit()
+        except CannotAddObjectRepoException as ex:
+            raise CannotAddTaskServiceException from ex
+        self._invalidate_cache(created_data.id)
+        return created_data
+
+    async def create_bulk(
+        self,
+        data: list[TaskCreateSchema],
+    ) -> list[TaskSchema]:
+        """
+        Create multiple tasks in a single transaction.
+
+        :param data: Data required to create the new tasks
+        :raises CannotAddTaskServiceException: If the tasks cannot be added
+        """
+
+        created_tasks = await self._add_bulk(data, only_ids=False)
+        self._invalidate_cache(*(task.id for task in created_tasks))
+        return created_tasks
+
+    async def create_bulk_ids(
+        self,
+        data: list[TaskCreateSchema],
+    ) -> list[uuid.UUID]:
+        """
+        Create multiple tasks in a single transaction
+        and return only their IDs, without mapping the rows.
+
+        :param data: Data required to create the new tasks
+        :raises CannotAddTaskServiceException: If the tasks cannot be added
+        """
+
+        task_ids = await self._add_bulk(data, only_ids=True)
+        self._invalidate_cache(*task_ids)
+        return task_ids
+
+    async def _add_bulk(
+        self,
+        data: list[TaskCreateSchema],
+        only_ids: bool,
+    ) -> list[Any]:
+        try:
+            created_data = await self.db.task.add_bulk(
+                data,
+                chunk_size=settings.bulk.chunk_size,
+                only_ids=only_ids,
+            )
+        except CannotAddObjectRepoException as ex:
+            raise CannotAddTaskServiceException from ex
         await self.db.commit()
         return created_data
 
@@ -63,25 +422,67 @@ class TaskService(BaseService):
         self,
         task_id: uuid.UUID,
         data: TaskUpdateSchema,
-    ) -> uuid.UUID:
+        expected_version: int | None = None,
+        return_task: bool = False,
+    ) -> uuid.UUID | TaskSchema:
         """
-        Update an existing task.
+        Update an existing task. With an expected version, the task
+        is updated only if nobody has changed it since, which is checked
+        by the same UPDATE statement without locking the row.
 
         :param task_id: ID of the task to update
         :param data: Data to update in the task
+        :param expected_version: Version of the task known to the client
+        :param return_task: Return the updated task, read by the same
+                            UPDATE statement, instead of its ID
+        :return: ID of the updated task or the task itself
         :raises TaskDoesNotExistsServiceException: If the task is not found
+        :raises TaskVersionConflictServiceException: If the task has
+                                                     another version
+                                                     or does not exist
         """
 
+        filter_by: dict[str, Any] = {"id": task_id}
+        if expected_version is not None:
+            filter_by["version"] = expected_version
         try:
-            await self.db.task.update_one(
+            updated = await self.db.task.update_one(
                 data,
                 partially=True,
-                id=task_id,
+                returning_entity=return_task,
+                **filter_by,
             )
             await self.db.commit()
-            return task_id
         except ObjectNotFoundRepoException as ex:
+            # Telling a missing task from a changed one would take
+            # another query, and both fail the precondition.
+            if expected_version is not None:
+                raise TaskVersionConflictServiceException from ex
             raise TaskDoesNotExistsServiceException from ex
+        self._invalidate_cache(task_id)
+        return updated
+
+    async def update_bulk(
+        self,
+        selection: TaskSelectionSchema,
+        data: TaskUpdateSchema,
+    ) -> BulkResultSchema:
+        """
+        Update all selected tasks in a single statement.
+
+        :param selection: IDs or filters of the tasks to update
+        :param data: Data to update in the tasks
+        """
+
+        updated_ids = await self.db.task.update_bulk(
+            data,
+            ids=selection.ids,
+            filters=selection.filters,
+            partially=True,
+        )
+        await self.db.commit()
+        self._invalidate_cache(*updated_ids)
+        return self._get_bulk_result(selection, updated_ids)
 
     async def delete_one(
         self,
@@ -101,3 +502,60 @@ class TaskService(BaseService):
             await self.db.commit()
         except ObjectNotFoundRepoException as ex:
             raise TaskDoesNotExistsServiceException from ex
+        self._invalidate_cache(task_id)
+
+    async def delete_bulk(
+        self,
+        selection: TaskSelectionSchema,
+    ) -> BulkResultSchema:
+        """
+        Delete all selected tasks in a single statement.
+
+        :param selection: IDs or filters of the tasks to delete
+        """
+
+        deleted_ids = await self.db.task.delete_bulk(
+            ids=selection.ids,
+            filters=selection.filters,
+        )
+        await self.db.commit()
+        self._invalidate_cache(*deleted_ids)
+        return self._get_bulk_result(selection, deleted_ids)
+
+    def _invalidate_cache(
+        self,
+        *task_ids: uuid.UUID,
+    ) -> None:
+        """
+        Drop cached tasks after they were changed.
+
+        :param task_ids: IDs of the changed tasks
+        """
+
+        if self.cache is not None:
+            self.cache.invalidate(*task_ids)
+
+    @staticmethod
+    def _get_bulk_result(
+        selection: TaskSelectionSchema,
+        matched_ids: list[uuid.UUID],
+    ) -> BulkResultSchema:
+        """
+        Split the selected IDs into matched and missing ones.
+
+        :param selection: IDs or filters of the selected tasks
+        :param matched_ids: IDs of the tasks affected by the operation
+        """
+
+        matched = set(matched_ids)
+        # fmt: off
+        missing = [
+            task_id
+            for task_id in dict.fromkeys(selection.ids or ())
+            if task_id not in matched
+        ]
+        # fmt: on
+        return BulkResultSchema(
+            matched=matched_ids,
+            missing=missing,
+        )
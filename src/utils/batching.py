@@ -0,0 +1,99 @@
+import asyncio
+from typing import Awaitable
+from typing import Callable
+from typing import Generic
+from typing import TypeVar
+
+
+ItemType = TypeVar("ItemType")
+ResultType = TypeVar("ResultType")
+
+
+class WriteBatcher(Generic[ItemType, ResultType]):
+    """
+    Coalesces concurrent calls into batches. The first item of a batch
+    waits up to ``window`` seconds for other items, and a full batch
+    is flushed at once. Intended for a single event loop,
+    so it is not thread-safe.
+    """
+
+    def __init__(
+        self,
+        flush: Callable[
+            [list[ItemType]],
+            Awaitable[list[ResultType | Exception]],
+        ],
+        window: float,
+        max_size: int,
+    ) -> None:
+        """
+        :param flush: Processes a batch and returns a result or
+                      an exception for each item, in the same order.
+                      If it raises, the exception is passed to all items.
+        :param window: How long a batch collects items, in seconds.
+        :param max_size: The maximum number of items in a batch.
+        """
+
+        self.flush = flush
+        self.window = window
+        self.max_size = max_size
+        self._pending: list[tuple[ItemType, asyncio.Future]] = []
+        self._timer: asyncio.TimerHandle | None = None
+        # Keeps references to running flushes until they finish
+        self._flushes: set[asyncio.Task] = set()
+
+    async def submit(
+        self,
+        item: ItemType,
+    ) -> ResultType:
+        """
+        Add an item to the current batch and wait for its result.
+        The item is processed even if the caller is cancelled.
+
+        :param item: The item to process.
+        :return: Result of the item.
+        :raises Exception: The exception returned for the item.
+        """
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((item, future))
+        if len(self._pending) >= self.max_size:
+            self._start_flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.window, self._start_flush)
+        return await future
+
+    def _start_flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        task = asyncio.create_task(self._flush(batch))
+        self._flushes.add(task)
+        task.add_done_callback(self._flushes.discard)
+
+    async def _flush(
+        self,
+        batch: list[tuple[ItemType, asyncio.Future]],
+    ) -> None:
+        try:
+            try:
+                results = await self.flush([item for item, _ in batch])
+            except Exception as ex:
+                results = [ex] * len(batch)
+            for (_, future), result in zip(batch, results):
+                if future.done():
+                    continue
+                if isinstance(result, Exception):
+                    future.set_exception(result)
+                else:
+                    future.set_result(result)
+        finally:
+            # The flush was cancelled (e.g. at shutdown) or interrupted,
+            # the callers must not wait for the results forever.
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(
+                        RuntimeError("The batch was not flushed"),
+                    )
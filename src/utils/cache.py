@@ -0,0 +1,182 @@
+import time
+from collections import OrderedDict
+from typing import Any
+from typing import Callable
+from typing import Hashable
+
+from src.config import settings
+from src.schemas.internal import CacheStatsSchema
+from src.schemas.internal import StatementCacheStatsSchema
+
+
+class TTLCache:
+    """
+    Size-bounded LRU cache with per-entry expiration.
+    Intended for a single event loop, so it is not thread-safe.
+    """
+
+    def __init__(
+        self,
+        max_size: int,
+        ttl: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        :param max_size: The maximum number of entries.
+                         The least recently used entry is evicted on overflow.
+        :param ttl: Default lifetime of an entry in seconds.
+        :param clock: Monotonic time source.
+        """
+
+        self.max_size = max_size
+        self.ttl = ttl
+        self._clock = clock
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(
+        self,
+        key: Hashable,
+        default: Any = None,
+    ) -> Any:
+        """
+        Get a value by key and mark it as recently used.
+
+        :param key: The cache key.
+        :param default: Returned if the key is absent or expired.
+        :return: The cached value or ``default``.
+        """
+
+        entry = self._entries.get(key)
+        if entry is None or entry[0] <= self._clock():
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return default
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def set(
+        self,
+        key: Hashable,
+        value: Any,
+        ttl: float | None = None,
+    ) -> None:
+        """
+        Store a value, evicting the least recently used entry on overflow.
+
+        :param key: The cache key.
+        :param value: The value to store.
+        :param ttl: Lifetime of the entry in seconds.
+                    If None, the default lifetime is used.
+        """
+
+        expires_at = self._clock() + (self.ttl if ttl is None else ttl)
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(
+        self,
+        *keys: Hashable,
+    ) -> None:
+        """
+        Remove entries by keys. Absent keys are ignored.
+
+        :param keys: The cache keys.
+        """
+
+        for key in keys:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all entries and reset the counters"""
+
+        self._entries.clear()
+        self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> CacheStatsSchema:
+        return CacheStatsSchema(
+            size=len(self._entries),
+            max_size=self.max_size,
+            hits=self.hits,
+            misses=self.misses,
+            evictions=self.evictions,
+        )
+
+
+class StatementCache:
+    """
+    Registry of pre-built SQL statements keyed by their shape,
+    e.g. the operation and the names of the filtered columns.
+    Values are passed as bound parameters on execution,
+    so a statement is built and cache-keyed by SQLAlchemy only once.
+    The number of shapes is bounded by the code, so there is no eviction.
+    """
+
+    def __init__(self) -> None:
+        self._statements: dict[Hashable, Any] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_build(
+        self,
+        key: Hashable,
+        build: Callable[[], Any],
+    ) -> Any:
+        """
+        Get a statement by key or build and store it.
+
+        :param key: The shape of the statement.
+        :param build: Builds the statement on a miss.
+        :return: The statement.
+        """
+
+        statement = self._statements.get(key)
+        if statement is None:
+            self.misses += 1
+            statement = self._statements[key] = build()
+        else:
+            self.hits += 1
+        return statement
+
+    def clear(self) -> None:
+        self._statements.clear()
+
+    def stats(self) -> StatementCacheStatsSchema:
+        lookups = self.hits + self.misses
+        return StatementCacheStatsSchema(
+            size=len(self._statements),
+            hits=self.hits,
+            misses=self.misses,
+            hit_rate=self.hits / lookups if lookups else 0.0,
+        )
+
+
+# Exact totals of task lists, keyed by filters.
+count_cache = (
+    TTLCache(
+        max_size=settings.pagination.count_cache_max_size,
+        ttl=settings.pagination.count_cache_ttl,
+    )
+    if settings.pagination.count_cache_ttl > 0
+    else None
+)
+
+# Read-through cache of tasks by ID, shared by all requests of the worker.
+task_cache = (
+    TTLCache(
+        max_size=settings.cache.max_size,
+        ttl=settings.cache.ttl,
+    )
+    if settings.cache.enabled
+    else None
+)
+
+# Statements of all repositories, shared by all requests of the worker.
+statement_cache = StatementCache()
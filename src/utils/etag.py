@@ -0,0 +1,93 @@
+import hashlib
+import uuid
+from datetime import datetime
+from typing import Iterable
+
+
+# Versions are stored in a 32-bit integer column.
+MAX_VERSION = 2**31 - 1
+
+
+def get_entity_etag(
+    entity_id: uuid.UUID,
+    version: int,
+) -> str:
+    """
+    Build a strong ETag for a single entity.
+
+    :param entity_id: ID of the entity.
+    :param version: Version of the entity.
+    :return: Quoted ETag value.
+    """
+
+    return f'"{entity_id.hex}-{version}"'
+
+
+def get_etag_version(
+    if_match: str,
+    entity_id: uuid.UUID,
+) -> int | None:
+    """
+    Get the entity version from an ``If-Match`` header value
+    built by ``get_entity_etag``. Weak tags never match.
+
+    :param if_match: Value of the ``If-Match`` header, a single ETag.
+    :param entity_id: ID of the entity the request is for.
+    :return: The version or None if the tag is not an ETag of the entity
+             or the version cannot be stored.
+    """
+
+    prefix = f'"{entity_id.hex}-'
+    tag = if_match.strip()
+    if not tag.startswith(prefix) or not tag.endswith('"'):
+        return None
+    version = tag.removeprefix(prefix).removesuffix('"')
+    if not (version.isascii() and version.isdecimal()):
+        return None
+    return int(version) if 0 < int(version) <= MAX_VERSION else None
+
+
+def get_collection_etag(
+    versions: Iterable[tuple[uuid.UUID, datetime]],
+) -> str:
+    """
+    Build a strong ETag for a list of entities from the row count,
+    the latest modification time and the entity IDs.
+    The IDs are included so that a deleted row
+    replaced by an older one changes the tag.
+
+    :param versions: ``(id, updated_at)`` pairs in the response order.
+    :return: Quoted ETag value.
+    """
+
+    digest = hashlib.blake2b(digest_size=16)
+    count = 0
+    max_updated_at = None
+    for entity_id, updated_at in versions:
+        digest.update(entity_id.bytes)
+        count += 1
+        if max_updated_at is None or updated_at > max_updated_at:
+            max_updated_at = updated_at
+    timestamp = 0.0 if max_updated_at is None else max_updated_at.timestamp()
+    return f'"{count}-{timestamp:.6f}-{digest.hexdigest()}"'
+
+
+def etag_matches(
+    if_none_match: str,
+    etag: str,
+) -> bool:
+    """
+    Check an ``If-None-Match`` header value against the current ETag
+    using the weak comparison required for conditional GET.
+
+    :param if_none_match: Value of the ``If-None-Match`` header.
+    :param etag: The current ETag.
+    :return: True if the client copy is up to date.
+    """
+
+    if if_none_match.strip() == "*":
+        return True
+    return any(
+        tag.strip().removeprefix("W/") == etag
+        for tag in if_none_match.split(",")
+    )
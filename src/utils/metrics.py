@@ -0,0 +1,151 @@
+import bisect
+from typing import Sequence
+
+from src.schemas.internal import HistogramSchema
+
+
+class Histogram:
+    """
+    Histogram with fixed bucket upper bounds.
+    """
+
+    def __init__(
+        self,
+        buckets: Sequence[float],
+    ) -> None:
+        """
+        :param buckets: Upper bounds of the buckets in ascending order.
+                        Larger observations fall into the ``+Inf`` bucket.
+        """
+
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(
+        self,
+        value: float,
+    ) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def snapshot(self) -> HistogramSchema:
+        buckets = {}
+        total = 0
+        for bound, count in zip((*self.buckets, "+Inf"), self.counts):
+            total += count
+            buckets[str(bound)] = total
+        return HistogramSchema(
+            buckets=buckets,
+            count=self.count,
+            sum=self.sum,
+        )
+
+
+LATENCY_BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1,
+    2.5,
+    5,
+    10,
+)
+
+
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+
+class PhaseMetrics:
+    """
+    Histograms of request phase durations and of the number
+    of SQL statements per request by route.
+    """
+
+    def __init__(
+        self,
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ) -> None:
+        """
+        :param buckets: Upper bounds of the histogram buckets in seconds.
+        """
+
+        self.buckets = buckets
+        self.histograms: dict[tuple[str, str, str], Histogram] = {}
+        self.query_counts: dict[tuple[str, str], Histogram] = {}
+
+    def observe(
+        self,
+        method: str,
+        route: str,
+        durations: dict[str, float],
+        query_count: int,
+    ) -> None:
+        """
+        :param method: HTTP method of the request.
+        :param route: Path template of the matched route.
+        :param durations: Duration of each phase in seconds.
+        :param query_count: Number of SQL statements of the request.
+        """
+
+        for phase, duration in durations.items():
+            key = (method, route, phase)
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = self.histograms[key] = Histogram(self.buckets)
+            histogram.observe(duration)
+        histogram = self.query_counts.get((method, route))
+        if histogram is None:
+            histogram = self.query_counts[method, route] = Histogram(
+                QUERY_COUNT_BUCKETS
+            )
+        histogram.observe(query_count)
+
+    def clear(self) -> None:
+        self.histograms.clear()
+        self.query_counts.clear()
+
+
+def render_histogram(
+    name: str,
+    labels: dict[str, str],
+    histogram: Histogram,
+) -> list[str]:
+    """
+    Render a histogram in the Prometheus text exposition format.
+
+    :param name: Metric name.
+    :param labels: Labels of the series.
+    :param histogram: The histogram to render.
+    :return: Sample lines without the HELP and TYPE comments.
+    """
+
+    snapshot = histogram.snapshot()
+    label_pairs = [
+        f'{label}="{escape_label_value(value)}"'
+        for label, value in labels.items()
+    ]
+    lines = []
+    for bound, count in snapshot.buckets.items():
+        bucket_labels = ",".join([*label_pairs, f'le="{bound}"'])
+        lines.append(f"{name}_bucket{{{bucket_labels}}} {count}")
+    series_labels = ",".join(label_pairs)
+    lines.append(f"{name}_sum{{{series_labels}}} {snapshot.sum}")
+    lines.append(f"{name}_count{{{series_labels}}} {snapshot.count}")
+    return lines
+
+
+def escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+phase_metrics = PhaseMetrics()
@@ -0,0 +1,101 @@
+import time
+from contextlib import AbstractContextManager
+from contextlib import contextmanager
+from contextlib import nullcontext
+from contextvars import ContextVar
+from functools import wraps
+from inspect import iscoroutinefunction
+from typing import Callable
+from typing import Iterator
+
+
+class RequestTimings:
+    """
+    Time spent by a request in each phase, e.g. waiting for
+    a connection or mapping rows. Time of a nested phase is excluded
+    from the enclosing one, so the phases do not overlap.
+    """
+
+    def __init__(self) -> None:
+        self.durations: dict[str, float] = {}
+        # Time of the nested phases of each open phase
+        self._nested: list[float] = []
+
+    @contextmanager
+    def phase(
+        self,
+        name: str,
+    ) -> Iterator[None]:
+        self._nested.append(0.0)
+        started_at = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - started_at
+            nested = self._nested.pop()
+            self.durations[name] = (
+                self.durations.get(name, 0.0) + elapsed - nested
+            )
+            if self._nested:
+                self._nested[-1] += elapsed
+
+
+# Set by the timing middleware for the duration of a request
+request_timings: ContextVar[RequestTimings | None] = ContextVar(
+    "request_timings",
+    default=None,
+)
+
+
+def phase(
+    name: str,
+) -> AbstractContextManager:
+    """
+    Record the enclosed block as a phase of the current request.
+
+    :param name: Name of the phase.
+    :return: Context manager timing the block.
+    """
+
+    timings = request_timings.get()
+    if timings is None:
+        return nullcontext()
+    return timings.phase(name)
+
+
+def timed(
+    name: str,
+) -> Callable[[Callable], Callable]:
+    """
+    Record the calls of the decorated function as a phase
+    of the current request. Outside of a timed request
+    the call costs one context variable lookup.
+
+    :param name: Name of the phase.
+    :return: The decorator.
+    """
+
+    def decorator(function: Callable) -> Callable:
+        if iscoroutinefunction(function):
+
+            @wraps(function)
+            async def async_wrapper(*args, **kwargs):
+                timings = request_timings.get()
+                if timings is None:
+                    return await function(*args, **kwargs)
+                with timings.phase(name):
+                    return await function(*args, **kwargs)
+
+            return async_wrapper
+
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            timings = request_timings.get()
+            if timings is None:
+                return function(*args, **kwargs)
+            with timings.phase(name):
+                return function(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
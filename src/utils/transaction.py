@@ -2,11 +2,21 @@ from abc import ABC
 from abc import abstractmethod
 from typing import Callable
 
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.repositories import ArchivedTaskRepository
 from src.repositories import TaskRepository
+from src.repositories.memory import InMemoryArchivedTaskRepository
+from src.repositories.memory import InMemoryTaskRepository
+from src.repositories.memory import InMemoryTaskStore
+from src.repositories.memory import UndoLog
+from src.utils.timing import timed
 
 
 class BaseManager(ABC):
     task: TaskRepository
+    archived_task: ArchivedTaskRepository
+    on_commit: Callable[[], None] | None
 
     @abstractmethod
     def __init__(self):
@@ -28,19 +38,183 @@ class BaseManager(ABC):
         """Commit the transaction"""
         pass
 
+    @abstractmethod
+    async def rollback(self):
+        """Roll back the transaction"""
+        pass
+
+    @abstractmethod
+    def fork(self) -> "BaseManager":
+        """New manager of the same backend with its own transaction"""
+        pass
+
+    @property
+    def replica(self) -> "BaseManager":
+        """Manager for read-only queries, the manager itself by default"""
+        return self
+
 
 class TransactionManager(BaseManager):
-    def __init__(self, session_factory: Callable):
+    """
+    Database-backed manager. The session is created on the first access
+    to a repository, so requests that do not query the database
+    (e.g. served from the cache) never touch the connection pool.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable,
+        replica_session_factory: Callable | None = None,
+        read_only: bool = False,
+        on_commit: Callable[[], None] | None = None,
+    ):
+        """
+        :param session_factory: Factory of sessions for this manager.
+        :param replica_session_factory: Factory of sessions connected to
+                                        a read replica. If None, read-only
+                                        queries use ``session_factory``.
+        :param read_only: If True, the transaction cannot be committed.
+        :param on_commit: Called after each successful commit.
+        """
+
         self.session_factory = session_factory
+        self.replica_session_factory = replica_session_factory
+        self.read_only = read_only
+        self.on_commit = on_commit
+        self._session: AsyncSession | None = None
+        self._task: TaskRepository | None = None
+        self._archived_task: ArchivedTaskRepository | None = None
+        self._replica: TransactionManager | None = None
+
+    @property
+    def session(self) -> AsyncSession:
+        session = self._session
+        if session is None:
+            session = self._session = self.session_factory()
+        return session
+
+    @property
+    def task(self) -> TaskRepository:  # type: ignore
+        if self._task is None:
+            self._task = TaskRepository(self.session)
+        return self._task
+
+    @property
+    def archived_task(self) -> ArchivedTaskRepository:  # type: ignore
+        if self._archived_task is None:
+            self._archived_task = ArchivedTaskRepository(self.session)
+        return self._archived_task
+
+    @property
+    def replica(self) -> "TransactionManager":
+        if self.replica_session_factory is None:
+            return self
+        if self._replica is None:
+            self._replica = TransactionManager(
+                session_factory=self.replica_session_factory,
+                read_only=True,
+            )
+        return self._replica
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        if self._replica is not None:
+            await self._replica.__aexit__(exc_type, exc_val, exc_tb)
+        if self._session is None:
+            return
+        # Closing rolls back the transaction only if it is still open,
+        # so there is no extra round trip after a commit
+        # or when no query was executed.
+        await self._session.close()
+
+    @timed("commit")
+    async def commit(self):
+        if self.read_only:
+            raise RuntimeError("Cannot commit a read-only transaction.")
+        if self._session is None:
+            return
+        await self._session.commit()
+        if self.on_commit is not None:
+            self.on_commit()
+
+    async def rollback(self):
+        if self._session is None:
+            return
+        await self._session.rollback()
+
+    def fork(self) -> "TransactionManager":
+        return TransactionManager(
+            session_factory=self.session_factory,
+            replica_session_factory=self.replica_session_factory,
+        )
+
+
+class InMemoryTransactionManager(BaseManager):
+    """
+    Manager over an in-memory task store, without any I/O.
+    Writes are applied to the store immediately and undone on rollback,
+    so there is no isolation: uncommitted changes are visible
+    to concurrent transactions.
+    """
+
+    def __init__(
+        self,
+        store: InMemoryTaskStore,
+        read_only: bool = False,
+        on_commit: Callable[[], None] | None = None,
+    ):
+        """
+        :param store: The store with the tasks.
+        :param read_only: If True, the transaction cannot be committed.
+        :param on_commit: Called after each successful commit.
+        """
+
+        self.store = store
+        self.read_only = read_only
+        self.on_commit = on_commit
+        self.undo_log: UndoLog = []
+        self._task: InMemoryTaskRepository | None = None
+        self._archived_task: InMemoryArchivedTaskRepository | None = None
+
+    @property
+    def task(self) -> InMemoryTaskRepository:  # type: ignore
+        if self._task is None:
+            self._task = InMemoryTaskRepository(self.store, self.undo_log)
+        return self._task
+
+    @property
+    def archived_task(self) -> InMemoryArchivedTaskRepository:  # type: ignore
+        if self._archived_task is None:
+            self._archived_task = InMemoryArchivedTaskRepository(
+                self.store.archive,  # type: ignore
+                self.undo_log,
+                self.store,
+            )
+        return self._archived_task
 
     async def __aenter__(self):
-        self.session = self.session_factory()
-        self.task = TaskRepository(self.session)
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        await self.session.rollback()
-        await self.session.close()
+        await self.rollback()
 
     async def commit(self):
-        await self.session.commit()
+        if self.read_only:
+            raise RuntimeError("Cannot commit a read-only transaction.")
+        self.undo_log.clear()
+        if self.on_commit is not None:
+            self.on_commit()
+
+    async def rollback(self):
+        """Restore the rows changed since the last commit"""
+        while self.undo_log:
+            store, row_id, row = self.undo_log.pop()
+            if row is None:
+                store.remove(row_id)
+            else:
+                store.put(row)
+
+    def fork(self) -> "InMemoryTransactionManager":
+        return InMemoryTransactionManager(store=self.store)
@@ -0,0 +1,43 @@
+from functools import partial
+
+from sqlalchemy.ext.asyncio import AsyncConnection
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.db.database import database
+from src.db.pool import warm_up_pool
+from src.repositories import TaskRepository
+
+
+async def prepare_statements(
+    connection: AsyncConnection,
+    read_only: bool = False,
+) -> None:
+    """
+    Prepare the hot statements on a connection without changing data.
+
+    :param connection: The connection to prepare the statements on.
+    :param read_only: If True, only reads are prepared.
+    """
+
+    async with AsyncSession(bind=connection) as session:
+        await TaskRepository(session).warm_up(read_only)
+        await session.rollback()
+
+
+async def warm_up_database(
+    connections: int,
+) -> None:
+    """
+    Open connections of the primary and the replicas in advance
+    and prepare the hot statements on them.
+
+    :param connections: The number of connections per engine.
+    """
+
+    await warm_up_pool(database.engine, connections, prepare_statements)
+    for engine in database.replica_set.engines:
+        await warm_up_pool(
+            engine,
+            connections,
+            partial(prepare_statements, read_only=True),
+        )
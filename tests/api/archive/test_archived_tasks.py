@@ -0,0 +1,124 @@
+import uuid
+from datetime import timedelta
+
+import pytest
+from fastapi import status
+
+from src.config import TaskStatus
+from src.services import ArchivedTaskService
+
+
+@pytest.fixture
+async def archived_tasks(ac, db):
+    response = await ac.post(
+        "/tasks/bulk",
+        json=[
+            {
+                "name": f"Archived task {number}",
+                "description": "",
+                "status": task_status,
+            }
+            for number, task_status in enumerate(
+                [
+                    TaskStatus.COMPLETED,
+                    TaskStatus.COMPLETED,
+                    TaskStatus.CREATED,
+                ]
+            )
+        ],
+    )
+    *completed, active = response.json()
+    archived = await ArchivedTaskService(db).archive_completed(
+        older_than=timedelta(0),
+        batch_size=1,
+    )
+    assert archived >= len(completed)
+    assert await db.task.get_one_or_none(id=active["id"]) is not None
+    return completed
+
+
+async def test_completed_tasks_are_moved(archived_tasks, db):
+    for task in archived_tasks:
+        assert await db.task.get_one_or_none(id=task["id"]) is None
+        archived_task = await db.archived_task.get_one_or_none(id=task["id"])
+        assert archived_task.name == task["name"]
+        assert archived_task.version == task["version"]
+
+
+async def test_get_one_task_falls_back_to_archive(ac, archived_tasks):
+    task = archived_tasks[0]
+    response = await ac.get(f"/tasks/{task['id']}")
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == task
+
+    response = await ac.get(
+        f"/tasks/{task['id']}",
+        headers={"If-None-Match": response.headers["ETag"]},
+    )
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+
+async def test_archived_task_cannot_be_updated(ac, archived_tasks):
+    response = await ac.patch(
+        f"/tasks/{archived_tasks[0]['id']}",
+        json={"name": "Revived"},
+    )
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+async def test_get_archived_task(ac, archived_tasks):
+    task = archived_tasks[0]
+    response = await ac.get(f"/archive/tasks/{task['id']}")
+    assert response.status_code == status.HTTP_200_OK
+    archived_task = response.json()
+    assert archived_task.pop("archived_at")
+    assert archived_task == task
+
+
+async def test_get_non_existent_archived_task(ac):
+    response = await ac.get(f"/archive/tasks/{uuid.uuid4()}")
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+async def test_get_archived_tasks(ac, archived_tasks):
+    response = await ac.get(
+        "/archive/tasks",
+        params={
+            "updated_at_from": archived_tasks[0]["updated_at"],
+            "per_page": 100,
+        },
+    )
+    assert response.status_code == status.HTTP_200_OK
+    archived_ids = {task["id"] for task in response.json()}
+    assert {task["id"] for task in archived_tasks} <= archived_ids
+
+
+async def test_get_archived_tasks_with_cursor(ac, archived_tasks):
+    response = await ac.get("/archive/tasks", params={"per_page": 1})
+    assert response.status_code == status.HTTP_200_OK
+    first_page = response.json()
+    response = await ac.get(
+        "/archive/tasks",
+        params={
+            "per_page": 1,
+            "cursor": response.headers["X-Next-Cursor"],
+        },
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()[0]["id"] != first_page[0]["id"]
+
+
+async def test_get_archived_tasks_with_cursor_of_other_sorting(
+    ac,
+    archived_tasks,
+):
+    response = await ac.get("/archive/tasks", params={"per_page": 1})
+    response = await ac.get(
+        "/archive/tasks",
+        params={
+            "per_page": 1,
+            "order": "desc",
+            "cursor": response.headers["X-Next-Cursor"],
+        },
+    )
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
@@ -0,0 +1,43 @@
+import pytest
+from fastapi import Request
+from sqlalchemy import NullPool
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from src.api.dependencies.db import PRIMARY_PIN_COOKIE
+from src.api.dependencies.db import get_replica_session_factory
+from src.config import settings
+from src.db.database import Database
+from src.db.replicas import ReplicaSet
+
+
+@pytest.fixture
+def replica_set(monkeypatch):
+    replica_set = ReplicaSet(
+        engines=[
+            create_async_engine(
+                url=settings.db.url,  # type: ignore
+                poolclass=NullPool,
+            ),
+        ],
+    )
+    monkeypatch.setattr(Database, "replica_set", replica_set)
+    return replica_set
+
+
+def build_request(cookie: str = "") -> Request:
+    return Request(
+        {
+            "type": "http",
+            "headers": [(b"cookie", cookie.encode())],
+        }
+    )
+
+
+def test_client_reads_from_replica(replica_set):
+    session_factory = get_replica_session_factory(build_request())
+    assert session_factory.kw["bind"] is replica_set.engines[0]
+
+
+def test_pinned_client_reads_from_primary(replica_set):
+    request = build_request(f"{PRIMARY_PIN_COOKIE}=1")
+    assert get_replica_session_factory(request) is None
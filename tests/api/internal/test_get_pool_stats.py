@@ -0,0 +1,11 @@
+import pytest
+from fastapi import status
+
+
+@pytest.mark.postgres
+async def test_get_pool_stats(ac):
+    response = await ac.get("/internal/pool")
+    assert response.status_code == status.HTTP_200_OK
+    response_data = response.json()
+    assert response_data["primary"]["size"] >= 0
+    assert response_data["primary"]["checkout_wait_seconds"]["buckets"]
@@ -0,0 +1,17 @@
+import pytest
+from fastapi import status
+
+
+@pytest.mark.postgres
+async def test_get_statement_cache_stats(
+    ac,
+    populate_db,
+):
+    for _ in range(2):
+        await ac.get("/tasks")
+    response = await ac.get("/internal/statements")
+    assert response.status_code == status.HTTP_200_OK
+    response_data = response.json()
+    assert response_data["size"] > 0
+    assert response_data["hits"] > 0
+    assert 0 < response_data["hit_rate"] <= 1
@@ -0,0 +1,55 @@
+import pytest
+from fastapi import status
+
+from src.config import settings
+from src.utils.metrics import phase_metrics
+
+
+@pytest.fixture
+def metrics_enabled(monkeypatch):
+    monkeypatch.setattr(settings.metrics, "enabled", True)
+    phase_metrics.clear()
+    yield
+    phase_metrics.clear()
+
+
+async def test_server_timing_header(
+    ac,
+    populate_db,
+    metrics_enabled,
+):
+    response = await ac.get("/tasks")
+    assert response.status_code == status.HTTP_200_OK
+    phases = {
+        entry.split(";")[0]
+        for entry in response.headers["Server-Timing"].split(", ")
+    }
+    assert {"db", "map", "sql", "total"} <= phases
+
+
+async def test_no_server_timing_header_when_disabled(
+    ac,
+    populate_db,
+):
+    response = await ac.get("/tasks")
+    assert response.status_code == status.HTTP_200_OK
+    assert "Server-Timing" not in response.headers
+
+
+async def test_get_metrics(
+    ac,
+    populate_db,
+    metrics_enabled,
+):
+    await ac.get("/tasks")
+    response = await ac.get("/metrics")
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["Content-Type"].startswith("text/plain")
+    assert "# TYPE http_request_phase_seconds histogram" in response.text
+    assert (
+        'http_request_phase_seconds_count{method="GET",route="/tasks",'
+        'phase="total"} 1'
+    ) in response.text
+    assert (
+        'http_request_queries_count{method="GET",route="/tasks"} 1'
+    ) in response.text
@@ -1,7 +1,15 @@
+import asyncio
+from functools import partial
+
 import pytest
 from fastapi import status
 
+from src.api.dependencies.db import PRIMARY_PIN_COOKIE
 from src.config import TaskStatus
+from src.schemas.task import TaskCreateSchema
+from src.services import TaskService
+from src.services.task import create_tasks_batch
+from src.utils.batching import WriteBatcher
 
 
 async def test_create_task(
@@ -20,6 +28,19 @@ async def test_create_task(
     assert response_data["status"] == create_task_data["status"]
 
 
+async def test_create_task_pins_client_to_primary(
+    ac,
+    create_task_data,
+    pin_on_commit,
+):
+    response = await ac.post(
+        "/tasks",
+        json=create_task_data,
+    )
+    assert response.status_code == status.HTTP_201_CREATED
+    assert PRIMARY_PIN_COOKIE in response.cookies
+
+
 @pytest.mark.parametrize(
     "name, description, task_status",
     [
@@ -48,3 +69,71 @@ async def test_create_task_with_invalid_data(
         json=create_data,
     )
     assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+@pytest.fixture
+def create_batcher(monkeypatch):
+    batcher = WriteBatcher(create_tasks_batch, window=0.05, max_size=100)
+    monkeypatch.setattr(TaskService, "create_batcher", batcher)
+    return batcher
+
+
+async def test_create_tasks_concurrently_in_one_batch(
+    ac,
+    create_task_data,
+    create_batcher,
+    assert_max_queries,
+):
+    names = [f"Batched task {number}" for number in range(5)]
+    with assert_max_queries(1):
+        responses = await asyncio.gather(
+            *(
+                ac.post("/tasks", json={**create_task_data, "name": name})
+                for name in names
+            )
+        )
+    for name, response in zip(names, responses):
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response.json()["name"] == name
+    assert len({response.json()["id"] for response in responses}) == 5
+
+
+async def test_batched_create_error_is_isolated(
+    ac,
+    db,
+    create_task_data,
+    create_batcher,
+):
+    first, error, second = await asyncio.gather(
+        ac.post("/tasks", json={**create_task_data, "name": "Valid 1"}),
+        ac.post("/tasks", json={**create_task_data, "status": None}),
+        ac.post("/tasks", json={**create_task_data, "name": "Valid 2"}),
+    )
+    assert error.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+    for response in (first, second):
+        assert response.status_code == status.HTTP_201_CREATED
+        assert await db.task.get_one_or_none(id=response.json()["id"])
+
+
+async def test_batched_create_outlives_cancelled_request(
+    db,
+    create_task_data,
+    create_batcher,
+):
+    commits = []
+
+    async def create(name: str):
+        async with db.fork() as transaction:
+            transaction.on_commit = partial(commits.append, name)
+            return await TaskService(transaction).create(
+                TaskCreateSchema(**{**create_task_data, "name": name})
+            )
+
+    cancelled = asyncio.create_task(create("Cancelled"))
+    others = [asyncio.create_task(create(f"Kept {n}")) for n in range(2)]
+    await asyncio.sleep(0)
+    cancelled.cancel()
+    created = await asyncio.gather(*others)
+    for task in created:
+        assert await db.task.get_one_or_none(id=task.id)
+    assert sorted(commits) == ["Cancelled", "Kept 0", "Kept 1"]
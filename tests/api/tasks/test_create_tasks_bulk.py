@@ -0,0 +1,113 @@
+import pytest
+from fastapi import status
+
+from src.api.dependencies.db import PRIMARY_PIN_COOKIE
+from src.config import TaskStatus
+from src.config import settings
+
+
+async def test_create_tasks_bulk(
+    ac,
+    create_task_data,
+):
+    create_data = [create_task_data] * 3
+    response = await ac.post(
+        "/tasks/bulk",
+        json=create_data,
+    )
+    assert response.status_code == status.HTTP_201_CREATED
+    response_data = response.json()
+    assert len(response_data) == len(create_data)
+    for task in response_data:
+        assert task["id"]
+        assert task["name"] == create_task_data["name"]
+        assert task["description"] == create_task_data["description"]
+        assert task["status"] == create_task_data["status"]
+
+
+async def test_create_tasks_bulk_only_ids(
+    ac,
+    create_task_data,
+    db,
+):
+    response = await ac.post(
+        "/tasks/bulk",
+        params={"only_ids": True},
+        json=[create_task_data] * 2,
+    )
+    assert response.status_code == status.HTTP_201_CREATED
+    response_data = response.json()
+    assert len(response_data) == 2
+    for task in response_data:
+        assert list(task) == ["id"]
+        await db.task.get_one(
+            query_options=None,
+            with_rels=False,
+            id=task["id"],
+        )
+
+
+@pytest.mark.parametrize("only_ids", [False, True])
+async def test_create_tasks_bulk_pins_client_to_primary(
+    only_ids,
+    ac,
+    create_task_data,
+    pin_on_commit,
+):
+    response = await ac.post(
+        "/tasks/bulk",
+        json=[create_task_data],
+        params={"only_ids": only_ids},
+    )
+    assert response.status_code == status.HTTP_201_CREATED
+    assert PRIMARY_PIN_COOKIE in response.cookies
+
+
+@pytest.mark.parametrize("only_ids", [False, True])
+async def test_create_tasks_bulk_with_null_status(
+    only_ids,
+    ac,
+    db,
+    create_task_data,
+):
+    name = f"Not added {only_ids}"
+    response = await ac.post(
+        "/tasks/bulk",
+        json=[
+            {**create_task_data, "name": name},
+            {**create_task_data, "status": None},
+        ],
+        params={"only_ids": only_ids},
+    )
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+    assert await db.task.get_one_or_none(name=name) is None
+
+
+@pytest.mark.parametrize(
+    "create_data",
+    [
+        [],
+        [{"name": "1" * 101, "description": "", "status": TaskStatus.CREATED}],
+        [{"name": "name", "description": "", "status": "norm"}],
+    ],
+)
+async def test_create_tasks_bulk_with_invalid_data(
+    create_data,
+    ac,
+):
+    response = await ac.post(
+        "/tasks/bulk",
+        json=create_data,
+    )
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+async def test_create_tasks_bulk_over_limit(
+    ac,
+    create_task_data,
+):
+    response = await ac.post(
+        "/tasks/bulk",
+        json=[create_task_data] * (settings.bulk.max_entities + 1),
+    )
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
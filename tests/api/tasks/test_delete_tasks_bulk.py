@@ -0,0 +1,98 @@
+import uuid
+from datetime import timedelta
+
+import pytest
+from fastapi import status
+
+from src.config import TaskStatus
+from src.exceptions.repository.base import ObjectNotFoundRepoException
+from src.schemas.task import TaskCreateSchema
+from src.schemas.task import TaskSchema
+
+
+@pytest.fixture
+async def tasks_to_delete(db) -> list[TaskSchema]:
+    created_tasks = await db.task.add_bulk(
+        [
+            TaskCreateSchema(
+                name=f"Task to delete {number}",
+                description="",
+                status=TaskStatus.COMPLETED,
+            )
+            for number in range(3)
+        ]
+    )
+    await db.commit()
+    return created_tasks
+
+
+async def test_delete_tasks_bulk_by_ids(
+    ac,
+    tasks_to_delete,
+    db,
+):
+    task_ids = [str(task.id) for task in tasks_to_delete]
+    missing_id = str(uuid.uuid4())
+    response = await ac.request(
+        "DELETE",
+        "/tasks/bulk",
+        json={"ids": [*task_ids, missing_id]},
+    )
+    assert response.status_code == status.HTTP_200_OK
+    response_data = response.json()
+    assert sorted(response_data["matched"]) == sorted(task_ids)
+    assert response_data["missing"] == [missing_id]
+    for task_id in task_ids:
+        with pytest.raises(ObjectNotFoundRepoException):
+            await db.task.get_one(
+                query_options=None,
+                with_rels=False,
+                id=task_id,
+            )
+
+
+async def test_delete_tasks_bulk_by_filters(
+    ac,
+    tasks_to_delete,
+):
+    created_at = tasks_to_delete[0].created_at
+    response = await ac.request(
+        "DELETE",
+        "/tasks/bulk",
+        json={
+            "filters": {
+                "status": [TaskStatus.COMPLETED],
+                "created_at_from": created_at.isoformat(),
+                "created_at_to": (
+                    created_at + timedelta(microseconds=1)
+                ).isoformat(),
+            },
+        },
+    )
+    assert response.status_code == status.HTTP_200_OK
+    response_data = response.json()
+    assert sorted(response_data["matched"]) == sorted(
+        str(task.id) for task in tasks_to_delete
+    )
+    assert response_data["missing"] == []
+
+
+@pytest.mark.parametrize(
+    "delete_data",
+    [
+        {},
+        {"ids": []},
+        {"filters": {"status": None}},
+        {"ids": [str(uuid.uuid4())], "filters": {"status": ["created"]}},
+    ],
+)
+async def test_delete_tasks_bulk_with_invalid_data(
+    delete_data,
+    ac,
+):
+    response = await ac.request(
+        "DELETE",
+        "/tasks/bulk",
+        json=delete_data,
+    )
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
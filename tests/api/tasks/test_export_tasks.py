@@ -0,0 +1,23 @@
+import json
+
+from fastapi import status
+
+from src.config import settings
+
+
+async def test_export_tasks(
+    ac,
+    populate_db,
+    db,
+):
+    expected_tasks = await db.task.get_all(
+        limit=settings.pagination.max_entities_per_page,
+    )
+
+    response = await ac.get("/tasks/export")
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"] == "application/x-ndjson"
+    exported_tasks = [json.loads(line) for line in response.text.splitlines()]
+    assert [task["id"] for task in exported_tasks] == [
+        str(task.id) for task in expected_tasks
+    ]
@@ -1,7 +1,10 @@
 import pytest
 from fastapi import status
 
+from src.config import TaskStatus
 from src.config import settings
+from src.services import TaskService
+from src.utils.cache import TTLCache
 
 
 async def test_get_tasks(
@@ -13,6 +16,16 @@ async def test_get_tasks(
     assert response.json()
 
 
+async def test_get_tasks_query_count(
+    ac,
+    populate_db,
+    assert_max_queries,
+):
+    with assert_max_queries(2):
+        response = await ac.get("/tasks")
+    assert response.status_code == status.HTTP_200_OK
+
+
 @pytest.mark.parametrize(
     "page, per_page",
     [
@@ -34,3 +47,294 @@ async def test_get_tasks_with_invalid_pagination_params(
         },
     )
     assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+async def test_get_tasks_by_cursor(
+    ac,
+    populate_db,
+    db,
+):
+    expected_tasks = await db.task.get_all(
+        limit=settings.pagination.max_entities_per_page,
+    )
+    received_ids = []
+    params = {"per_page": 1}
+    while True:
+        response = await ac.get(
+            "/tasks",
+            params=params,
+        )
+        assert response.status_code == status.HTTP_200_OK
+        received_ids.extend(task["id"] for task in response.json())
+        next_cursor = response.headers.get("X-Next-Cursor")
+        if next_cursor is None:
+            break
+        params["cursor"] = next_cursor
+
+    assert received_ids == [str(task.id) for task in expected_tasks]
+
+
+async def test_get_tasks_with_invalid_cursor(
+    ac,
+    populate_db,
+):
+    response = await ac.get(
+        "/tasks",
+        params={"cursor": "invalid"},
+    )
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.parametrize(
+    "sorting",
+    [
+        {"sort_by": "updated_at"},
+        {"order": "desc"},
+    ],
+)
+async def test_get_tasks_with_cursor_of_other_sorting(
+    sorting,
+    ac,
+    populate_db,
+):
+    response = await ac.get(
+        "/tasks",
+        params={"per_page": 1},
+    )
+    cursor = response.headers["X-Next-Cursor"]
+    for envelope in (False, True):
+        response = await ac.get(
+            "/tasks",
+            params={
+                "per_page": 1,
+                "cursor": cursor,
+                "envelope": envelope,
+                **sorting,
+            },
+        )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+async def test_get_tasks_not_modified(
+    ac,
+    populate_db,
+):
+    params = {"per_page": settings.pagination.max_entities_per_page}
+    response = await ac.get(
+        "/tasks",
+        params=params,
+    )
+    etag = response.headers["ETag"]
+
+    response = await ac.get(
+        "/tasks",
+        params=params,
+        headers={"If-None-Match": etag},
+    )
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert response.headers["ETag"] == etag
+    assert not response.content
+
+    await ac.post(
+        "/tasks",
+        json={
+            "name": "New task",
+            "description": "",
+            "status": TaskStatus.CREATED,
+        },
+    )
+    response = await ac.get(
+        "/tasks",
+        params=params,
+        headers={"If-None-Match": etag},
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["ETag"] != etag
+
+
+async def test_get_tasks_filtered_by_status(
+    ac,
+    populate_db,
+):
+    response = await ac.get(
+        "/tasks",
+        params={
+            "per_page": settings.pagination.max_entities_per_page,
+            "status": [TaskStatus.CREATED.value, TaskStatus.COMPLETED.value],
+        },
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert all(
+        task["status"] in (TaskStatus.CREATED, TaskStatus.COMPLETED)
+        for task in response.json()
+    )
+
+
+async def test_get_tasks_by_cursor_descending(
+    ac,
+    populate_db,
+    db,
+):
+    expected_tasks = await db.task.get_all(
+        limit=settings.pagination.max_entities_per_page,
+    )
+    received_ids = []
+    params = {
+        "per_page": 1,
+        "sort_by": "updated_at",
+        "order": "desc",
+    }
+    while True:
+        response = await ac.get(
+            "/tasks",
+            params=params,
+        )
+        assert response.status_code == status.HTTP_200_OK
+        received_ids.extend(task["id"] for task in response.json())
+        next_cursor = response.headers.get("X-Next-Cursor")
+        if next_cursor is None:
+            break
+        params["cursor"] = next_cursor
+
+    expected_tasks.sort(
+        key=lambda task: (task.updated_at, task.id),
+        reverse=True,
+    )
+    assert received_ids == [str(task.id) for task in expected_tasks]
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        {"sort_by": "name"},
+        {"order": "random"},
+        {"status": "unknown"},
+    ],
+)
+async def test_get_tasks_with_invalid_filter_or_sorting(
+    params,
+    ac,
+    populate_db,
+):
+    response = await ac.get(
+        "/tasks",
+        params=params,
+    )
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+@pytest.fixture
+def count_cache(monkeypatch):
+    cache = TTLCache(max_size=10, ttl=60)
+    monkeypatch.setattr(TaskService, "count_cache", cache)
+    return cache
+
+
+async def test_get_tasks_page(
+    ac,
+    populate_db,
+    db,
+    count_cache,
+):
+    total = await db.task.count()
+    params = {
+        "envelope": True,
+        "total": "exact",
+        "per_page": 1,
+    }
+    response = await ac.get(
+        "/tasks",
+        params=params,
+    )
+    assert response.status_code == status.HTTP_200_OK
+    page = response.json()
+    assert len(page["items"]) == 1
+    assert page["total"] == total
+    assert page["has_next"] is (total > 1)
+    assert page["next_page"] == (2 if total > 1 else None)
+
+    # The last page has no next page.
+    params["page"] = total
+    response = await ac.get(
+        "/tasks",
+        params=params,
+    )
+    page = response.json()
+    assert len(page["items"]) == 1
+    assert page["has_next"] is False
+    assert page["next_page"] is None
+    assert page["next_cursor"] is None
+
+
+async def test_get_tasks_page_exact_total_is_cached(
+    ac,
+    populate_db,
+    db,
+    count_cache,
+):
+    params = {
+        "envelope": True,
+        "total": "exact",
+    }
+    response = await ac.get(
+        "/tasks",
+        params=params,
+    )
+    total = response.json()["total"]
+
+    await ac.post(
+        "/tasks",
+        json={
+            "name": "New task",
+            "description": "",
+            "status": TaskStatus.CREATED,
+        },
+    )
+    response = await ac.get(
+        "/tasks",
+        params=params,
+    )
+    assert response.json()["total"] == total
+
+    count_cache.clear()
+    response = await ac.get(
+        "/tasks",
+        params=params,
+    )
+    assert response.json()["total"] == total + 1
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        {},
+        {"status": TaskStatus.CREATED.value},
+    ],
+)
+async def test_get_tasks_page_estimated_total(
+    params,
+    ac,
+    populate_db,
+):
+    response = await ac.get(
+        "/tasks",
+        params={
+            "envelope": True,
+            "total": "estimated",
+            **params,
+        },
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["total"] >= 0
+
+
+async def test_get_tasks_page_without_total(
+    ac,
+    populate_db,
+):
+    response = await ac.get(
+        "/tasks",
+        params={"envelope": True},
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["total"] is None
@@ -1,8 +1,11 @@
 import uuid
 
+import pytest
 from fastapi import status
 
 from src.schemas.task import TaskSchema
+from src.services import TaskService
+from src.utils.cache import TTLCache
 
 
 async def test_get_one_task(
@@ -23,6 +26,88 @@ async def test_get_one_task(
     assert response_data["updated_at"]
 
 
+async def test_get_one_task_query_count(
+    ac,
+    populate_db,
+    db,
+    assert_max_queries,
+):
+    task = (await db.task.get_all(limit=1))[0]
+    with assert_max_queries(1):
+        response = await ac.get(f"/tasks/{task.id}")
+    assert response.status_code == status.HTTP_200_OK
+
+
 async def test_get_non_existent_task(ac):
     response = await ac.get(f"/tasks/{uuid.uuid4()}")
     assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.fixture
+def task_cache(monkeypatch):
+    cache = TTLCache(max_size=10, ttl=60)
+    monkeypatch.setattr(TaskService, "cache", cache)
+    return cache
+
+
+async def test_get_one_task_from_cache(
+    ac,
+    populate_db,
+    db,
+    task_cache,
+):
+    task = await db.task.get_all(limit=1, offset=1)
+    task: TaskSchema = task[0]
+    for _ in range(2):
+        response = await ac.get(f"/tasks/{task.id}")
+        assert response.status_code == status.HTTP_200_OK
+    assert task_cache.stats().hits == 1
+
+    response = await ac.patch(
+        f"/tasks/{task.id}",
+        json={"name": "Cached task"},
+    )
+    assert response.status_code == status.HTTP_200_OK
+    response = await ac.get(f"/tasks/{task.id}")
+    assert response.json()["name"] == "Cached task"
+
+
+async def test_get_non_existent_task_from_cache(
+    ac,
+    task_cache,
+):
+    task_id = uuid.uuid4()
+    for _ in range(2):
+        response = await ac.get(f"/tasks/{task_id}")
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+    assert task_cache.stats().hits == 1
+
+
+async def test_get_one_task_not_modified(
+    ac,
+    populate_db,
+    db,
+):
+    task = await db.task.get_all(limit=1, offset=1)
+    task: TaskSchema = task[0]
+    response = await ac.get(f"/tasks/{task.id}")
+    etag = response.headers["ETag"]
+
+    response = await ac.get(
+        f"/tasks/{task.id}",
+        headers={"If-None-Match": etag},
+    )
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert response.headers["ETag"] == etag
+    assert not response.content
+
+    await ac.patch(
+        f"/tasks/{task.id}",
+        json={"description": "Modified description"},
+    )
+    response = await ac.get(
+        f"/tasks/{task.id}",
+        headers={"If-None-Match": etag},
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["ETag"] != etag
@@ -0,0 +1,62 @@
+from fastapi import status
+
+from src.config import TaskStatus
+from src.schemas.task import TaskFilterSchema
+
+
+async def get_expected_stats(db) -> dict:
+    by_status = {
+        task_status: await db.task.count(
+            TaskFilterSchema(status=[task_status]),
+        )
+        for task_status in TaskStatus
+    }
+    return {
+        "total": sum(by_status.values()),
+        "by_status": by_status,
+    }
+
+
+async def test_get_task_stats(
+    ac,
+    populate_db,
+    db,
+):
+    response = await ac.get("/tasks/stats")
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == await get_expected_stats(db)
+
+
+async def test_task_stats_follow_writes(
+    ac,
+    populate_db,
+    db,
+):
+    response = await ac.post(
+        "/tasks/bulk",
+        json=[
+            {
+                "name": f"Stats task {number}",
+                "description": "",
+                "status": TaskStatus.CREATED,
+            }
+            for number in range(3)
+        ],
+    )
+    task_ids = [task["id"] for task in response.json()]
+    await ac.patch(
+        f"/tasks/{task_ids[0]}",
+        json={"status": TaskStatus.IN_PROGRESS},
+    )
+    await ac.patch(
+        "/tasks/bulk",
+        json={
+            "ids": task_ids[1:],
+            "data": {"status": TaskStatus.COMPLETED},
+        },
+    )
+    await ac.delete(f"/tasks/{task_ids[1]}")
+
+    response = await ac.get("/tasks/stats")
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == await get_expected_stats(db)
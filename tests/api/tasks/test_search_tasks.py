@@ -0,0 +1,80 @@
+import pytest
+from fastapi import status
+
+from src.config import TaskStatus
+
+
+async def test_search_tasks(
+    ac,
+):
+    response = await ac.post(
+        "/tasks",
+        json={
+            "name": "Refuel the spaceship",
+            "description": "Check the oxygen tanks before the launch",
+            "status": TaskStatus.CREATED,
+        },
+    )
+    task_id = response.json()["id"]
+    await ac.post(
+        "/tasks",
+        json={
+            "name": "Inspect the tanks",
+            "description": "Launch checklist for the spaceship",
+            "status": TaskStatus.CREATED,
+        },
+    )
+
+    response = await ac.get(
+        "/tasks/search",
+        params={"q": "spaceships"},
+    )
+    assert response.status_code == status.HTTP_200_OK
+    found_tasks = response.json()
+    assert len(found_tasks) == 2
+    # A name match ranks higher than a description match.
+    assert found_tasks[0]["id"] == task_id
+    assert found_tasks[0]["rank"] > found_tasks[1]["rank"]
+    assert "<b>spaceship</b>" in found_tasks[0]["snippet"]
+
+    response = await ac.get(
+        "/tasks/search",
+        params={
+            "q": "spaceship -oxygen",
+            "per_page": 1,
+        },
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert [task["name"] for task in response.json()] == [
+        "Inspect the tanks",
+    ]
+
+
+async def test_search_tasks_not_found(
+    ac,
+):
+    response = await ac.get(
+        "/tasks/search",
+        params={"q": "nonexistentword"},
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == []
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        {},
+        {"q": ""},
+        {"q": "task", "page": 0},
+    ],
+)
+async def test_search_tasks_with_invalid_params(
+    params,
+    ac,
+):
+    response = await ac.get(
+        "/tasks/search",
+        params=params,
+    )
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
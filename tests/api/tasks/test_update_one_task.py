@@ -3,6 +3,7 @@ import uuid
 import pytest
 from fastapi import status
 
+from src.api.dependencies.db import PRIMARY_PIN_COOKIE
 from src.config import TaskStatus
 from src.schemas.task import TaskSchema
 
@@ -98,3 +99,150 @@ async def test_update_task_with_invalid_task_id(ac):
         json=update_data,
     )
     assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+async def test_update_task_with_if_match(
+    ac,
+    populate_db,
+    db,
+    assert_max_queries,
+):
+    task: TaskSchema = (await db.task.get_all(limit=1))[0]
+    etag = (await ac.get(f"/tasks/{task.id}")).headers["ETag"]
+
+    with assert_max_queries(1):
+        response = await ac.patch(
+            f"/tasks/{task.id}",
+            json={"name": "Updated with If-Match"},
+            headers={"If-Match": etag},
+        )
+    assert response.status_code == status.HTTP_200_OK
+    updated_task = await db.task.get_one_or_none(id=task.id)
+    assert updated_task.version == task.version + 1
+    new_etag = (await ac.get(f"/tasks/{task.id}")).headers["ETag"]
+    assert new_etag != etag
+
+
+async def test_update_task_with_stale_if_match(
+    ac,
+    populate_db,
+    db,
+    assert_max_queries,
+):
+    task: TaskSchema = (await db.task.get_all(limit=1))[0]
+    etag = (await ac.get(f"/tasks/{task.id}")).headers["ETag"]
+    await ac.patch(f"/tasks/{task.id}", json={"name": "Concurrent edit"})
+
+    with assert_max_queries(1):
+        response = await ac.patch(
+            f"/tasks/{task.id}",
+            json={"name": "Stale edit"},
+            headers={"If-Match": etag},
+        )
+    assert response.status_code == status.HTTP_409_CONFLICT
+    unchanged_task = await db.task.get_one_or_none(id=task.id)
+    assert unchanged_task.name == "Concurrent edit"
+
+
+@pytest.mark.parametrize(
+    "if_match",
+    ['"not-an-etag"', f'"{uuid.uuid4().hex}-1"', 'W/"tag"'],
+)
+async def test_update_task_with_foreign_if_match(
+    if_match,
+    ac,
+    populate_db,
+    db,
+):
+    task: TaskSchema = (await db.task.get_all(limit=1))[0]
+    response = await ac.patch(
+        f"/tasks/{task.id}",
+        json={"name": "Foreign edit"},
+        headers={"If-Match": if_match},
+    )
+    assert response.status_code == status.HTTP_409_CONFLICT
+
+
+@pytest.mark.parametrize("version", ["0", "2147483648", "1" * 30, "²"])
+async def test_update_task_with_invalid_if_match_version(
+    version,
+    ac,
+    populate_db,
+    db,
+):
+    task: TaskSchema = (await db.task.get_all(limit=1))[0]
+    response = await ac.patch(
+        f"/tasks/{task.id}",
+        json={"name": "Invalid version"},
+        headers={"If-Match": f'"{task.id.hex}-{version}"'.encode("latin-1")},
+    )
+    assert response.status_code == status.HTTP_409_CONFLICT
+
+
+async def test_update_non_existent_task_with_if_match(ac):
+    task_id = uuid.uuid4()
+    response = await ac.patch(
+        f"/tasks/{task_id}",
+        json={"name": "Missing"},
+        headers={"If-Match": f'"{task_id.hex}-1"'},
+    )
+    assert response.status_code == status.HTTP_409_CONFLICT
+
+
+async def test_update_task_with_return_representation(
+    ac,
+    populate_db,
+    db,
+    assert_max_queries,
+):
+    task: TaskSchema = (await db.task.get_all(limit=1))[0]
+
+    with assert_max_queries(1):
+        response = await ac.patch(
+            f"/tasks/{task.id}",
+            json={"name": "Returned name"},
+            headers={"Prefer": "return=representation"},
+        )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["Preference-Applied"] == "return=representation"
+    assert response.headers["Vary"] == "Prefer"
+    returned_task = TaskSchema.model_validate(response.json())
+    assert returned_task.name == "Returned name"
+    assert returned_task.description == task.description
+    assert returned_task.version == task.version + 1
+    assert returned_task == await db.task.get_one_or_none(id=task.id)
+    etag = (await ac.get(f"/tasks/{task.id}")).headers["ETag"]
+    assert response.headers["ETag"] == etag
+
+
+async def test_update_task_returns_id_by_default(
+    ac,
+    populate_db,
+    db,
+):
+    task: TaskSchema = (await db.task.get_all(limit=1))[0]
+    response = await ac.patch(
+        f"/tasks/{task.id}",
+        json={"name": "Only ID"},
+        headers={"Prefer": "return=minimal"},
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {"id": str(task.id)}
+    assert "Preference-Applied" not in response.headers
+    assert response.headers["Vary"] == "Prefer"
+
+
+async def test_update_task_with_return_representation_pins_client(
+    ac,
+    populate_db,
+    db,
+    pin_on_commit,
+):
+    task: TaskSchema = (await db.task.get_all(limit=1))[0]
+    response = await ac.patch(
+        f"/tasks/{task.id}",
+        json={"name": "Pinned"},
+        headers={"Prefer": "return=representation"},
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert PRIMARY_PIN_COOKIE in response.cookies
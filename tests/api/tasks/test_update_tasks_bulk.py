@@ -0,0 +1,115 @@
+import uuid
+from datetime import timedelta
+
+import pytest
+from fastapi import status
+
+from src.config import TaskStatus
+from src.schemas.task import TaskCreateSchema
+from src.schemas.task import TaskSchema
+
+
+@pytest.fixture
+async def tasks_to_update(db) -> list[TaskSchema]:
+    created_tasks = await db.task.add_bulk(
+        [
+            TaskCreateSchema(
+                name=f"Task to update {number}",
+                description="",
+                status=TaskStatus.CREATED,
+            )
+            for number in range(3)
+        ]
+    )
+    await db.commit()
+    return created_tasks
+
+
+async def test_update_tasks_bulk_by_ids(
+    ac,
+    tasks_to_update,
+    db,
+):
+    task_ids = [str(task.id) for task in tasks_to_update]
+    missing_id = str(uuid.uuid4())
+    response = await ac.patch(
+        "/tasks/bulk",
+        json={
+            "ids": [*task_ids, missing_id],
+            "data": {"status": TaskStatus.COMPLETED},
+        },
+    )
+    assert response.status_code == status.HTTP_200_OK
+    response_data = response.json()
+    assert sorted(response_data["matched"]) == sorted(task_ids)
+    assert response_data["missing"] == [missing_id]
+    for task_id in task_ids:
+        updated_task: TaskSchema = await db.task.get_one(
+            query_options=None,
+            with_rels=False,
+            id=task_id,
+        )
+        assert updated_task.status == TaskStatus.COMPLETED
+
+
+@pytest.mark.parametrize("field", ["name", "description", "status"])
+async def test_update_tasks_bulk_with_null(
+    field,
+    ac,
+    tasks_to_update,
+):
+    response = await ac.patch(
+        "/tasks/bulk",
+        json={
+            "ids": [str(tasks_to_update[0].id)],
+            "data": {field: None},
+        },
+    )
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+async def test_update_tasks_bulk_by_filters(
+    ac,
+    tasks_to_update,
+):
+    created_at = tasks_to_update[0].created_at
+    response = await ac.patch(
+        "/tasks/bulk",
+        json={
+            "filters": {
+                "status": [TaskStatus.CREATED],
+                "created_at_from": created_at.isoformat(),
+                "created_at_to": (
+                    created_at + timedelta(microseconds=1)
+                ).isoformat(),
+            },
+            "data": {"name": "Updated by filter"},
+        },
+    )
+    assert response.status_code == status.HTTP_200_OK
+    response_data = response.json()
+    assert sorted(response_data["matched"]) == sorted(
+        str(task.id) for task in tasks_to_update
+    )
+    assert response_data["missing"] == []
+
+
+@pytest.mark.parametrize(
+    "update_data",
+    [
+        {"data": {"name": "name"}},
+        {"ids": [], "data": {"name": "name"}},
+        {"filters": {}, "data": {"name": "name"}},
+        {"ids": [str(uuid.uuid4())], "filters": {"status": ["created"]}},
+        {"ids": [str(uuid.uuid4())], "data": {"name": "1" * 101}},
+    ],
+)
+async def test_update_tasks_bulk_with_invalid_data(
+    update_data,
+    ac,
+):
+    response = await ac.patch(
+        "/tasks/bulk",
+        json=update_data,
+    )
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
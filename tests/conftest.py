@@ -1,26 +1,53 @@
+from contextlib import contextmanager
+from functools import partial
+
 import pytest
+from fastapi import Response
 from httpx import ASGITransport
 from httpx import AsyncClient
 
 from src.api.dependencies.db import get_db_transaction
+from src.api.dependencies.db import get_session_factory
+from src.api.dependencies.db import pin_to_primary
 from src.config import TaskStatus
 from src.config import settings
 from src.db import Base
-from src.db.database import async_engine_null_pull
-from src.db.database import async_session_null_pool
+from src.db.database import database
+from src.db.instrumentation import count_queries
 from src.main import app
+from src.repositories.memory import memory_store
 from src.schemas.task import TaskCreateSchema
+from src.utils.transaction import InMemoryTransactionManager
 from src.utils.transaction import TransactionManager
 
 
+IN_MEMORY = settings.app.db_backend == "memory"
+
+
 async def get_test_db():
-    async with TransactionManager(
-        session_factory=async_session_null_pool,
-    ) as transaction:
+    if IN_MEMORY:
+        transaction = InMemoryTransactionManager(store=memory_store)
+    else:
+        transaction = TransactionManager(
+            session_factory=database.null_pool_session_factory,
+        )
+    async with transaction:
         yield transaction
 
 
 app.dependency_overrides[get_db_transaction] = get_test_db
+app.dependency_overrides[get_session_factory] = (
+    lambda: database.null_pool_session_factory
+)
+
+
+def pytest_collection_modifyitems(config, items):
+    if not IN_MEMORY:
+        return
+    skip_postgres = pytest.mark.skip(reason="requires the postgres backend")
+    for item in items:
+        if "postgres" in item.keywords:
+            item.add_marker(skip_postgres)
 
 
 @pytest.fixture(scope="session", autouse=True)
@@ -30,18 +57,23 @@ def check_test_mode():
 
 @pytest.fixture(scope="session", autouse=True)
 async def prepare_db(check_test_mode):
-    async with async_engine_null_pull.begin() as conn:
+    if IN_MEMORY:
+        memory_store.clear()
+        return
+    async with database.null_pool_engine.begin() as conn:
         await conn.run_sync(Base.metadata.drop_all)
         await conn.run_sync(Base.metadata.create_all)
 
 
 @pytest.fixture(scope="session")
 async def ac():
-    async with AsyncClient(
-        transport=ASGITransport(app=app),
-        base_url="http://test",
-    ) as ac:
-        yield ac
+    # The transport does not run the lifespan of the app
+    async with app.router.lifespan_context(app):
+        async with AsyncClient(
+            transport=ASGITransport(app=app),
+            base_url="http://test",
+        ) as ac:
+            yield ac
 
 
 @pytest.fixture
@@ -69,9 +101,7 @@ async def populate_db():
             status=TaskStatus.COMPLETED,
         ),
     ]
-    async with TransactionManager(
-        session_factory=async_session_null_pool,
-    ) as transaction:
+    async for transaction in get_test_db():
         await transaction.task.add_bulk(tasks_to_add)
         await transaction.commit()
 
@@ -83,3 +113,41 @@ def create_task_data():
         description="Example task description",
         status=TaskStatus.IN_PROGRESS,
     ).model_dump()
+
+
+@pytest.fixture
+def assert_max_queries():
+    """
+    Fail if the enclosed block executes more SQL statements
+    than the limit, e.g. ``with assert_max_queries(2): ...``.
+    """
+
+    @contextmanager
+    def assert_max_queries(limit: int):
+        with count_queries() as stats:
+            yield stats
+        assert stats.count <= limit, (
+            f"Expected at most {limit} queries, executed {stats.count}:\n"
+            + "\n".join(stats.statements)
+        )
+
+    return assert_max_queries
+
+
+@pytest.fixture
+async def pin_on_commit(ac, monkeypatch):
+    """
+    Pin the client to the primary after each commit,
+    as ``get_db_transaction`` does when there are replicas.
+    """
+
+    async def get_pinning_db(response: Response):
+        async for transaction in get_test_db():
+            transaction.on_commit = partial(pin_to_primary, response)
+            yield transaction
+
+    monkeypatch.setattr(settings.db, "read_your_writes_seconds", 5)
+    app.dependency_overrides[get_db_transaction] = get_pinning_db
+    yield
+    app.dependency_overrides[get_db_transaction] = get_test_db
+    ac.cookies.clear()
@@ -0,0 +1,35 @@
+import subprocess
+import sys
+
+from src.db import Base
+from src.db.database import Database
+from src.db.database import get_table_name
+
+
+def test_table_names_follow_convention():
+    for mapper in Base.registry.mappers:
+        model = mapper.class_
+        assert model.__tablename__ == get_table_name(model.__name__)
+
+
+def test_app_import_does_not_load_heavy_modules():
+    code = (
+        "import sys, src.main; "
+        "print(' '.join(sorted({'inflect'} & sys.modules.keys())))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.strip() == ""
+
+
+async def test_engines_are_created_on_demand():
+    database = Database()
+    session_factory = database.null_pool_session_factory
+    assert session_factory.kw["bind"] is database.null_pool_engine
+    assert database._engine is None
+    await database.dispose()
+    assert database._null_pool_engine is None
@@ -0,0 +1,72 @@
+import logging
+
+import pytest
+
+from src.config import settings
+from src.db.instrumentation import count_queries
+from src.schemas.task import TaskUpdateSchema
+
+
+pytestmark = pytest.mark.postgres
+
+
+@pytest.fixture
+def log_all_queries(monkeypatch):
+    monkeypatch.setattr(settings.db, "slow_query_ms", 0)
+    monkeypatch.setattr(settings.db, "explain_slow_queries", True)
+
+
+async def test_count_queries(populate_db, db):
+    with count_queries() as outer_stats:
+        await db.task.count()
+        with count_queries() as inner_stats:
+            await db.task.get_all(1)
+    assert inner_stats.count == 1
+    assert outer_stats.count == 2
+    assert outer_stats.duration > 0
+
+
+async def test_slow_select_is_logged_with_plan(
+    populate_db,
+    db,
+    log_all_queries,
+    caplog,
+):
+    with caplog.at_level(logging.WARNING, "src.db.instrumentation"):
+        tasks = await db.task.get_all(2)
+    assert len(tasks) == 2
+    assert "Slow query" in caplog.text
+    assert "Plan of the slow query" in caplog.text
+    assert "Buffers" in caplog.text or "actual time" in caplog.text
+
+
+async def test_slow_write_is_logged_without_plan(
+    populate_db,
+    db,
+    log_all_queries,
+    caplog,
+):
+    task = (await db.task.get_all(1))[0]
+    caplog.clear()
+    with caplog.at_level(logging.WARNING, "src.db.instrumentation"):
+        await db.task.update_one(
+            TaskUpdateSchema(name=task.name),
+            partially=True,
+            id=task.id,
+        )
+    assert "Slow query" in caplog.text
+    assert "Plan of the slow query" not in caplog.text
+
+
+async def test_slow_query_is_not_explained_in_prod(
+    populate_db,
+    db,
+    log_all_queries,
+    monkeypatch,
+    caplog,
+):
+    monkeypatch.setattr(settings.app, "mode", "PROD")
+    with caplog.at_level(logging.WARNING, "src.db.instrumentation"):
+        await db.task.get_all(1)
+    assert "Slow query" in caplog.text
+    assert "Plan of the slow query" not in caplog.text
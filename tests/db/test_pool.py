@@ -0,0 +1,60 @@
+import pytest
+from sqlalchemy.exc import TimeoutError
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from src.config import settings
+from src.db.pool import InstrumentedAsyncQueuePool
+from src.db.pool import get_pool_stats
+from src.db.pool import instrument_pool
+from src.db.pool import instrumented_engines
+from src.db.pool import warm_up_pool
+from src.utils.warmup import prepare_statements
+
+
+pytestmark = pytest.mark.postgres
+
+
+@pytest.fixture
+async def engine():
+    engine = create_async_engine(
+        url=settings.db.url,  # type: ignore
+        poolclass=InstrumentedAsyncQueuePool,
+        pool_size=1,
+        max_overflow=1,
+        pool_timeout=0.01,
+    )
+    instrument_pool(engine, "test")
+    yield engine
+    instrumented_engines.pop("test", None)
+    await engine.dispose()
+
+
+async def test_pool_stats(engine):
+    async with engine.connect(), engine.connect():
+        with pytest.raises(TimeoutError):
+            async with engine.connect():
+                pass
+        stats = get_pool_stats()["test"]
+        assert stats.checked_out == 2
+        assert stats.overflow == 1
+
+    stats = get_pool_stats()["test"]
+    assert stats.checked_out == 0
+    assert stats.checked_in == 1
+    assert stats.connections_opened == 2
+    assert stats.overflow_opened == 1
+    assert stats.timeouts == 1
+    assert stats.checkout_wait_seconds.count == 3
+    assert stats.checkout_wait_seconds.buckets["+Inf"] == 3
+
+
+async def test_warm_up_pool(engine, db):
+    tasks_count = await db.task.count()
+
+    opened = await warm_up_pool(engine, 3, prepare_statements)
+
+    assert opened == 1
+    stats = get_pool_stats()["test"]
+    assert stats.checked_in == 1
+    assert stats.connections_opened == 1
+    assert await db.task.count() == tasks_count
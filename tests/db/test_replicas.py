@@ -0,0 +1,40 @@
+import pytest
+from sqlalchemy import NullPool
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from src.config import settings
+from src.db.replicas import ReplicaSet
+
+
+def create_replica_engine(**kwargs):
+    return create_async_engine(
+        url=settings.db.url,  # type: ignore
+        **kwargs,
+    )
+
+
+def test_choose_without_replicas():
+    assert ReplicaSet(engines=[]).choose() is None
+
+
+def test_choose_round_robin():
+    engines = [
+        create_replica_engine(poolclass=NullPool),
+        create_replica_engine(poolclass=NullPool),
+    ]
+    replica_set = ReplicaSet(engines=engines)
+    chosen_engines = [replica_set.choose().kw["bind"] for _ in range(4)]
+    assert chosen_engines == engines * 2
+
+
+@pytest.mark.postgres
+async def test_choose_least_connections():
+    engines = [create_replica_engine(), create_replica_engine()]
+    replica_set = ReplicaSet(
+        engines=engines,
+        strategy="least_connections",
+    )
+    async with engines[0].connect():
+        assert replica_set.choose().kw["bind"] is engines[1]
+    for engine in engines:
+        await engine.dispose()
@@ -0,0 +1,78 @@
+import asyncio
+
+import pytest
+
+from src.utils.batching import WriteBatcher
+
+
+class Recorder:
+    def __init__(self):
+        self.batches = []
+
+    async def flush(self, items):
+        self.batches.append(items)
+        return [ValueError(item) if item < 0 else item * 2 for item in items]
+
+
+async def test_items_within_window_are_flushed_together():
+    recorder = Recorder()
+    batcher = WriteBatcher(recorder.flush, window=0.01, max_size=10)
+    results = await asyncio.gather(
+        *(batcher.submit(item) for item in range(3))
+    )
+    assert results == [0, 2, 4]
+    assert recorder.batches == [[0, 1, 2]]
+
+
+async def test_full_batch_is_flushed_without_waiting():
+    recorder = Recorder()
+    batcher = WriteBatcher(recorder.flush, window=60, max_size=2)
+    results = await asyncio.wait_for(
+        asyncio.gather(*(batcher.submit(item) for item in range(4))),
+        timeout=1,
+    )
+    assert results == [0, 2, 4, 6]
+    assert recorder.batches == [[0, 1], [2, 3]]
+
+
+async def test_errors_are_isolated_per_item():
+    recorder = Recorder()
+    batcher = WriteBatcher(recorder.flush, window=0.01, max_size=10)
+    results = await asyncio.gather(
+        batcher.submit(1),
+        batcher.submit(-1),
+        batcher.submit(2),
+        return_exceptions=True,
+    )
+    assert results[0] == 2
+    assert isinstance(results[1], ValueError)
+    assert results[2] == 4
+
+
+async def test_flush_error_is_passed_to_all_items():
+    async def flush(items):
+        raise RuntimeError("Database is down")
+
+    batcher = WriteBatcher(flush, window=0.01, max_size=10)
+    results = await asyncio.gather(
+        batcher.submit(1),
+        batcher.submit(2),
+        return_exceptions=True,
+    )
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+
+async def test_callers_are_released_if_flush_is_cancelled():
+    started = asyncio.Event()
+
+    async def flush(items):
+        started.set()
+        await asyncio.sleep(60)
+
+    batcher = WriteBatcher(flush, window=0.01, max_size=10)
+    submitted = asyncio.create_task(batcher.submit(1))
+    await started.wait()
+    for flush_task in batcher._flushes:
+        flush_task.cancel()
+    with pytest.raises(RuntimeError):
+        await asyncio.wait_for(submitted, timeout=1)
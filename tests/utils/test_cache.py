@@ -0,0 +1,69 @@
+from src.utils.cache import StatementCache
+from src.utils.cache import TTLCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_cache_get_and_set():
+    cache = TTLCache(max_size=2, ttl=10)
+    assert cache.get("key") is None
+    cache.set("key", "value")
+    assert cache.get("key") == "value"
+    stats = cache.stats()
+    assert stats.hits == 1
+    assert stats.misses == 1
+    assert stats.size == 1
+
+
+def test_cache_evicts_least_recently_used():
+    cache = TTLCache(max_size=2, ttl=10)
+    cache.set("first", 1)
+    cache.set("second", 2)
+    cache.get("first")
+    cache.set("third", 3)
+    assert cache.get("second") is None
+    assert cache.get("first") == 1
+    assert cache.get("third") == 3
+    assert cache.stats().evictions == 1
+
+
+def test_cache_expires_entries():
+    clock = FakeClock()
+    cache = TTLCache(max_size=2, ttl=10, clock=clock)
+    cache.set("key", "value")
+    cache.set("short", "value", ttl=1)
+    clock.now = 5
+    assert cache.get("short") is None
+    assert cache.get("key") == "value"
+    clock.now = 10
+    assert cache.get("key") is None
+    assert cache.stats().size == 0
+
+
+def test_cache_invalidate():
+    cache = TTLCache(max_size=2, ttl=10)
+    cache.set("key", "value")
+    cache.invalidate("key", "absent")
+    assert cache.get("key") is None
+
+
+def test_statement_cache_builds_once():
+    cache = StatementCache()
+    builds = []
+
+    def build():
+        builds.append(1)
+        return object()
+
+    statement = cache.get_or_build("key", build)
+    assert cache.get_or_build("key", build) is statement
+    assert len(builds) == 1
+    stats = cache.stats()
+    assert (stats.size, stats.hits, stats.misses) == (1, 1, 1)
+    assert stats.hit_rate == 0.5
@@ -0,0 +1,117 @@
+from datetime import datetime
+from datetime import timezone
+
+import pytest
+
+from src.config import TaskStatus
+from src.repositories.memory import InMemoryTaskStore
+from src.schemas.pagination import CursorSchema
+from src.schemas.sorting import SortingSchema
+from src.schemas.task import TaskCreateSchema
+from src.schemas.task import TaskFilterSchema
+from src.schemas.task import TaskUpdateSchema
+from src.utils.transaction import InMemoryTransactionManager
+
+
+def build_task(
+    name: str,
+    status: TaskStatus = TaskStatus.CREATED,
+) -> TaskCreateSchema:
+    return TaskCreateSchema(
+        name=name,
+        description=f"{name} description",
+        status=status,
+    )
+
+
+@pytest.fixture
+def store():
+    return InMemoryTaskStore()
+
+
+async def test_committed_changes_are_kept(store):
+    async with InMemoryTransactionManager(store=store) as transaction:
+        task = await transaction.task.add(build_task("Committed task"))
+        await transaction.commit()
+    async with InMemoryTransactionManager(store=store) as transaction:
+        assert await transaction.task.get_one_or_none(id=task.id) == task
+
+
+async def test_uncommitted_changes_are_rolled_back(store):
+    async with InMemoryTransactionManager(store=store) as transaction:
+        task = await transaction.task.add(build_task("Task"))
+        await transaction.commit()
+    async with InMemoryTransactionManager(store=store) as transaction:
+        await transaction.task.update_one(
+            TaskUpdateSchema(name="Renamed", status=TaskStatus.COMPLETED),
+            partially=True,
+            id=task.id,
+        )
+        await transaction.task.add(build_task("Uncommitted task"))
+        await transaction.task.delete_one(id=task.id)
+    assert list(store.rows) == [task.id]
+    assert store.by_status[TaskStatus.CREATED] == {task.id}
+    assert not store.by_status[TaskStatus.COMPLETED]
+    assert store.by_created_at == [(task.created_at, task.id)]
+
+
+async def test_read_only_transaction_cannot_be_committed(store):
+    async with InMemoryTransactionManager(
+        store=store,
+        read_only=True,
+    ) as transaction:
+        with pytest.raises(RuntimeError):
+            await transaction.commit()
+
+
+async def test_filters_sorting_and_cursor(store):
+    async with InMemoryTransactionManager(store=store) as transaction:
+        tasks = [
+            await transaction.task.add(build_task(f"Task {number}", status))
+            for number, status in enumerate(
+                [
+                    TaskStatus.CREATED,
+                    TaskStatus.COMPLETED,
+                    TaskStatus.CREATED,
+                    TaskStatus.CREATED,
+                ]
+            )
+        ]
+        tasks.sort(key=lambda task: (task.created_at, task.id))
+        created = [task for task in tasks if task.status == TaskStatus.CREATED]
+        filters = TaskFilterSchema(status=[TaskStatus.CREATED])
+        sorting = SortingSchema(field="created_at", descending=True)
+
+        assert await transaction.task.count(filters) == len(created)
+        all_tasks = await transaction.task.get_all(10, sorting=sorting)
+        assert all_tasks == tasks[::-1]
+        first_page = await transaction.task.get_all(
+            2,
+            filters=filters,
+            sorting=sorting,
+        )
+        assert first_page == created[:0:-1]
+        second_page = await transaction.task.get_all(
+            2,
+            cursor=CursorSchema.after(first_page[-1], sorting),
+            filters=filters,
+            sorting=sorting,
+        )
+        assert second_page == created[:1]
+
+
+async def test_uncommitted_archiving_is_rolled_back(store):
+    async with InMemoryTransactionManager(store=store) as transaction:
+        task = await transaction.task.add(
+            build_task("Completed task", TaskStatus.COMPLETED),
+        )
+        await transaction.commit()
+    async with InMemoryTransactionManager(store=store) as transaction:
+        archived = await transaction.archived_task.archive_completed(
+            datetime.now(timezone.utc),
+            limit=10,
+        )
+        assert archived == 1
+        assert await transaction.task.get_one_or_none(id=task.id) is None
+    assert list(store.rows) == [task.id]
+    assert not store.archive.rows
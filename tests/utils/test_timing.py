@@ -0,0 +1,24 @@
+import time
+
+from src.utils.timing import RequestTimings
+from src.utils.timing import phase
+from src.utils.timing import request_timings
+
+
+def test_nested_phase_is_excluded_from_enclosing_phase():
+    timings = RequestTimings()
+    token = request_timings.set(timings)
+    try:
+        with phase("db"):
+            with phase("map"):
+                time.sleep(0.02)
+    finally:
+        request_timings.reset(token)
+    assert timings.durations["map"] >= 0.02
+    assert timings.durations["db"] < 0.01
+
+
+def test_phase_without_request_is_not_recorded():
+    with phase("db"):
+        pass
+    assert request_timings.get() is None
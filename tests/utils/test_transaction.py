@@ -0,0 +1,81 @@
+import pytest
+from sqlalchemy import NullPool
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from src.config import TaskStatus
+from src.config import settings
+from src.db.database import database
+from src.exceptions.repository.base import ObjectNotFoundRepoException
+from src.schemas.task import TaskCreateSchema
+from src.utils.transaction import TransactionManager
+
+
+pytestmark = pytest.mark.postgres
+
+
+async def test_session_is_not_created_without_queries(prepare_db):
+    async with TransactionManager(
+        session_factory=database.null_pool_session_factory,
+    ) as transaction:
+        await transaction.commit()
+    assert transaction._session is None
+
+
+async def test_uncommitted_changes_are_rolled_back(prepare_db):
+    async with TransactionManager(
+        session_factory=database.null_pool_session_factory,
+    ) as transaction:
+        task = await transaction.task.add(
+            TaskCreateSchema(
+                name="Uncommitted task",
+                description="",
+                status=TaskStatus.CREATED,
+            )
+        )
+
+    async with TransactionManager(
+        session_factory=database.null_pool_session_factory,
+    ) as transaction:
+        with pytest.raises(ObjectNotFoundRepoException):
+            await transaction.task.get_one(id=task.id)
+
+
+@pytest.fixture
+async def replica_session_factory():
+    engine = create_async_engine(
+        url=settings.db.url,  # type: ignore
+        poolclass=NullPool,
+        execution_options={"postgresql_readonly": True},
+    )
+    yield async_sessionmaker(engine, expire_on_commit=False)
+    await engine.dispose()
+
+
+async def test_replica_is_read_only(
+    prepare_db,
+    replica_session_factory,
+):
+    async with TransactionManager(
+        session_factory=database.null_pool_session_factory,
+        replica_session_factory=replica_session_factory,
+    ) as transaction:
+        await transaction.replica.task.get_all(limit=1)
+        with pytest.raises(DBAPIError):
+            await transaction.replica.task.add(
+                TaskCreateSchema(
+                    name="Replica task",
+                    description="",
+                    status=TaskStatus.CREATED,
+                )
+            )
+        with pytest.raises(RuntimeError):
+            await transaction.replica.commit()
+
+
+async def test_replica_defaults_to_primary(prepare_db):
+    async with TransactionManager(
+        session_factory=database.null_pool_session_factory,
+    ) as transaction:
+        assert transaction.replica is transaction